@@ -0,0 +1,218 @@
+# Licensed under the MIT: https://mit-license.org/
+# For details: https://github.com/pylint-dev/pylint-ml/LICENSE
+# Copyright (c) https://github.com/pylint-dev/pylint-ml/CONTRIBUTORS.txt
+
+"""Time every pylint-ml checker and the full plugin on a synthetic corpus and store the results as JSON.
+
+Usage: python -m benchmarks.bench_checkers [--corpus DIR] [--files N] [--functions N] [--mix PROFILE=WEIGHT,...]
+                                           [--repeat N] [--output FILE]
+
+Compare two result files with ``python -m benchmarks.compare``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import inspect
+import json
+import pkgutil
+import platform
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+import astroid
+import pylint
+from astroid import MANAGER, nodes
+from pylint.lint import PyLinter
+from pylint.reporters import CollectingReporter
+from pylint.utils import ASTWalker
+
+import pylint_ml.checkers
+from benchmarks.corpus import DEFAULT_MIX, best_times, make_walker, parse_mix, write_corpus
+from pylint_ml import plugin
+from pylint_ml.util.library_handler import LibraryHandler
+
+RESULTS_VERSION = 1
+
+
+def plugin_checkers() -> list[type[LibraryHandler]]:
+    """Every checker class of the plugin, including the rule sets that the dispatcher runs."""
+    checkers = set()
+    for module_info in pkgutil.walk_packages(pylint_ml.checkers.__path__, "pylint_ml.checkers."):
+        module = importlib.import_module(module_info.name)
+        for _, checker in inspect.getmembers(module, inspect.isclass):
+            if issubclass(checker, LibraryHandler) and checker.__module__ == module.__name__:
+                checkers.add(checker)
+    return sorted(checkers, key=lambda checker: checker.__name__)
+
+
+def make_linter(register: Callable[[PyLinter], None]) -> PyLinter:
+    linter = PyLinter(reporter=CollectingReporter())
+    register(linter)
+    return linter
+
+
+def walk_corpus(linter: PyLinter, walker: ASTWalker, modules: list[nodes.Module]) -> None:
+    for module in modules:
+        linter.set_current_module(module.name, module.file)
+        walker.walk(module)
+
+
+def peak_memory(run: Callable[[], None]) -> int:
+    """Peak of the memory allocated while ``run`` runs, on top of what was allocated before."""
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak - before
+
+
+def rates(seconds: float, node_count: int, file_count: int) -> dict[str, float | None]:
+    return {
+        "seconds": seconds,
+        "nodes_per_second": node_count / seconds if seconds > 0 else None,
+        "files_per_second": file_count / seconds if seconds > 0 else None,
+    }
+
+
+def bench_walkers(modules: list[nodes.Module], node_count: int, repeat: int) -> dict[str, dict]:
+    """Time the AST walk alone, every checker on its own and all registered checkers together.
+
+    Rates are those of the whole walk; ``overhead_seconds`` is the time a configuration adds to a
+    walk without any checker.
+    """
+    configurations: dict[str, Callable[[PyLinter], None]] = {"ast walk": lambda linter: None}
+    for checker_class in plugin_checkers():
+        configurations[checker_class.__name__] = lambda linter, cls=checker_class: linter.register_checker(cls(linter))
+    configurations["pylint-ml"] = plugin.register
+
+    linters = [make_linter(register) for register in configurations.values()]
+    runs = []
+    for linter in linters:
+        walker = make_walker(linter)
+        runs.append(lambda linter=linter, walker=walker: walk_corpus(linter, walker, modules))
+    times = best_times(runs, repeat)
+
+    results: dict[str, dict] = {}
+    for index, name in enumerate(configurations):
+        linters[index].reporter.reset()
+        memory = peak_memory(runs[index])
+        results[name] = {
+            **rates(times[index], node_count, len(modules)),
+            "overhead_seconds": max(times[index] - times[0], 0.0),
+            "peak_memory_bytes": memory,
+            "messages": len(linters[index].reporter.messages),
+        }
+    return results
+
+
+def bench_end_to_end(paths: list[Path], node_count: int, repeat: int) -> dict[str, dict]:
+    """Lint the corpus with pylint, with only the messages of pylint-ml enabled and with none of them."""
+
+    def register(linter: PyLinter, enabled: bool) -> None:
+        plugin.register(linter)
+        linter.disable("all")
+        if enabled:
+            for checker in linter.get_checkers():
+                if checker is not linter:
+                    for msgid in checker.msgs:
+                        linter.enable(msgid)
+
+    configurations = {"pylint without pylint-ml": False, "pylint with pylint-ml": True}
+    runs = [
+        lambda enabled=enabled: make_linter(lambda linter: register(linter, enabled)).check(
+            [str(path) for path in paths]
+        )
+        for enabled in configurations.values()
+    ]
+    # The parsed modules are cached by astroid, clear them so that every run parses the corpus
+    times = best_times(runs, repeat, prepare=MANAGER.clear_cache)
+
+    results = {}
+    for index, name in enumerate(configurations):
+        MANAGER.clear_cache()
+        results[name] = {
+            **rates(times[index], node_count, len(paths)),
+            "overhead_seconds": max(times[index] - times[0], 0.0),
+            "peak_memory_bytes": peak_memory(runs[index]),
+        }
+    return results
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, check=True, text=True, cwd=Path(__file__).parent
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(corpus: Path, args: argparse.Namespace) -> dict:
+    """Generate the corpus the command line asks for in ``corpus`` and time every configuration on it."""
+    paths = write_corpus(corpus, args.files, args.functions, args.mix, args.seed)
+    modules = [MANAGER.ast_from_file(str(path), path.stem, source=True) for path in paths]
+    node_count = sum(1 for module in modules for _ in module.nodes_of_class(nodes.NodeNG))
+    results = bench_walkers(modules, node_count, args.repeat)
+    results.update(bench_end_to_end(paths, node_count, max(1, args.repeat // 5)))
+    return {
+        "version": RESULTS_VERSION,
+        "commit": git_commit(),
+        "date": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "pylint": pylint.__version__,
+        "astroid": astroid.__version__,
+        "corpus": {
+            "files": args.files,
+            "functions": args.functions,
+            "mix": args.mix,
+            "seed": args.seed,
+            "nodes": node_count,
+        },
+        "results": results,
+    }
+
+
+def print_results(report: dict) -> None:
+    print(f"{'':<30}{'seconds':>10}{'overhead':>10}{'nodes/s':>14}{'files/s':>10}{'peak memory':>14}{'messages':>10}")
+    for name, result in report["results"].items():
+        print(
+            f"{name:<30}{result['seconds']:>10.4f}{result['overhead_seconds']:>10.4f}"
+            f"{result['nodes_per_second']:>14,.0f}{result['files_per_second']:>10,.1f}"
+            f"{result['peak_memory_bytes'] / 1024:>12,.0f}KB{result.get('messages', ''):>10}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", type=Path, help="directory for the generated corpus, a temporary one by default")
+    parser.add_argument("--files", type=int, default=40, help="modules in the corpus")
+    parser.add_argument("--functions", type=int, default=20, help="functions or classes per module")
+    parser.add_argument("--mix", type=parse_mix, default=DEFAULT_MIX, help="profile weights, e.g. pandas_etl=3,plain=1")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=10, help="runs per configuration, the fastest is kept")
+    parser.add_argument("--output", type=Path, help="JSON file the results are written to")
+    args = parser.parse_args()
+
+    if args.corpus is None:
+        with tempfile.TemporaryDirectory() as corpus:
+            report = run_suite(Path(corpus), args)
+    else:
+        report = run_suite(args.corpus, args)
+    print_results(report)
+    if args.output is not None:
+        args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# Licensed under the MIT: https://mit-license.org/
+# For details: https://github.com/pylint-dev/pylint-ml/LICENSE
+# Copyright (c) https://github.com/pylint-dev/pylint-ml/CONTRIBUTORS.txt
+
+"""Measure what the pylint-ml checkers add to the AST walk of modules with and without ML imports.
+
+Usage: python -m benchmarks.bench_import_gate [--functions N] [--repeat N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+
+import astroid
+from pylint.lint import PyLinter
+
+from benchmarks.corpus import best_times, make_module, make_walker
+from pylint_ml.util.manifest import import_checker, load_manifest
+
+ML_IMPORTS = "import numpy as np\nimport pandas as pd\nimport torch\nfrom sklearn.svm import SVC\n"
+
+
+def make_linter(checker_classes) -> PyLinter:
+    linter = PyLinter()
+    for checker_class in checker_classes:
+        linter.register_checker(checker_class(linter))
+    return linter
+
+
+def library_checkers() -> list[type]:
+    """Every library checker of the plugin in registration order, as listed in its manifest."""
+    return [import_checker(entry.checker) for entry in load_manifest()]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--functions", type=int, default=200, help="functions in the synthetic module")
+    parser.add_argument("--repeat", type=int, default=30, help="walks per configuration, the fastest is kept")
+    args = parser.parse_args()
+
+    source = make_module("plain", args.functions, random.Random(0))
+    for ml_imports in (False, True):
+        module = astroid.parse(ML_IMPORTS + source if ml_imports else source)
+        node_count = sum(1 for _ in module.nodes_of_class(astroid.nodes.NodeNG))
+        walkers = [make_walker(make_linter(())), make_walker(make_linter(library_checkers()))]
+        baseline, with_plugin = best_times(
+            [lambda walker=walker, module=module: walker.walk(module) for walker in walkers], args.repeat
+        )
+        label = "with ML imports" if ml_imports else "without ML imports"
+        print(
+            f"{label:<20} nodes={node_count:>7} walk={baseline * 1000:8.2f}ms  "
+            f"with pylint-ml={with_plugin * 1000:8.2f}ms  "
+            f"overhead={(with_plugin - baseline) / node_count * 1e9:6.0f}ns/node"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# Licensed under the MIT: https://mit-license.org/
+# For details: https://github.com/pylint-dev/pylint-ml/LICENSE
+# Copyright (c) https://github.com/pylint-dev/pylint-ml/CONTRIBUTORS.txt
+
+"""Measure how linting a synthetic corpus with pylint-ml scales with ``pylint -j``.
+
+Usage: python -m benchmarks.bench_parallel [--files N] [--functions N] [--mix PROFILE=WEIGHT,...]
+                                           [--jobs N,N,...] [--repeat N]
+
+Every run enables only the messages of pylint-ml. The output of every job count is compared
+with the output of the first one, and a difference is reported as an error.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.corpus import DEFAULT_MIX, parse_mix, write_corpus
+from pylint_ml.util.manifest import load_manifest
+
+ROOT = Path(__file__).parent.parent
+
+
+def pylint_command(paths: list[Path], jobs: int) -> list[str]:
+    symbols = [msg[1] for entry in load_manifest() for msg in entry.msgs.values()]
+    return [
+        sys.executable,
+        "-m",
+        "pylint",
+        "--load-plugins=pylint_ml",
+        "--persistent=n",
+        "--disable=all",
+        f"--enable={','.join(symbols)}",
+        "--score=n",
+        f"--jobs={jobs}",
+        *(str(path) for path in paths),
+    ]
+
+
+def lint(paths: list[Path], jobs: int) -> tuple[float, str]:
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, (str(ROOT), os.environ.get("PYTHONPATH"))))}
+    start = time.perf_counter()
+    result = subprocess.run(pylint_command(paths, jobs), capture_output=True, check=False, env=env, text=True)
+    seconds = time.perf_counter() - start
+    if result.stderr:
+        raise RuntimeError(result.stderr)
+    return seconds, result.stdout
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=200, help="modules in the corpus")
+    parser.add_argument("--functions", type=int, default=20, help="functions or classes per module")
+    parser.add_argument("--mix", type=parse_mix, default=DEFAULT_MIX, help="profile weights, e.g. pandas_etl=3,plain=1")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--jobs", default=f"1,2,4,{os.cpu_count() or 1}", help="job counts to compare")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per job count, the fastest is kept")
+    args = parser.parse_args()
+    job_counts = sorted({int(jobs) for jobs in args.jobs.split(",")})
+
+    with tempfile.TemporaryDirectory() as corpus:
+        paths = write_corpus(corpus, args.files, args.functions, args.mix, args.seed)
+        times = {}
+        outputs = {}
+        for _ in range(args.repeat):
+            for jobs in job_counts:
+                seconds, outputs[jobs] = lint(paths, jobs)
+                times[jobs] = min(times.get(jobs, float("inf")), seconds)
+
+    print(f"{'jobs':>6}{'seconds':>10}{'files/s':>10}{'speedup':>10}")
+    for jobs in job_counts:
+        print(
+            f"{jobs:>6}{times[jobs]:>10.2f}{args.files / times[jobs]:>10.1f}"
+            f"{times[job_counts[0]] / times[jobs]:>9.2f}x"
+        )
+    different = [jobs for jobs in job_counts if outputs[jobs] != outputs[job_counts[0]]]
+    if different:
+        sys.exit(f"output differs from -j {job_counts[0]} with -j {', '.join(map(str, different))}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+# Licensed under the MIT: https://mit-license.org/
+# For details: https://github.com/pylint-dev/pylint-ml/LICENSE
+# Copyright (c) https://github.com/pylint-dev/pylint-ml/CONTRIBUTORS.txt
+
+"""Measure what loading pylint-ml adds to the startup of pylint, by linting an empty file.
+
+Usage: python -m benchmarks.bench_startup [--repeat N]
+
+Every run is a fresh interpreter. The time of the whole ``pylint`` command is dominated by pylint
+itself and varies a lot between runs, so the time spent importing and registering the plugin
+and checking the empty file is also measured inside the process.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+CONFIGURATIONS = {
+    "pylint": [],
+    "pylint --load-plugins=pylint_ml": ["--load-plugins=pylint_ml"],
+    # No library checker is opened, so none of their modules is imported
+    "pylint-ml messages disabled": ["--load-plugins=pylint_ml", "--disable=all", "--enable=missing-module-docstring"],
+}
+
+# Run in a fresh interpreter; pylint itself is imported before the clock starts
+IN_PROCESS = """
+import json, sys, time
+from pylint.lint import PyLinter
+from pylint.reporters import CollectingReporter
+
+path, plugin, disable_plugin = sys.argv[1], sys.argv[2] == "1", sys.argv[3] == "1"
+linter = PyLinter(reporter=CollectingReporter())
+linter.load_default_plugins()
+start = time.perf_counter()
+if plugin:
+    import pylint_ml
+    imported = time.perf_counter()
+    pylint_ml.register(linter)
+else:
+    imported = start
+registered = time.perf_counter()
+if disable_plugin:
+    linter.disable("all")
+    linter.enable("missing-module-docstring")
+linter.check([path])
+checked = time.perf_counter()
+json.dump({"import": imported - start, "register": registered - imported, "check": checked - registered}, sys.stdout)
+"""
+
+
+def command_times(path: Path, repeat: int) -> dict[str, float]:
+    """Fastest wall time of every ``pylint`` command, alternating them to even out machine noise."""
+    best = dict.fromkeys(CONFIGURATIONS, float("inf"))
+    for _ in range(repeat):
+        for name, arguments in CONFIGURATIONS.items():
+            command = [sys.executable, "-m", "pylint", "--persistent=n", "-sn", *arguments, str(path)]
+            start = time.perf_counter()
+            subprocess.run(command, stdout=subprocess.DEVNULL, check=False)
+            best[name] = min(best[name], time.perf_counter() - start)
+    return best
+
+
+def in_process_times(path: Path, repeat: int) -> dict[str, dict[str, float]]:
+    """Fastest import, registration and check of the empty file of every configuration."""
+    flags = {
+        "pylint": ("0", "0"),
+        "pylint --load-plugins=pylint_ml": ("1", "0"),
+        "pylint-ml messages disabled": ("1", "1"),
+    }
+    best: dict[str, dict[str, float]] = {name: {} for name in flags}
+    for _ in range(repeat):
+        for name, (plugin, disable_plugin) in flags.items():
+            output = subprocess.run(
+                [sys.executable, "-c", IN_PROCESS, str(path), plugin, disable_plugin],
+                capture_output=True,
+                check=True,
+                text=True,
+            ).stdout
+            for phase, seconds in json.loads(output).items():
+                best[name][phase] = min(best[name].get(phase, float("inf")), seconds)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10, help="runs per configuration, the fastest is kept")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "empty.py"
+        path.write_text("", encoding="utf-8")
+        commands = command_times(path, args.repeat)
+        phases = in_process_times(path, args.repeat)
+
+    print(f"{'':<36}{'command':>10}{'import':>10}{'register':>10}{'check':>10}")
+    for name, seconds in commands.items():
+        phase = phases[name]
+        print(
+            f"{name:<36}{seconds * 1000:>8.1f}ms{phase['import'] * 1000:>8.2f}ms"
+            f"{phase['register'] * 1000:>8.2f}ms{phase['check'] * 1000:>8.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# Licensed under the MIT: https://mit-license.org/
+# For details: https://github.com/pylint-dev/pylint-ml/LICENSE
+# Copyright (c) https://github.com/pylint-dev/pylint-ml/CONTRIBUTORS.txt
+
+"""Compare two result files of ``benchmarks.bench_checkers`` and report regressions.
+
+Usage: python -m benchmarks.compare BASELINE.json CANDIDATE.json [--threshold FRACTION]
+
+Exits with status 1 if a configuration got slower or used more memory than the threshold allows.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+METRICS = ("seconds", "peak_memory_bytes")
+
+
+def compare(baseline: dict, candidate: dict, threshold: float) -> list[tuple[str, str, float, float, bool]]:
+    """Rows of (configuration, metric, baseline value, candidate value, regressed)."""
+    rows = []
+    for name, result in candidate["results"].items():
+        previous = baseline["results"].get(name)
+        if previous is None:
+            continue
+        for metric in METRICS:
+            before, after = previous[metric], result[metric]
+            rows.append((name, metric, before, after, after > before * (1 + threshold)))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("candidate", type=Path)
+    parser.add_argument("--threshold", type=float, default=0.1, help="allowed relative increase, 0.1 is 10%%")
+    args = parser.parse_args()
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    candidate = json.loads(args.candidate.read_text(encoding="utf-8"))
+    if baseline["corpus"] != candidate["corpus"]:
+        print("warning: the results were measured on different corpora", file=sys.stderr)
+
+    rows = compare(baseline, candidate, args.threshold)
+    for name, metric, before, after, regressed in rows:
+        change = (after - before) / before if before else 0.0
+        marker = "  REGRESSION" if regressed else ""
+        print(f"{name:<30}{metric:<20}{before:>14.6g}{after:>14.6g}{change:>+9.1%}{marker}")
+    if any(regressed for *_, regressed in rows):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
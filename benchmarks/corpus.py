@@ -0,0 +1,242 @@
+# Licensed under the MIT: https://mit-license.org/
+# For details: https://github.com/pylint-dev/pylint-ml/LICENSE
+# Copyright (c) https://github.com/pylint-dev/pylint-ml/CONTRIBUTORS.txt
+
+"""Generate a corpus of synthetic modules that look like typical ML and data science code, and time walks of it.
+
+Usage: python -m benchmarks.corpus DIRECTORY [--files N] [--functions N] [--mix PROFILE=WEIGHT,...] [--seed N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import random
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from pylint.lint import PyLinter
+from pylint.utils import ASTWalker
+
+PANDAS_ETL = (
+    "import json\nimport os\n\nimport numpy as np\nimport pandas as pd\n",
+    (
+        """
+def load_{index}(path, threshold={number}):
+    df_raw = pd.read_csv(path, sep=",")
+    df_raw.dropna(inplace=True)
+    df_raw["total_{index}"] = df_raw["price"] * df_raw["quantity"]
+    for _, row in df_raw.iterrows():
+        if row["total_{index}"] > threshold:
+            print(json.dumps(row.to_dict()))
+    grouped = df_raw.groupby("category").agg({{"total_{index}": "sum"}})
+    return grouped.values
+""",
+        """
+def merge_{index}(left, right, key="id_{index}"):
+    df_merged = pd.merge(left, right, on=key, how="left")
+    df_merged = df_merged.rename(columns={{"value_x": "left_{index}", "value_y": "right_{index}"}})
+    df_merged["ratio_{index}"] = np.where(df_merged["right_{index}"] == 0, np.nan, df_merged["left_{index}"])
+    if df_merged.empty:
+        return None
+    return df_merged.sort_values(by="ratio_{index}", ascending=False).head({number})
+""",
+        """
+def export_{index}(frame, directory):
+    series_totals = frame["total"].fillna(0)
+    summary = pd.DataFrame({{"total": series_totals, "share": series_totals / series_totals.sum()}})
+    weights = np.dot(summary["share"].to_numpy(), np.ones(len(summary)))
+    summary.to_csv(os.path.join(directory, "summary_{index}.csv"), index=False)
+    return summary, weights
+""",
+    ),
+)
+
+TORCH_TRAINING = (
+    "import torch\nfrom torch import nn, optim\nfrom torch.utils.data import DataLoader\n",
+    (
+        """
+class Network{index}(nn.Module):
+    def __init__(self, hidden={number}):
+        super().__init__()
+        self.encoder = nn.Linear(in_features=128, out_features=hidden)
+        self.decoder = nn.Linear(hidden, 10)
+        self.activation = nn.ReLU()
+
+    def forward(self, inputs):
+        return self.decoder(self.activation(self.encoder(inputs)))
+""",
+        """
+def train_{index}(model, dataset, epochs={number}):
+    loader = DataLoader(dataset, batch_size=32, shuffle=True)
+    optimizer = optim.SGD(model.parameters(), momentum=0.9)
+    criterion = nn.CrossEntropyLoss()
+    for epoch in range(epochs):
+        for inputs, targets in loader:
+            optimizer.zero_grad()
+            loss = criterion(model(inputs), targets)
+            loss.backward()
+            optimizer.step()
+        print(epoch, loss.item())
+    torch.save(model.state_dict(), "model_{index}.pt")
+""",
+        """
+def evaluate_{index}(model, loader):
+    model.eval()
+    correct = 0
+    with torch.no_grad():
+        for inputs, targets in loader:
+            predictions = model(inputs).argmax(dim=1)
+            correct += (predictions == targets).sum().item()
+    return correct / len(loader.dataset)
+""",
+    ),
+)
+
+SKLEARN_PIPELINE = (
+    "import numpy as np\n"
+    "from sklearn.ensemble import RandomForestClassifier\n"
+    "from sklearn.metrics import accuracy_score\n"
+    "from sklearn.model_selection import GridSearchCV, cross_val_score, train_test_split\n"
+    "from sklearn.pipeline import Pipeline\n"
+    "from sklearn.preprocessing import StandardScaler\n",
+    (
+        """
+def fit_{index}(features, labels):
+    X_train, X_test, y_train, y_test = train_test_split(features, labels, test_size=0.2)
+    pipeline = Pipeline([("scale", StandardScaler()), ("model", RandomForestClassifier(n_estimators={number}))])
+    pipeline.fit(X_train, y_train)
+    scores = cross_val_score(pipeline, X=features, y=labels, cv=5)
+    return accuracy_score(y_test, pipeline.predict(X_test)), np.mean(scores)
+""",
+        """
+def search_{index}(features, labels):
+    model = RandomForestClassifier()
+    search = GridSearchCV(model, {{"max_depth": [2, 4, {number}]}}, cv=3)
+    search.fit(features, labels)
+    return search.best_estimator_, search.best_score_
+""",
+    ),
+)
+
+PLAIN = (
+    "import json\nimport os\nfrom collections import defaultdict\n",
+    (
+        """
+def transform_{index}(records, threshold={number}):
+    result = []
+    for record in records:
+        value = record.get("value", 0) * 2 + threshold
+        if value > threshold and record["name"].startswith("x"):
+            result.append({{"name": record["name"].upper(), "value": value}})
+    summary = sum(item["value"] for item in result)
+    return sorted(result, key=lambda item: item["value"]), summary
+""",
+        """
+class Registry{index}:
+    def __init__(self):
+        self.entries = defaultdict(list)
+
+    def add(self, name, value={number}):
+        self.entries[name].append(value)
+
+    def dump(self, directory):
+        with open(os.path.join(directory, "registry_{index}.json"), "w", encoding="utf-8") as stream:
+            json.dump(self.entries, stream)
+""",
+    ),
+)
+
+PROFILES = {
+    "pandas_etl": PANDAS_ETL,
+    "torch_training": TORCH_TRAINING,
+    "sklearn_pipeline": SKLEARN_PIPELINE,
+    "plain": PLAIN,
+}
+
+DEFAULT_MIX = {"pandas_etl": 1, "torch_training": 1, "sklearn_pipeline": 1, "plain": 1}
+
+
+def parse_mix(text: str) -> dict[str, int]:
+    """Parse ``pandas_etl=2,plain=1`` into profile weights."""
+    mix = {}
+    for item in text.split(","):
+        profile, _, weight = item.partition("=")
+        if profile not in PROFILES:
+            raise ValueError(f"unknown profile {profile!r}, expected one of {', '.join(PROFILES)}")
+        mix[profile] = int(weight or 1)
+    return mix
+
+
+def make_module(profile: str, functions: int, rng: random.Random) -> str:
+    """Source of a module of ``profile`` with ``functions`` functions or classes."""
+    imports, templates = PROFILES[profile]
+    body = "".join(rng.choice(templates).format(index=index, number=rng.randint(2, 512)) for index in range(functions))
+    return f"{imports}\n{body}"
+
+
+def write_corpus(
+    directory: str | Path,
+    files: int,
+    functions: int,
+    mix: dict[str, int] | None = None,
+    seed: int = 0,
+) -> list[Path]:
+    """Write ``files`` modules to ``directory``; the same arguments always give the same corpus."""
+    mix = mix or DEFAULT_MIX
+    rng = random.Random(seed)
+    profiles = rng.choices(list(mix), weights=list(mix.values()), k=files)
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for index, profile in enumerate(profiles):
+        path = directory / f"module_{index:05d}_{profile}.py"
+        path.write_text(make_module(profile, functions, rng), encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def make_walker(linter: PyLinter) -> ASTWalker:
+    """Walker that runs every checker registered with ``linter``, opened as for a run."""
+    walker = ASTWalker(linter)
+    for checker in linter.get_checkers():
+        if checker is not linter:
+            checker.open()
+            walker.add_checker(checker)
+    return walker
+
+
+def best_times(runs: list[Callable[[], None]], repeat: int, prepare: Callable[[], None] | None = None) -> list[float]:
+    """Fastest time of every run, alternating the runs to even out machine noise."""
+    best = [float("inf")] * len(runs)
+    for _ in range(repeat):
+        for index, run in enumerate(runs):
+            if prepare is not None:
+                prepare()
+            gc.collect()
+            gc.disable()
+            try:
+                start = time.perf_counter()
+                run()
+                best[index] = min(best[index], time.perf_counter() - start)
+            finally:
+                gc.enable()
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("directory", help="directory the modules are written to")
+    parser.add_argument("--files", type=int, default=100, help="number of modules")
+    parser.add_argument("--functions", type=int, default=20, help="functions or classes per module")
+    parser.add_argument("--mix", type=parse_mix, default=DEFAULT_MIX, help="profile weights, e.g. pandas_etl=3,plain=1")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    paths = write_corpus(args.directory, args.files, args.functions, args.mix, args.seed)
+    print(f"wrote {len(paths)} modules to {args.directory}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,3 @@
+from pylint_ml.plugin import register
+
+__all__ = ["register"]
@@ -0,0 +1,69 @@
+# Licensed under the MIT: https://mit-license.org/
+# For details: https://github.com/pylint-dev/pylint-ml/LICENSE
+# Copyright (c) https://github.com/pylint-dev/pylint-ml/CONTRIBUTORS.txt
+
+"""Check for arrays grown by np.append, np.concatenate or the stacking functions inside a loop."""
+
+from __future__ import annotations
+
+from astroid import nodes
+from pylint.checkers.utils import only_required_for_messages
+from pylint.interfaces import HIGH
+
+from pylint_ml.util.call_name import get_call_name
+from pylint_ml.util.library_handler import LibraryHandler, only_if_library_imported
+from pylint_ml.util.loop_index import operand_names
+
+# numpy functions that copy the arrays passed to them into a new one, with the parameters of those arrays.
+# ``np.append(arr, values)`` takes them as two arguments, the others as a sequence.
+_FUNCTIONS = {
+    "numpy.append": ("arr", "values"),
+    "numpy.concatenate": ("arrays",),
+    "numpy.stack": ("arrays",),
+    "numpy.vstack": ("tup",),
+    "numpy.hstack": ("tup",),
+    "numpy.dstack": ("tup",),
+    "numpy.column_stack": ("tup",),
+    "numpy.row_stack": ("tup",),
+}
+_TAILS = frozenset(name.rsplit(".", 1)[-1] for name in _FUNCTIONS)
+
+
+class NumpyAppendInLoopChecker(LibraryHandler):
+    name = "numpy-append-in-loop"
+    library = "numpy"
+    msgs = {
+        "W8004": (
+            "'%s' is grown with %s in the loop at line %s",
+            "numpy-append-in-loop",
+            "Every iteration allocates a new array and copies the whole accumulated one into it, so the loop "
+            "takes quadratic time. Preallocate the array with np.empty and fill it, or collect the pieces in a "
+            "list and stack them once after the loop.",
+        ),
+    }
+
+    @only_required_for_messages("numpy-append-in-loop")
+    @only_if_library_imported
+    def visit_call(self, node: nodes.Call) -> None:
+        if not isinstance(node.parent, (nodes.Assign, nodes.AnnAssign, nodes.NamedExpr)):
+            return
+        call_name = get_call_name(node)
+        if call_name.tail not in _TAILS:
+            return
+        params = _FUNCTIONS.get(self.import_table(node).qualify(call_name))
+        if params is None:
+            return
+        self.rule_matched()
+        operands = operand_names(
+            [*node.args[: len(params)], *(keyword.value for keyword in node.keywords if keyword.arg in params)]
+        )
+
+        accumulation = self.loop_index(node).accumulation(node, operands)
+        if accumulation is not None:
+            accumulator, context = accumulation
+            self.add_message(
+                "numpy-append-in-loop",
+                node=node,
+                args=(accumulator, f"{call_name.tail}()", context.lineno),
+                confidence=HIGH,
+            )
@@ -10,11 +10,12 @@ from astroid import nodes
 from pylint.checkers.utils import only_required_for_messages
 from pylint.interfaces import HIGH
 
-from pylint_ml.util.library_handler import LibraryHandler
+from pylint_ml.util.library_handler import LibraryHandler, only_if_library_imported
 
 
 class NumpyDotChecker(LibraryHandler):
     name = "numpy-dot-checker"
+    library = "numpy"
     msgs = {
         "W8122": (
             "Consider using 'np.matmul()' instead of 'np.dot()' for matrix multiplication.",
@@ -24,19 +25,13 @@ class NumpyDotChecker(LibraryHandler):
         ),
     }
 
-    def visit_import(self, node: nodes.Import):
-        super().visit_import(node=node)
-
     @only_required_for_messages("numpy-dot-usage")
+    @only_if_library_imported
     def visit_call(self, node: nodes.Call) -> None:
-        if not self.is_library_imported("numpy"):
-            return
-
-        # Check if the function being called is np.dot
-        if isinstance(node.func, nodes.Attribute):
-            func_name = node.func.attrname
+        # Check if the function being called is np.dot, whatever numpy is imported as
+        if isinstance(node.func, nodes.Attribute) and node.func.attrname == "dot":
             module_name = getattr(node.func.expr, "name", None)
 
-            if func_name == "dot" and module_name == "np":
+            if self.import_table(node).qualified_name(module_name) == "numpy":
                 # Suggest using np.matmul() instead
                 self.add_message("numpy-dot-usage", node=node, confidence=HIGH)
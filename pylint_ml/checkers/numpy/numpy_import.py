@@ -7,13 +7,15 @@
 from __future__ import annotations
 
 from astroid import nodes
-from pylint.checkers import BaseChecker
 from pylint.checkers.utils import only_required_for_messages
 from pylint.interfaces import HIGH
 
+from pylint_ml.util.library_handler import LibraryHandler, only_if_library_imported
 
-class NumpyImportChecker(BaseChecker):
+
+class NumpyImportChecker(LibraryHandler):
     name = "numpy-import"
+    library = "numpy"
     msgs = {
         "W8001": (
             "Numpy imported with incorrect alias",
@@ -33,12 +35,14 @@ class NumpyImportChecker(BaseChecker):
     }
 
     @only_required_for_messages("numpy-import")
+    @only_if_library_imported
     def visit_import(self, node: nodes.Import) -> None:
         for name, alias in node.names:
             if name == "numpy" and alias != "np":
                 self.add_message("numpy-import", node=node, confidence=HIGH)
 
     @only_required_for_messages("numpy-importfrom")
+    @only_if_library_imported
     def visit_importfrom(self, node: nodes.ImportFrom) -> None:
         if node.modname == "numpy":
             self.add_message("numpy-importfrom", node=node, confidence=HIGH)
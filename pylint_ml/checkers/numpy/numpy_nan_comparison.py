@@ -7,30 +7,36 @@
 from __future__ import annotations
 
 from astroid import nodes
-from pylint.checkers import BaseChecker
 from pylint.checkers.utils import only_required_for_messages
 from pylint.interfaces import HIGH
 
+from pylint_ml.util.library_handler import LibraryHandler, only_if_library_imported
+
 COMPARISON_OP = frozenset(("<", "<=", ">", ">=", "!=", "=="))
 NUMPY_NAN = frozenset(("nan", "NaN", "NAN"))
 
 
-class NumpyNaNComparisonChecker(BaseChecker):
+class NumpyNaNComparisonChecker(LibraryHandler):
     name = "numpy-nan-compare"
+    library = "numpy"
     msgs = {
-        "W8001": (
+        "W8003": (
             "Numpy nan comparison used",
             "numpy-nan-compare",
             "Since comparing NaN with NaN always returns False, use np.isnan() to check for NaN values.",
         ),
     }
 
-    @classmethod
-    def __is_np_nan_call(cls, node: nodes.Attribute) -> bool:
+    def __is_np_nan_call(self, node: nodes.Attribute) -> bool:
         """Check if the node represents a call to np.nan."""
-        return node.attrname in NUMPY_NAN and isinstance(node.expr, nodes.Name) and node.expr.name == "np"
+        return (
+            node.attrname in NUMPY_NAN
+            and isinstance(node.expr, nodes.Name)
+            and self.import_table(node).qualified_name(node.expr.name) == "numpy"
+        )
 
     @only_required_for_messages("numpy-nan-compare")
+    @only_if_library_imported
     def visit_compare(self, node: nodes.Compare) -> None:
 
         if isinstance(node.left, nodes.Attribute) and self.__is_np_nan_call(node.left):
@@ -0,0 +1,225 @@
+# Licensed under the MIT: https://mit-license.org/
+# For details: https://github.com/pylint-dev/pylint-ml/LICENSE
+# Copyright (c) https://github.com/pylint-dev/pylint-ml/CONTRIBUTORS.txt
+
+"""Check for Python loops that process a numpy array element by element."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+from astroid import nodes
+from astroid.const import Context
+from pylint.checkers.utils import only_required_for_messages
+from pylint.interfaces import HIGH
+
+from pylint_ml.util.call_name import get_call_name
+from pylint_ml.util.library_handler import LibraryHandler, only_if_library_imported
+from pylint_ml.util.loop_index import range_len_argument
+from pylint_ml.util.type_inference import NDARRAY
+
+# Builtins that have an element-wise or reducing numpy counterpart
+_BUILTINS = {"abs": "math functions", "round": "math functions", "min": "reductions", "max": "reductions"}
+
+# The order in which the operations of a loop body are listed in the message
+_OPERATIONS = ("arithmetic", "comparisons", "math functions", "reductions")
+
+
+def _is_enumerate(iterable: nodes.Call, target: nodes.NodeNG) -> bool:
+    """Whether the loop is ``for i, x in enumerate(arr)``."""
+    return (
+        iterable.func.name == "enumerate"
+        and len(iterable.args) == 1
+        and isinstance(iterable.args[0], nodes.Name)
+        and isinstance(target, nodes.Tuple)
+        and len(target.elts) == 2
+        and all(isinstance(elt, nodes.AssignName) for elt in target.elts)
+    )
+
+
+def _steps(body: list[nodes.NodeNG]) -> Iterator[nodes.NodeNG]:
+    """The statements of a loop body in order, with the test of an ``if`` before its branches."""
+    for statement in body:
+        if isinstance(statement, nodes.If):
+            yield statement.test
+            yield from _steps(statement.body + statement.orelse)
+        else:
+            yield statement
+
+
+def _carries_values(node: nodes.For) -> bool:
+    """Whether an iteration reads what another one wrote, e.g. ``out[i] = a * x[i] + (1 - a) * out[i - 1]``.
+
+    Arrays written in the body may only be read at the loop variable. A name assigned in the body
+    may be read once the iteration assigned it, as ``scaled`` in ``scaled = arr[i] * 2`` followed by
+    ``out[i] = scaled + 1``, but not before. Accumulators such as ``total += x`` may only be read by
+    the statement that updates them.
+    """
+    loop_names = {name.name for name in node.target.nodes_of_class(nodes.AssignName)}
+    steps = list(_steps(node.body))
+    assigned = [{name.name for name in step.nodes_of_class(nodes.AssignName)} for step in steps]
+    written = {
+        subscript.value.name
+        for step in steps
+        for subscript in step.nodes_of_class(nodes.Subscript)
+        if subscript.ctx == Context.Store and isinstance(subscript.value, nodes.Name)
+    }
+    # Where each name is first assigned by a statement that runs in every iteration
+    defined_at: dict[str, int] = {}
+    for position, step in enumerate(steps):
+        if step.parent is node:
+            for name in assigned[position]:
+                defined_at.setdefault(name, position)
+    accumulators = {
+        name.name
+        for position, step in enumerate(steps)
+        for name in step.nodes_of_class(nodes.Name)
+        if name.name in assigned[position] and defined_at.get(name.name, position) >= position
+    }
+    assigned_anywhere = set().union(*assigned)
+    for position, step in enumerate(steps):
+        for name in step.nodes_of_class(nodes.Name):
+            if name.name in assigned_anywhere and name.name not in assigned[position]:
+                if name.name in accumulators or defined_at.get(name.name, position) >= position:
+                    return True
+            if name.name in written and not (
+                isinstance(name.parent, nodes.Subscript)
+                and name.parent.value is name
+                and isinstance(name.parent.slice, nodes.Name)
+                and name.parent.slice.name in loop_names
+            ):
+                return True
+    return False
+
+
+class NumpyVectorizableLoopChecker(LibraryHandler):
+    name = "numpy-vectorizable-loop"
+    library = "numpy"
+    msgs = {
+        "W8005": (
+            "Loop over array '%s' does %s element by element",
+            "numpy-vectorizable-loop",
+            "Python loops over the elements of an array are orders of magnitude slower than the same operations "
+            "applied to the whole array. Use array arithmetic, comparisons, np.where, ufuncs and reductions such "
+            "as np.sum instead.",
+        ),
+    }
+
+    @only_required_for_messages("numpy-vectorizable-loop")
+    @only_if_library_imported
+    def visit_for(self, node: nodes.For) -> None:
+        if node.orelse:
+            return
+        iterated = self._iterated_array(node)
+        if iterated is None:
+            return
+        array, element_refs = iterated
+        self.rule_matched()
+        operations: set[str] = set()
+        if (
+            self._body_is_element_wise(node.body, operations)
+            and operations
+            and not _carries_values(node)
+            and any(
+                expression.as_string() in element_refs
+                for statement in node.body
+                for expression in statement.nodes_of_class((nodes.Name, nodes.Subscript))
+            )
+        ):
+            labels = [operation for operation in _OPERATIONS if operation in operations]
+            description = " and ".join(filter(None, (", ".join(labels[:-1]), labels[-1])))
+            self.add_message(
+                "numpy-vectorizable-loop",
+                node=node,
+                args=(array.name, description),
+                confidence=HIGH,
+            )
+
+    def _iterated_array(self, node: nodes.For) -> tuple[nodes.Name, set[str]] | None:
+        """The array a loop goes over and the source of the expressions that read its current element.
+
+        Loops look like ``for x in arr``, ``for i, x in enumerate(arr)`` or ``for i in range(len(arr))``.
+        """
+        target, iterable = node.target, node.iter
+        if isinstance(iterable, nodes.Name) and isinstance(target, nodes.AssignName):
+            if self.inferred_type(iterable) == NDARRAY:
+                return iterable, {target.name}
+            return None
+        if not isinstance(iterable, nodes.Call) or not isinstance(iterable.func, nodes.Name):
+            return None
+        if _is_enumerate(iterable, target):
+            array = iterable.args[0]
+            if self.inferred_type(array) == NDARRAY:
+                index, element = target.elts
+                return array, {element.name, f"{array.name}[{index.name}]"}
+            return None
+        array = range_len_argument(iterable)
+        if array is not None and isinstance(target, nodes.AssignName):
+            if self.inferred_type(array) == NDARRAY:
+                return array, {f"{array.name}[{target.name}]"}
+        return None
+
+    def _body_is_element_wise(self, body: list[nodes.NodeNG], operations: set[str]) -> bool:
+        """Whether every statement only combines elements with operations numpy can apply to whole arrays.
+
+        The statements have to assign into arrays, append to lists or accumulate into a variable.
+        The operations found are added to ``operations``.
+        """
+        for statement in body:
+            if isinstance(statement, nodes.If):
+                operations.add("comparisons")
+                if not self._expression_is_element_wise(statement.test, operations):
+                    return False
+                if not self._body_is_element_wise(statement.body + statement.orelse, operations):
+                    return False
+                continue
+            if isinstance(statement, nodes.AugAssign) and isinstance(statement.target, nodes.AssignName):
+                operations.add("reductions")
+                value = statement.value
+            elif isinstance(statement, nodes.Assign) and len(statement.targets) == 1:
+                target = statement.targets[0]
+                value = statement.value
+                if isinstance(target, nodes.AssignName):
+                    if target.name in {name.name for name in value.nodes_of_class(nodes.Name)}:
+                        # ``total = total + x`` or ``best = max(best, x)``
+                        operations.add("reductions")
+                elif not isinstance(target, nodes.Subscript):
+                    return False
+            elif (
+                isinstance(statement, nodes.Expr)
+                and isinstance(statement.value, nodes.Call)
+                and isinstance(statement.value.func, nodes.Attribute)
+                and statement.value.func.attrname == "append"
+                and len(statement.value.args) == 1
+            ):
+                value = statement.value.args[0]
+            else:
+                return False
+            if not self._expression_is_element_wise(value, operations):
+                return False
+        return True
+
+    def _expression_is_element_wise(self, node: nodes.NodeNG, operations: set[str]) -> bool:
+        if isinstance(node, (nodes.BinOp, nodes.UnaryOp)):
+            operations.add("arithmetic")
+        elif isinstance(node, (nodes.Compare, nodes.BoolOp, nodes.IfExp)):
+            operations.add("comparisons")
+        elif isinstance(node, nodes.Call):
+            call_name = get_call_name(node)
+            qualified_name = self.import_table(node).qualify(call_name)
+            if call_name.root in _BUILTINS and not call_name.attrs:
+                operations.add(_BUILTINS[call_name.root])
+            elif qualified_name is not None and qualified_name.split(".", 1)[0] in ("numpy", "math"):
+                operations.add("math functions")
+            else:
+                return False
+            if node.keywords:
+                return False
+            return all(self._expression_is_element_wise(arg, operations) for arg in node.args)
+        elif not isinstance(node, (nodes.Name, nodes.Const, nodes.Subscript, nodes.Attribute)):
+            return False
+        return all(
+            self._expression_is_element_wise(child, operations)
+            for child in node.get_children()
+            if not isinstance(node, (nodes.Subscript, nodes.Attribute))
+        )
@@ -0,0 +1,282 @@
+# Licensed under the MIT: https://mit-license.org/
+# For details: https://github.com/pylint-dev/pylint-ml/LICENSE
+# Copyright (c) https://github.com/pylint-dev/pylint-ml/CONTRIBUTORS.txt
+
+"""Check for string columns that are only compared, grouped or joined on, which fit a compact dtype."""
+
+from __future__ import annotations
+
+from astroid import nodes
+from astroid.const import Context
+from pylint.checkers.utils import only_required_for_messages
+from pylint.interfaces import HIGH
+
+from pylint_ml.util import rule_database
+from pylint_ml.util.call_name import get_call_name
+from pylint_ml.util.def_use import INDEXERS, bound_name, uses
+from pylint_ml.util.import_table import ImportTable
+from pylint_ml.util.library_handler import LibraryHandler, only_if_library_imported
+from pylint_ml.util.type_inference import is_row_filter
+
+EQUALITY = "equality"
+GROUPING = "grouping"
+JOIN = "merge keys"
+# A use the compact dtypes do not help with, e.g. string methods or arithmetic
+OTHER = "other"
+
+# Compact dtypes by the kinds of use they suit. Comparisons with literals and groupings point
+# at few distinct values, which a category stores once. Join keys are often unique and merging
+# categoricals with different categories is slow, so they are stored as Arrow strings.
+CATEGORY = "category"
+ARROW_STRING = "string[pyarrow]"
+
+# dtypes that already store strings compactly, and the ones that mean plain Python strings
+_COMPACT_DTYPES = {"category", "string", "string[pyarrow]", "large_string[pyarrow]"}
+_OBJECT_DTYPES = {"object", "str"}
+
+# Methods of a column that only need the distinct values
+_GROUPING_METHODS = {"nunique", "unique", "value_counts"}
+
+# Keywords of ``merge`` that name the key columns of the left and of the right frame
+_MERGE_KEYWORDS = {"on": (0, 1), "left_on": (0,), "right_on": (1,)}
+
+# Attributes of a DataFrame that do not read the values of its columns
+_FRAME_METADATA = {"attrs", "axes", "columns", "dtypes", "empty", "flags", "index", "ndim", "shape", "size"}
+
+# Attributes of a DataFrame that read the values of every column, any other attribute is a column
+_FRAME_VALUES = {"T", "at", "iat", "iloc", "loc", "plot", "sparse", "style", "values"}
+
+# Builtins that only display or count a frame
+_DISPLAY_BUILTINS = {"len", "print", "repr", "str"}
+
+
+class ColumnRoles:
+    """How the code uses each column of a DataFrame, following it through row selections.
+
+    Columns that are compared with string literals, or declared as strings where the frame
+    is read, are known to hold strings. ``failed`` is set as soon as the frame is used in a way
+    that is not followed, e.g. when it is returned, written to a file or passed to a function,
+    since that use can need any column as it is.
+    """
+
+    def __init__(self, imports: ImportTable) -> None:
+        self.imports = imports
+        self.roles: dict[str, set[str]] = {}
+        self.strings: set[str] = set()
+        # Where each column is first used, to report them in source order
+        self.first_use: dict[str, nodes.NodeNG] = {}
+        self._followed: set[nodes.AssignName] = set()
+        self.failed = False
+
+    def add(self, column: str, role: str, node: nodes.NodeNG) -> None:
+        self.roles.setdefault(column, set()).add(role)
+        self.first_use.setdefault(column, node)
+
+    def binding(self, binding: nodes.AssignName) -> None:
+        if binding in self._followed:
+            return
+        self._followed.add(binding)
+        for use in uses(binding):
+            if self.failed:
+                return
+            self.frame(use)
+
+    def fail(self) -> None:
+        self.failed = True
+
+    def frame(self, node: nodes.NodeNG) -> None:
+        """Record the roles of the columns the expression around the frame ``node`` uses."""
+        parent = node.parent
+        if isinstance(parent, nodes.Attribute) and parent.expr is node and parent.attrname in INDEXERS:
+            subscript = parent.parent
+            if isinstance(subscript, nodes.Subscript) and subscript.value is parent:
+                key = subscript.slice
+                if isinstance(key, nodes.Tuple) and len(key.elts) == 2:
+                    self.selection(subscript, key.elts[1])
+                elif is_row_filter(key) and subscript.ctx == Context.Load:
+                    self.rows(subscript)
+                else:
+                    self.fail()
+            else:
+                self.fail()
+        elif isinstance(parent, nodes.Subscript) and parent.value is node:
+            if is_row_filter(parent.slice) and parent.ctx == Context.Load:
+                self.rows(parent)
+            else:
+                self.selection(parent, parent.slice)
+        elif isinstance(parent, nodes.Attribute) and parent.expr is node:
+            call = parent.parent
+            if not (isinstance(call, nodes.Call) and call.func is parent):
+                self.attribute(parent)
+            elif parent.attrname == "groupby":
+                for column, key in _keys(_argument(call, 0, "by")):
+                    self.add(column, GROUPING, key)
+            elif parent.attrname == "merge":
+                self.merge(call, 0)
+            elif parent.attrname in ("head", "tail", "copy", "sample"):
+                self.rows(call)
+            else:
+                self.fail()
+        elif isinstance(parent, nodes.Call) and node in parent.args:
+            call_name = get_call_name(parent)
+            if self.imports.qualify(call_name) == "pandas.merge" and node in parent.args[:2]:
+                # ``pd.merge(left, right, on="key")``
+                self.merge(parent, parent.args.index(node))
+            elif call_name.root not in _DISPLAY_BUILTINS or call_name.attrs:
+                self.fail()
+        else:
+            self.fail()
+
+    def attribute(self, node: nodes.Attribute) -> None:
+        """``df.country``, a column unless it is an attribute of the frame itself."""
+        if node.attrname in _FRAME_VALUES:
+            self.fail()
+        elif node.attrname not in _FRAME_METADATA:
+            self.add(node.attrname, OTHER, node)
+
+    def rows(self, node: nodes.NodeNG) -> None:
+        """Follow a selection of rows, which has every column of the frame."""
+        binding = bound_name(node)
+        if binding is not None:
+            self.binding(binding)
+        else:
+            self.frame(node)
+
+    def merge(self, call: nodes.Call, side: int) -> None:
+        for keyword in call.keywords:
+            if side in _MERGE_KEYWORDS.get(keyword.arg, ()):
+                for column, key in _keys(keyword.value):
+                    self.add(column, JOIN, key)
+
+    def selection(self, node: nodes.Subscript, key: nodes.NodeNG) -> None:
+        """``df[key]`` or ``df.loc[rows, key]``."""
+        if not (isinstance(key, nodes.Const) and isinstance(key.value, str)):
+            if not isinstance(key, (nodes.List, nodes.Tuple)) or len(_keys(key)) != len(key.elts):
+                # Columns that are not known, or rows written with a filter
+                self.fail()
+            # Several columns, used in ways that are not followed
+            for column, _ in _keys(key):
+                self.add(column, OTHER, node)
+            return
+        column = key.value
+        if node.ctx != Context.Load:
+            # A column that is assigned gets the dtype of its new values
+            self.add(column, OTHER, node)
+            return
+        parent = node.parent
+        if isinstance(parent, nodes.Compare) and len(parent.ops) == 1:
+            operator, other = parent.ops[0]
+            if operator in ("==", "!=") and _is_string(other if parent.left is node else parent.left):
+                self.strings.add(column)
+                self.add(column, EQUALITY, node)
+                return
+            if operator in ("in", "not in") and parent.left is node and _are_strings(other):
+                self.strings.add(column)
+                self.add(column, EQUALITY, node)
+                return
+        elif isinstance(parent, nodes.Attribute) and isinstance(parent.parent, nodes.Call):
+            call = parent.parent
+            if parent.attrname == "isin" and len(call.args) == 1 and _are_strings(call.args[0]):
+                self.strings.add(column)
+                self.add(column, EQUALITY, node)
+                return
+            if parent.attrname in _GROUPING_METHODS:
+                self.add(column, GROUPING, node)
+                return
+        self.add(column, OTHER, node)
+
+
+def _is_string(node: nodes.NodeNG) -> bool:
+    return isinstance(node, nodes.Const) and isinstance(node.value, str)
+
+
+def _are_strings(node: nodes.NodeNG) -> bool:
+    return (
+        isinstance(node, (nodes.List, nodes.Tuple, nodes.Set)) and bool(node.elts) and all(map(_is_string, node.elts))
+    )
+
+
+def _keys(node: nodes.NodeNG | None) -> list[tuple[str, nodes.NodeNG]]:
+    """Column names of a key such as ``"region"`` or ``["region", "status"]``, with their nodes."""
+    if _is_string(node):
+        return [(node.value, node)]
+    if isinstance(node, (nodes.List, nodes.Tuple)):
+        return [(elt.value, elt) for elt in node.elts if _is_string(elt)]
+    return []
+
+
+def _argument(call: nodes.Call, position: int, keyword: str) -> nodes.NodeNG | None:
+    if len(call.args) > position:
+        return call.args[position]
+    return next((kw.value for kw in call.keywords if kw.arg == keyword), None)
+
+
+def _declared_dtypes(call: nodes.Call) -> tuple[dict[str, str], str | None]:
+    """dtypes the ``dtype=`` argument of a read gives to single columns, and to all of them."""
+    value = next((keyword.value for keyword in call.keywords if keyword.arg == "dtype"), None)
+    if isinstance(value, nodes.Dict):
+        return {key.value: _dtype_name(item) for key, item in value.items if _is_string(key)}, None
+    return {}, _dtype_name(value) if value is not None else None
+
+
+def _dtype_name(node: nodes.NodeNG) -> str:
+    if _is_string(node):
+        return node.value
+    return node.as_string()
+
+
+def _compact_dtype(usage: ColumnRoles, column: str, dtype: str | None) -> str | None:
+    """The dtype to load a string ``column`` of ``dtype`` as, ``None`` if it is used otherwise or already compact."""
+    roles = usage.roles[column]
+    is_string = column in usage.strings or dtype in _OBJECT_DTYPES
+    if OTHER in roles or not is_string or dtype in _COMPACT_DTYPES:
+        return None
+    return CATEGORY if roles & {EQUALITY, GROUPING} else ARROW_STRING
+
+
+class PandasCategoricalDtypeChecker(LibraryHandler):
+    name = "pandas-categorical-dtype"
+    library = "pandas"
+    msgs = {
+        "W8124": (
+            "Column '%s' of '%s' is only used for %s, load it as '%s' with %s",
+            "pandas-categorical-column",
+            "Columns of Python strings take a Python object per row. A column that is only compared, grouped "
+            "or joined on fits a categorical or Arrow string dtype, which usually cuts its memory 5-10x and "
+            "speeds up the comparisons.",
+        ),
+    }
+
+    @only_required_for_messages("pandas-categorical-column")
+    @only_if_library_imported
+    def visit_call(self, node: nodes.Call) -> None:
+        call_name = get_call_name(node)
+        if not call_name.tail or not call_name.tail.startswith("read_"):
+            return
+        binding = bound_name(node)
+        imports = self.import_table(node)
+        qualified_name = imports.qualify(call_name)
+        if binding is None or qualified_name is None or not qualified_name.startswith("pandas.read_"):
+            return
+        self.rule_matched()
+        declared, declared_for_all = _declared_dtypes(node)
+        if declared_for_all in _COMPACT_DTYPES:
+            return
+        usage = ColumnRoles(imports)
+        usage.binding(binding)
+        if usage.failed:
+            return
+        # Readers the rule database wants a dtype for take it at the load site
+        takes_dtype = any("dtype" in rule.params for rule in rule_database.rules().by_name.get(qualified_name, ()))
+        for column in sorted(usage.roles, key=lambda column: usage.first_use[column].lineno):
+            compact = _compact_dtype(usage, column, declared.get(column, declared_for_all))
+            if compact is None:
+                continue
+            mapping = f"{{{column!r}: {compact!r}}}"
+            fix = f"{call_name.tail}(dtype={mapping})" if takes_dtype else f".astype({mapping})"
+            self.add_message(
+                "pandas-categorical-column",
+                node=node,
+                args=(column, binding.name, " and ".join(sorted(usage.roles[column])), compact, fix),
+                confidence=HIGH,
+            )
@@ -0,0 +1,68 @@
+# Licensed under the MIT: https://mit-license.org/
+# For details: https://github.com/pylint-dev/pylint-ml/LICENSE
+# Copyright (c) https://github.com/pylint-dev/pylint-ml/CONTRIBUTORS.txt
+
+"""Check for DataFrames grown by concat, append or merge inside a loop."""
+
+from __future__ import annotations
+
+from astroid import nodes
+from pylint.checkers.utils import only_required_for_messages
+from pylint.interfaces import HIGH
+
+from pylint_ml.util.call_name import get_call_name
+from pylint_ml.util.library_handler import LibraryHandler, only_if_library_imported
+from pylint_ml.util.loop_index import operand_names
+from pylint_ml.util.type_inference import DATAFRAME, SERIES
+
+# pandas functions that combine the frames passed to them into a new one
+_FUNCTIONS = {"pandas.concat", "pandas.merge"}
+
+# DataFrame methods that return a copy of the frame combined with their arguments
+_METHODS = {"append", "merge"}
+
+
+class PandasConcatInLoopChecker(LibraryHandler):
+    name = "pandas-concat-in-loop"
+    library = "pandas"
+    msgs = {
+        "W8119": (
+            "'%s' is grown with %s in the loop at line %s",
+            "pandas-concat-in-loop",
+            "Every iteration copies the whole accumulated DataFrame, so the loop takes quadratic time. Collect "
+            "the pieces in a list and call pd.concat once after the loop.",
+        ),
+    }
+
+    @only_required_for_messages("pandas-concat-in-loop")
+    @only_if_library_imported
+    def visit_call(self, node: nodes.Call) -> None:
+        if not isinstance(node.parent, (nodes.Assign, nodes.AnnAssign, nodes.NamedExpr)):
+            return
+        call_name = get_call_name(node)
+        if call_name.tail not in ("concat", "merge", "append"):
+            return
+        keywords = [keyword.value for keyword in node.keywords if keyword.arg in ("objs", "left", "right", "other")]
+        if self.import_table(node).qualify(call_name) in _FUNCTIONS:
+            self.rule_matched()
+            operands = operand_names([*(node.args[:1] if call_name.tail == "concat" else node.args[:2]), *keywords])
+        elif (
+            call_name.tail in _METHODS
+            and isinstance(node.func, nodes.Attribute)
+            # ``np.append(arr, x)`` and ``items.append(x)`` are no DataFrame methods
+            and self.inferred_type(node.func.expr) in (DATAFRAME, SERIES)
+        ):
+            self.rule_matched()
+            operands = operand_names([node.func.expr, *node.args[:1], *keywords])
+        else:
+            return
+
+        accumulation = self.loop_index(node).accumulation(node, operands)
+        if accumulation is not None:
+            accumulator, context = accumulation
+            self.add_message(
+                "pandas-concat-in-loop",
+                node=node,
+                args=(accumulator, f"{call_name.tail}()", context.lineno),
+                confidence=HIGH,
+            )
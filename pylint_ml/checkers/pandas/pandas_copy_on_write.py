@@ -0,0 +1,190 @@
+# Licensed under the MIT: https://mit-license.org/
+# For details: https://github.com/pylint-dev/pylint-ml/LICENSE
+# Copyright (c) https://github.com/pylint-dev/pylint-ml/CONTRIBUTORS.txt
+
+"""Check for code that copies DataFrames needlessly or writes to copies under copy-on-write.
+
+With copy-on-write, the default from pandas 3.0, every selection behaves like a copy that
+shares memory with its parent until one of them is written to. Before pandas 3.0 it is turned
+on with ``pd.options.mode.copy_on_write = True`` or ``pd.set_option("mode.copy_on_write", True)``.
+"""
+
+from __future__ import annotations
+
+from astroid import nodes
+from astroid.const import Context
+from pylint.checkers.utils import only_required_for_messages
+from pylint.interfaces import HIGH
+
+from pylint_ml.util import rule_database
+from pylint_ml.util.call_name import dotted_name, get_call_name
+from pylint_ml.util.def_use import ESCAPED, INDEXERS, MUTATED, bound_name, use_kind, uses
+from pylint_ml.util.import_table import ImportTable
+from pylint_ml.util.library_handler import LibraryHandler, only_if_library_imported
+from pylint_ml.util.type_inference import DATAFRAME, SERIES
+
+_PANDAS_TYPES = (DATAFRAME, SERIES)
+
+# Functions that set a pandas option, with its name and value as the first two arguments
+_SET_OPTION = {"pandas.set_option", "pandas.option_context"}
+
+
+class PandasCopyOnWriteChecker(LibraryHandler):
+    name = "pandas-copy-on-write"
+    library = "pandas"
+    msgs = {
+        "W8108": (
+            "Chained assignment to '%s' writes to a temporary copy, set the value with a single .loc[] on '%s'",
+            "pandas-chained-assignment",
+            "Under copy-on-write the first selection of a chained assignment returns a new object, so the "
+            "assignment copies it and never updates the original DataFrame.",
+        ),
+        "W8110": (
+            "'%s' is a copy of '%s' that is never modified, drop the .copy()",
+            "pandas-redundant-copy",
+            "Under copy-on-write a selection or plain assignment already behaves like a copy and only "
+            "copies its data when it is written to. A defensive .copy() of a value that is only read "
+            "doubles its memory for nothing.",
+        ),
+        "W8111": (
+            "Slice '%s' of '%s' is modified at line %s while '%s' is still used, the write copies the slice",
+            "pandas-modified-slice",
+            "Writing to a selection copies its data under copy-on-write, and both copies stay in memory while "
+            "the parent is used. Assign through .loc[] on the parent if it should change, or select only "
+            "the rows and columns the modified copy needs.",
+        ),
+    }
+
+    def __init__(self, linter):
+        super().__init__(linter)
+        # The module looked at last and whether it turns copy-on-write on
+        self._copy_on_write: tuple[nodes.Module | None, bool] = (None, False)
+
+    def copy_on_write(self, node: nodes.NodeNG) -> bool:
+        """Whether ``node`` runs under copy-on-write, with pandas 3.0 or later or when its module turns it on."""
+        version = rule_database.installed_version("pandas")
+        if version is not None and version >= (3,):
+            return True
+        module = node.root()
+        if self._copy_on_write[0] is not module:
+            self._copy_on_write = (module, _enables_copy_on_write(module, self.import_table(node)))
+        return self._copy_on_write[1]
+
+    @only_required_for_messages("pandas-chained-assignment")
+    @only_if_library_imported
+    def visit_subscript(self, node: nodes.Subscript) -> None:
+        if node.ctx != Context.Store:
+            return
+        # ``df[mask]`` in ``df[mask]["col"] = 0`` or ``df["col"].loc[0] = 0``
+        selection = _strip_indexer(node.value)
+        if not isinstance(selection, nodes.Subscript):
+            return
+        self.rule_matched()
+        frame = _strip_indexer(selection.value)
+        if self.inferred_type(frame) in _PANDAS_TYPES:
+            self.add_message(
+                "pandas-chained-assignment",
+                node=node,
+                args=(node.as_string(), frame.as_string()),
+                confidence=HIGH,
+            )
+
+    @only_required_for_messages("pandas-redundant-copy")
+    @only_if_library_imported
+    def visit_call(self, node: nodes.Call) -> None:
+        func = node.func
+        if (
+            not isinstance(func, nodes.Attribute)
+            or func.attrname != "copy"
+            or node.args
+            # A shallow copy shares the data anyway
+            or any(keyword.arg != "deep" or _is_false(keyword.value) for keyword in node.keywords)
+        ):
+            return
+        binding = bound_name(node)
+        if binding is None or self.inferred_type(func.expr) not in _PANDAS_TYPES:
+            return
+        self.rule_matched()
+        # Without copy-on-write selections can be views, which a copy keeps from changing the original
+        if not self.copy_on_write(node):
+            return
+        imports = self.import_table(node)
+        if _writes(binding, imports) or any(use_kind(use, imports) == ESCAPED for use in uses(binding)):
+            return
+        # A copy that protects against later writes to the original is not needed either, but it
+        # only costs the memory the write would allocate anyway
+        if isinstance(func.expr, nodes.Name) and any(
+            line > node.lineno for original in _bindings(func.expr) for line in _writes(original, imports)
+        ):
+            return
+        self.add_message(
+            "pandas-redundant-copy",
+            node=node,
+            args=(binding.name, func.expr.as_string()),
+            confidence=HIGH,
+        )
+
+    @only_required_for_messages("pandas-modified-slice")
+    @only_if_library_imported
+    def visit_assign(self, node: nodes.Assign) -> None:
+        if not isinstance(node.value, nodes.Subscript):
+            return
+        binding = bound_name(node.value)
+        frame = _strip_indexer(node.value.value)
+        if binding is None or not isinstance(frame, nodes.Name) or self.inferred_type(frame) not in _PANDAS_TYPES:
+            return
+        self.rule_matched()
+        writes = _writes(binding, self.import_table(node))
+        if not writes:
+            return
+        # Without later reads of the parent its memory can be freed, and nothing is doubled
+        if any(use.lineno > min(writes) for original in _bindings(frame) for use in uses(original)):
+            self.add_message(
+                "pandas-modified-slice",
+                node=node.value,
+                args=(binding.name, frame.name, min(writes), frame.name),
+                confidence=HIGH,
+            )
+
+
+def _strip_indexer(node: nodes.NodeNG) -> nodes.NodeNG:
+    """``df`` in ``df.loc``."""
+    if isinstance(node, nodes.Attribute) and node.attrname in INDEXERS:
+        return node.expr
+    return node
+
+
+def _is_false(node: nodes.NodeNG) -> bool:
+    return isinstance(node, nodes.Const) and not node.value
+
+
+def _enables_copy_on_write(module: nodes.Module, imports: ImportTable) -> bool:
+    """Whether ``module`` sets the ``mode.copy_on_write`` option of pandas to ``True``."""
+    for node in module.nodes_of_class((nodes.AssignAttr, nodes.Call)):
+        if isinstance(node, nodes.AssignAttr):
+            option = node.attrname if imports.qualify(dotted_name(node.expr)) == "pandas.options.mode" else None
+            value = node.parent.value if isinstance(node.parent, nodes.Assign) else None
+        elif imports.qualify(get_call_name(node)) in _SET_OPTION and len(node.args) == 2:
+            name, value = node.args
+            option = name.value if isinstance(name, nodes.Const) else None
+        else:
+            continue
+        if option in ("copy_on_write", "mode.copy_on_write") and isinstance(value, nodes.Const) and value.value is True:
+            return True
+    return False
+
+
+def _bindings(name: nodes.Name) -> list[nodes.AssignName]:
+    return [binding for binding in name.lookup(name.name)[1] if isinstance(binding, nodes.AssignName)]
+
+
+def _writes(binding: nodes.AssignName, imports: ImportTable) -> list[int]:
+    """Lines where the value of ``binding`` is written to in place."""
+    lines = [use.lineno for use in uses(binding) if use_kind(use, imports) == MUTATED]
+    # ``df += 1`` changes the frame in place
+    lines.extend(
+        other.lineno
+        for other in binding.scope().locals.get(binding.name, ())
+        if isinstance(other.parent, nodes.AugAssign) and binding in other.lookup(other.name)[1]
+    )
+    return lines
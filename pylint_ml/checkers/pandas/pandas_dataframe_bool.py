@@ -7,15 +7,18 @@
 from __future__ import annotations
 
 from astroid import nodes
-from pylint.checkers import BaseChecker
 from pylint.checkers.utils import only_required_for_messages
 from pylint.interfaces import HIGH
 
+from pylint_ml.util.library_handler import LibraryHandler, only_if_library_imported
+from pylint_ml.util.type_inference import DATAFRAME
+
 # Todo add version deprecated
 
 
-class PandasDataFrameBoolChecker(BaseChecker):
+class PandasDataFrameBoolChecker(LibraryHandler):
     name = "pandas-dataframe-bool"
+    library = "pandas"
     msgs = {
         "W8104": (
             "Use of deprecated pandas DataFrame.bool() method",
@@ -25,17 +28,10 @@ class PandasDataFrameBoolChecker(BaseChecker):
     }
 
     @only_required_for_messages("pandas-dataframe-bool")
+    @only_if_library_imported
     def visit_call(self, node: nodes.Call) -> None:
         if isinstance(node.func, nodes.Attribute):
             method_name = getattr(node.func, "attrname", None)
 
-            if method_name == "bool":
-                # Check if the object calling .bool() has a name starting with 'df_'
-                object_name = getattr(node.func.expr, "name", None)
-                if object_name and self._is_valid_dataframe_name(object_name):
-                    self.add_message("pandas-dataframe-bool", node=node, confidence=HIGH)
-
-    @staticmethod
-    def _is_valid_dataframe_name(name: str) -> bool:
-        """Check if the DataFrame name starts with 'df_'."""
-        return name.startswith("df_")
+            if method_name == "bool" and self.inferred_type(node.func.expr) == DATAFRAME:
+                self.add_message("pandas-dataframe-bool", node=node, confidence=HIGH)
@@ -7,13 +7,39 @@
 from __future__ import annotations
 
 from astroid import nodes
-from pylint.checkers import BaseChecker
 from pylint.checkers.utils import only_required_for_messages
 from pylint.interfaces import HIGH
 
+from pylint_ml.util.library_handler import LibraryHandler, only_if_library_imported
+from pylint_ml.util.type_inference import DATAFRAME
 
-class PandasColumnSelectionChecker(BaseChecker):
+# Attributes of DataFrame itself, which are not columns
+_DATAFRAME_ATTRIBUTES = {
+    "T",
+    "at",
+    "attrs",
+    "axes",
+    "columns",
+    "dtypes",
+    "empty",
+    "flags",
+    "iat",
+    "iloc",
+    "index",
+    "loc",
+    "ndim",
+    "plot",
+    "shape",
+    "size",
+    "sparse",
+    "style",
+    "values",
+}
+
+
+class PandasColumnSelectionChecker(LibraryHandler):
     name = "pandas-column-selection"
+    library = "pandas"
     msgs = {
         "W8118": (
             "Use dictionary-like column selection (df['column']) instead of property-like selection (df.column).",
@@ -23,8 +49,12 @@ class PandasColumnSelectionChecker(BaseChecker):
     }
 
     @only_required_for_messages("pandas-column-selection")
+    @only_if_library_imported
     def visit_attribute(self, node: nodes.Attribute) -> None:
         """Check for attribute access that might be a column selection."""
-        if isinstance(node.expr, nodes.Name) and node.expr.name.startswith("df_"):
+        if isinstance(node.parent, nodes.Call) and node.parent.func is node:
+            # A method call
+            return
+        if node.attrname not in _DATAFRAME_ATTRIBUTES and self.inferred_type(node.expr) == DATAFRAME:
             # Issue a warning for property-like access
             self.add_message("pandas-column-selection", node=node, confidence=HIGH)
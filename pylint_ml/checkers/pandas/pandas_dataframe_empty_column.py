@@ -7,13 +7,16 @@
 from __future__ import annotations
 
 from astroid import nodes
-from pylint.checkers import BaseChecker
 from pylint.checkers.utils import only_required_for_messages
 from pylint.interfaces import HIGH
 
+from pylint_ml.util.library_handler import LibraryHandler, only_if_library_imported
+from pylint_ml.util.type_inference import DATAFRAME
 
-class PandasEmptyColumnChecker(BaseChecker):
+
+class PandasEmptyColumnChecker(LibraryHandler):
     name = "pandas-dataframe-empty-column"
+    library = "pandas"
     msgs = {
         "W8113": (
             "Avoid using filler values (0, '') for new empty columns. Use 'np.nan' or 'pd.Series(dtype=...)' instead.",
@@ -24,8 +27,9 @@ class PandasEmptyColumnChecker(BaseChecker):
     }
 
     @only_required_for_messages("pandas-dataframe-empty-column")
+    @only_if_library_imported
     def visit_subscript(self, node: nodes.Subscript) -> None:
-        if isinstance(node.value, nodes.Name) and node.value.name.startswith("df_"):
+        if isinstance(node.value, nodes.Name) and self.inferred_type(node.value) == DATAFRAME:
             if isinstance(node.slice, nodes.Const) and isinstance(node.parent, nodes.Assign):
                 if isinstance(node.parent.value, nodes.Const):
                     # Checking for filler values: 0 or empty string
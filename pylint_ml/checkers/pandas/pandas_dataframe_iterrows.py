@@ -7,13 +7,16 @@
 from __future__ import annotations
 
 from astroid import nodes
-from pylint.checkers import BaseChecker
 from pylint.checkers.utils import only_required_for_messages
 from pylint.interfaces import HIGH
 
+from pylint_ml.util.library_handler import LibraryHandler, only_if_library_imported
+from pylint_ml.util.type_inference import DATAFRAME
 
-class PandasIterrowsChecker(BaseChecker):
+
+class PandasIterrowsChecker(LibraryHandler):
     name = "pandas-iterrows"
+    library = "pandas"
     msgs = {
         "W8106": (
             "Usage of pandas DataFrame.iterrows() detected",
@@ -24,15 +27,9 @@ class PandasIterrowsChecker(BaseChecker):
     }
 
     @only_required_for_messages("pandas-iterrows")
+    @only_if_library_imported
     def visit_call(self, node: nodes.Call) -> None:
         if isinstance(node.func, nodes.Attribute):
             method_name = getattr(node.func, "attrname", None)
-            if method_name == "iterrows":
-                object_name = getattr(node.func.expr, "name", None)
-                if object_name and self._is_dataframe_name(object_name):
-                    self.add_message("pandas-iterrows", node=node, confidence=HIGH)
-
-    @staticmethod
-    def _is_dataframe_name(name: str) -> bool:
-        """Check if the object name suggests it's a DataFrame (e.g., starts with 'df_')."""
-        return name.startswith("df_")
+            if method_name == "iterrows" and self.inferred_type(node.func.expr) == DATAFRAME:
+                self.add_message("pandas-iterrows", node=node, confidence=HIGH)
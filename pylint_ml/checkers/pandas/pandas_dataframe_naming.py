@@ -7,13 +7,16 @@
 from __future__ import annotations
 
 from astroid import nodes
-from pylint.checkers import BaseChecker
 from pylint.checkers.utils import only_required_for_messages
 from pylint.interfaces import HIGH
 
+from pylint_ml.util.call_name import get_call_name
+from pylint_ml.util.library_handler import LibraryHandler, only_if_library_imported
 
-class PandasDataFrameNamingChecker(BaseChecker):
+
+class PandasDataFrameNamingChecker(LibraryHandler):
     name = "pandas-dataframe-naming"
+    library = "pandas"
     msgs = {
         "W8103": (
             "Pandas DataFrame variable names should start with 'df_' followed by descriptive text",
@@ -23,12 +26,12 @@ class PandasDataFrameNamingChecker(BaseChecker):
     }
 
     @only_required_for_messages("pandas-dataframe-naming")
+    @only_if_library_imported
     def visit_assign(self, node: nodes.Assign) -> None:
         if isinstance(node.value, nodes.Call):
-            func_name = getattr(node.value.func, "attrname", None)
-            module_name = getattr(node.value.func.expr, "name", None)
+            call = get_call_name(node.value)
 
-            if func_name == "DataFrame" and module_name == "pd":
+            if self.import_table(node).qualify(call) == "pandas.DataFrame":
                 for target in node.targets:
                     if isinstance(target, nodes.AssignName):
                         var_name = target.name
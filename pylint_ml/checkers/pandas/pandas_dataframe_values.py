@@ -7,13 +7,16 @@
 from __future__ import annotations
 
 from astroid import nodes
-from pylint.checkers import BaseChecker
 from pylint.checkers.utils import only_required_for_messages
 from pylint.interfaces import HIGH
 
+from pylint_ml.util.library_handler import LibraryHandler, only_if_library_imported
+from pylint_ml.util.type_inference import DATAFRAME
 
-class PandasValuesChecker(BaseChecker):
+
+class PandasValuesChecker(LibraryHandler):
     name = "pandas-dataframe-values"
+    library = "pandas"
     msgs = {
         "W8112": (
             "Avoid using 'DataFrame.values'. Use '.to_numpy()' instead for better consistency and compatibility.",
@@ -24,7 +27,7 @@ class PandasValuesChecker(BaseChecker):
     }
 
     @only_required_for_messages("pandas-dataframe-values")
+    @only_if_library_imported
     def visit_attribute(self, node: nodes.Attribute) -> None:
-        if isinstance(node.expr, nodes.Name):
-            if node.attrname == "values" and node.expr.name.startswith("df_"):
-                self.add_message("pandas-dataframe-values", node=node, confidence=HIGH)
+        if node.attrname == "values" and self.inferred_type(node.expr) == DATAFRAME:
+            self.add_message("pandas-dataframe-values", node=node, confidence=HIGH)
@@ -7,13 +7,15 @@
 from __future__ import annotations
 
 from astroid import nodes
-from pylint.checkers import BaseChecker
 from pylint.checkers.utils import only_required_for_messages
 from pylint.interfaces import HIGH
 
+from pylint_ml.util.library_handler import LibraryHandler, only_if_library_imported
 
-class PandasImportChecker(BaseChecker):
+
+class PandasImportChecker(LibraryHandler):
     name = "pandas-import"
+    library = "pandas"
     msgs = {
         "W8101": (
             "Pandas imported with incorrect alias",
@@ -33,12 +35,14 @@ class PandasImportChecker(BaseChecker):
     }
 
     @only_required_for_messages("pandas-import")
+    @only_if_library_imported
     def visit_import(self, node: nodes.Import) -> None:
         for name, alias in node.names:
             if name == "pandas" and alias != "pd":
                 self.add_message("pandas-import", node=node, confidence=HIGH)
 
     @only_required_for_messages("pandas-importfrom")
+    @only_if_library_imported
     def visit_importfrom(self, node: nodes.ImportFrom) -> None:
         if node.modname == "pandas":
             self.add_message("pandas-importfrom", node=node, confidence=HIGH)
@@ -7,13 +7,15 @@
 from __future__ import annotations
 
 from astroid import nodes
-from pylint.checkers import BaseChecker
 from pylint.checkers.utils import only_required_for_messages
 from pylint.interfaces import HIGH
 
+from pylint_ml.util.library_handler import LibraryHandler, only_if_library_imported
 
-class PandasInplaceChecker(BaseChecker):
+
+class PandasInplaceChecker(LibraryHandler):
     name = "pandas-inplace"
+    library = "pandas"
     msgs = {
         "W8109": (
             "Avoid using 'inplace=True' in pandas operations.",
@@ -38,6 +40,7 @@ class PandasInplaceChecker(BaseChecker):
     }
 
     @only_required_for_messages("pandas-inplace")
+    @only_if_library_imported
     def visit_call(self, node: nodes.Call) -> None:
         # Check if the call is to a method that supports 'inplace'
         if isinstance(node.func, nodes.Attribute):
@@ -0,0 +1,249 @@
+# Licensed under the MIT: https://mit-license.org/
+# For details: https://github.com/pylint-dev/pylint-ml/LICENSE
+# Copyright (c) https://github.com/pylint-dev/pylint-ml/CONTRIBUTORS.txt
+
+"""Check for files read into DataFrames in full when only part of them is used."""
+
+from __future__ import annotations
+
+from astroid import nodes
+from astroid.const import Context
+from pylint.checkers.utils import only_required_for_messages
+from pylint.interfaces import HIGH
+
+from pylint_ml.util.call_name import get_call_name
+from pylint_ml.util.def_use import bound_name, uses
+from pylint_ml.util.library_handler import LibraryHandler, only_if_library_imported
+from pylint_ml.util.type_inference import is_row_filter
+
+# Keyword of each reader that selects the columns to read
+_COLUMN_KEYWORDS = {
+    "pandas.read_csv": "usecols",
+    "pandas.read_excel": "usecols",
+    "pandas.read_feather": "columns",
+    "pandas.read_orc": "columns",
+    "pandas.read_parquet": "columns",
+    "pandas.read_table": "usecols",
+}
+
+_CHUNKED = "read it with chunksize= and filter every chunk, or use engine='pyarrow'"
+
+# How to avoid loading the rows a reader's result is filtered down to, and the keywords that
+# already do so
+_FILTERED_READS = {
+    "pandas.read_csv": (("chunksize", "iterator"), _CHUNKED),
+    "pandas.read_table": (("chunksize", "iterator"), _CHUNKED),
+    "pandas.read_parquet": (("filters",), "push the filter down into the reader with filters="),
+}
+
+# Row selections that keep every column of the frame
+_ROW_METHODS = {"copy", "head", "sample", "tail"}
+
+
+class ColumnUsage:
+    """Columns of a DataFrame that are read, following it through row selections.
+
+    ``columns`` becomes ``None`` as soon as a use needs every column or cannot be followed,
+    e.g. when the frame is returned or passed to a function. Columns the code creates are not
+    counted.
+    """
+
+    def __init__(self) -> None:
+        # Where each column is first read, to list them in source order
+        self._read: dict[str, tuple[int, int]] | None = {}
+        self._created: set[str] = set()
+        self._followed: set[nodes.AssignName] = set()
+
+    @property
+    def columns(self) -> list[str] | None:
+        if self._read is None:
+            return None
+        return sorted(self._read, key=self._read.__getitem__)
+
+    def binding(self, binding: nodes.AssignName) -> None:
+        if binding in self._followed:
+            return
+        self._followed.add(binding)
+        for use in uses(binding):
+            if self._read is None:
+                return
+            self.use(use)
+
+    def add(self, key: nodes.NodeNG | None) -> None:
+        columns = column_keys(key)
+        if columns is None or self._read is None:
+            self._read = None
+            return
+        for column in columns:
+            if column not in self._created:
+                self._read.setdefault(column, (key.lineno, key.col_offset))
+
+    def fail(self) -> None:
+        self._read = None
+
+    def use(self, node: nodes.NodeNG) -> None:
+        """Record the columns the expression around the frame ``node`` reads."""
+        parent = node.parent
+        if isinstance(parent, nodes.Subscript) and parent.value is node:
+            self.subscript(parent, parent.slice)
+        elif isinstance(parent, nodes.Attribute) and parent.expr is node:
+            self.attribute(parent)
+        elif not (isinstance(parent, nodes.Call) and _is_len(parent) and node in parent.args):
+            self.fail()
+
+    def subscript(self, node: nodes.Subscript, key: nodes.NodeNG) -> None:
+        """``df[key]`` or ``df.loc[rows, key]``."""
+        if node.ctx == Context.Load:
+            if column_keys(key) is not None:
+                self.add(key)
+            elif is_row_filter(key):
+                self.rows(node)
+            else:
+                self.fail()
+        elif isinstance(node.parent, nodes.AugAssign):
+            # ``df["total"] += 1`` reads the column it writes
+            self.add(key)
+        elif column_keys(key) is None:
+            self.fail()
+        elif node.ctx == Context.Store:
+            # A column written before it is read needs nothing from the file
+            self._created.update(column_keys(key))
+
+    def attribute(self, node: nodes.Attribute) -> None:
+        parent = node.parent
+        if node.attrname in ("index", "empty"):
+            return
+        if node.attrname == "loc" and isinstance(parent, nodes.Subscript) and parent.value is node:
+            key = parent.slice
+            if isinstance(key, nodes.Tuple) and len(key.elts) == 2:
+                # The rows are selected with reads of the frame that are followed on their own
+                self.subscript(parent, key.elts[1])
+            elif is_row_filter(key) and parent.ctx == Context.Load:
+                self.rows(parent)
+            else:
+                self.fail()
+            return
+        if not (isinstance(parent, nodes.Call) and parent.func is node):
+            self.fail()
+        elif node.attrname in _ROW_METHODS:
+            self.rows(parent)
+        elif node.attrname == "sort_values":
+            self.add(_argument(parent, 0, "by"))
+            self.rows(parent)
+        elif node.attrname == "groupby":
+            # Only ``df.groupby(keys)[columns]`` does not aggregate every column
+            self.add(_argument(parent, 0, "by"))
+            selection = parent.parent
+            if isinstance(selection, nodes.Subscript) and selection.value is parent:
+                self.add(selection.slice)
+            else:
+                self.fail()
+        else:
+            self.fail()
+
+    def rows(self, node: nodes.NodeNG) -> None:
+        """Follow a selection of rows, which has every column of the frame."""
+        binding = bound_name(node)
+        if binding is not None:
+            self.binding(binding)
+        else:
+            self.use(node)
+
+
+def column_keys(node: nodes.NodeNG | None) -> list[str] | None:
+    """Column names of a key such as ``"price"`` or ``["price", "quantity"]``."""
+    if isinstance(node, nodes.Const) and isinstance(node.value, str):
+        return [node.value]
+    if isinstance(node, nodes.List) and node.elts:
+        keys = [column_keys(elt) for elt in node.elts]
+        if all(key is not None for key in keys):
+            return [key[0] for key in keys]
+    return None
+
+
+def _is_len(call: nodes.Call) -> bool:
+    call_name = get_call_name(call)
+    return call_name.root == "len" and not call_name.attrs
+
+
+def _argument(call: nodes.Call, position: int, keyword: str) -> nodes.NodeNG | None:
+    if len(call.args) > position:
+        return call.args[position]
+    return next((kw.value for kw in call.keywords if kw.arg == keyword), None)
+
+
+class PandasReadEfficiencyChecker(LibraryHandler):
+    name = "pandas-read-efficiency"
+    library = "pandas"
+    msgs = {
+        "W8121": (
+            "Pass %s=%s to %s(), '%s' only uses these columns",
+            "pandas-read-unused-columns",
+            "Reading only the columns that are used cuts both the time to parse the file and the memory "
+            "the DataFrame takes.",
+        ),
+        "W8123": (
+            "'%s' is filtered right after %s() reads the whole file, %s",
+            "pandas-read-then-filter",
+            "Loading every row of a large file and then keeping a few of them needs memory for all of "
+            "them at once. Reading the file in chunks, or letting the reader skip the rows, avoids the "
+            "spike.",
+        ),
+    }
+
+    @only_required_for_messages("pandas-read-unused-columns", "pandas-read-then-filter")
+    @only_if_library_imported
+    def visit_call(self, node: nodes.Call) -> None:
+        call_name = get_call_name(node)
+        if not call_name.tail or not call_name.tail.startswith("read_"):
+            return
+        binding = bound_name(node)
+        if binding is None:
+            return
+        qualified_name = self.import_table(node).qualify(call_name)
+        keywords = {keyword.arg for keyword in node.keywords}
+        keyword = _COLUMN_KEYWORDS.get(qualified_name)
+        if keyword is not None and keyword not in keywords:
+            self.rule_matched()
+            usage = ColumnUsage()
+            usage.binding(binding)
+            if usage.columns:
+                index = next((keyword.value for keyword in node.keywords if keyword.arg == "index_col"), None)
+                columns = (column_keys(index) or []) + usage.columns
+                suggestion = repr(list(dict.fromkeys(columns)))
+                self.add_message(
+                    "pandas-read-unused-columns",
+                    node=node,
+                    args=(keyword, suggestion, call_name.tail, binding.name),
+                    confidence=HIGH,
+                )
+        if qualified_name in _FILTERED_READS:
+            self.rule_matched()
+            pushed_down, suggestion = _FILTERED_READS[qualified_name]
+            if keywords.isdisjoint(pushed_down) and _filtered_right_away(binding):
+                self.add_message(
+                    "pandas-read-then-filter",
+                    node=node,
+                    args=(binding.name, call_name.tail, suggestion),
+                    confidence=HIGH,
+                )
+
+
+def _filtered_right_away(binding: nodes.AssignName) -> bool:
+    """Whether the only use of the frame is a selection of rows in the next statement."""
+    following = binding.statement().next_sibling()
+    reads = uses(binding)
+    if not isinstance(following, nodes.Assign) or not reads or any(read.statement() is not following for read in reads):
+        return False
+    receiver = reads[0]
+    selection = receiver.parent
+    if isinstance(selection, nodes.Attribute) and selection.attrname == "query":
+        selection = selection.parent if isinstance(selection.parent, nodes.Call) else None
+    elif isinstance(selection, nodes.Attribute) and selection.attrname == "loc":
+        selection = selection.parent
+        key = selection.slice if isinstance(selection, nodes.Subscript) else None
+        if not is_row_filter(key.elts[0] if isinstance(key, nodes.Tuple) and key.elts else key):
+            return False
+    elif not (isinstance(selection, nodes.Subscript) and is_row_filter(selection.slice)):
+        return False
+    return selection is following.value
@@ -0,0 +1,363 @@
+# Licensed under the MIT: https://mit-license.org/
+# For details: https://github.com/pylint-dev/pylint-ml/LICENSE
+# Copyright (c) https://github.com/pylint-dev/pylint-ml/CONTRIBUTORS.txt
+
+"""Check for row-wise iteration over DataFrames whose body could work on whole columns."""
+
+from __future__ import annotations
+
+from astroid import nodes
+from pylint.checkers.utils import only_required_for_messages
+from pylint.interfaces import HIGH
+
+from pylint_ml.util.call_name import get_call_name
+from pylint_ml.util.library_handler import LibraryHandler, only_if_library_imported
+from pylint_ml.util.loop_index import range_len_argument
+from pylint_ml.util.type_inference import DATAFRAME
+
+ARITHMETIC = "arithmetic"
+CONDITIONAL = "conditional assignment"
+STRING = "string operations"
+PREVIOUS_ROW = "reads of the previous row"
+RUNNING_TOTAL = "running totals"
+
+# How to vectorize each kind of body, and the speedup that usually gives over a row-wise loop
+_VECTORIZED = {
+    ARITHMETIC: ("column arithmetic and reductions", "10-100x"),
+    CONDITIONAL: ("np.where or Series.mask", "10-100x"),
+    STRING: ("the .str accessor", "2-10x"),
+    PREVIOUS_ROW: ("Series.shift() or Series.diff()", "10-100x"),
+    RUNNING_TOTAL: ("Series.cumsum()", "10-100x"),
+}
+
+_STR_METHODS = {
+    "capitalize",
+    "casefold",
+    "contains",
+    "count",
+    "endswith",
+    "find",
+    "format",
+    "join",
+    "lower",
+    "lstrip",
+    "replace",
+    "rstrip",
+    "split",
+    "startswith",
+    "strip",
+    "title",
+    "upper",
+    "zfill",
+}
+_NUMERIC_BUILTINS = {"abs", "float", "int", "max", "min", "round"}
+
+# Accessors that read one cell when indexed with the row label: ``df.loc[i, "col"]``
+_CELL_ACCESSORS = {"at", "iat", "iloc", "loc"}
+
+
+class RowBody:
+    """Classify what the body of a row-wise loop or ``apply`` function does with each row.
+
+    ``rows`` are the names bound to the current row, ``index`` the name of the row label in
+    ``for i in range(len(df))`` loops over ``frame``. Bodies may read the previous row, as
+    ``df.loc[i - 1, "close"]`` or a ``previous = row.close`` kept from the last iteration, and
+    running totals kept with ``total += row.amount``. Returns ``None`` for bodies that depend
+    on other rows in other ways or call arbitrary code.
+    """
+
+    def __init__(self, checker: PandasRowIterationChecker, rows: set[str], frame: str | None, index: str | None):
+        self.checker = checker
+        self.rows = rows
+        self.frame = frame
+        self.index = index
+        self.kinds: set[str] = set()
+        # Temporaries assigned so far, and every name the body assigns with what it carries to the next
+        # iteration, if that has a column-wise rewrite
+        self.assigned: set[str] = set()
+        self.carried: dict[str, str | None] = {}
+
+    def classify(self, body: list[nodes.NodeNG]) -> str | None:
+        carries: dict[str, set[str | None]] = {}
+        for statement in body:
+            for name in statement.nodes_of_class(nodes.AssignName):
+                carries.setdefault(name.name, set()).add(self.carries(name))
+        self.carried = {name: kinds.pop() if len(kinds) == 1 else None for name, kinds in carries.items()}
+        if not self.statements(body):
+            return None
+        return self.kind()
+
+    def classify_expression(self, node: nodes.NodeNG) -> str | None:
+        """Classify the body of a lambda."""
+        if not self.expression(node):
+            return None
+        return self.kind()
+
+    def carries(self, node: nodes.AssignName) -> str | None:
+        """What the assignment to ``node`` carries to the next iteration.
+
+        ``previous = row.close`` keeps the previous row and ``total += row.amount`` a running total.
+        """
+        statement = node.parent
+        if isinstance(statement, nodes.AugAssign) and statement.op == "+=":
+            # Not ``balance += balance * row.rate``
+            reads = {name.name for name in statement.value.nodes_of_class(nodes.Name)}
+            return RUNNING_TOTAL if node.name not in reads else None
+        if isinstance(statement, nodes.Assign) and self.is_cell(statement.value):
+            return PREVIOUS_ROW
+        return None
+
+    def kind(self) -> str:
+        for kind in (PREVIOUS_ROW, RUNNING_TOTAL, STRING, CONDITIONAL):
+            if kind in self.kinds:
+                return kind
+        return ARITHMETIC
+
+    def statements(self, body: list[nodes.NodeNG]) -> bool:
+        for statement in body:
+            if isinstance(statement, nodes.If):
+                self.kinds.add(CONDITIONAL)
+                if not (self.expression(statement.test) and self.statements(statement.body + statement.orelse)):
+                    return False
+            elif isinstance(statement, nodes.Assign) and len(statement.targets) == 1:
+                target = statement.targets[0]
+                if not self.expression(statement.value):
+                    return False
+                if isinstance(target, nodes.AssignName):
+                    self.assigned.add(target.name)
+                elif not (isinstance(target, nodes.Subscript) and self.subscript_is_row_bound(target)):
+                    return False
+            elif isinstance(statement, nodes.AugAssign) and isinstance(statement.target, nodes.AssignName):
+                # A reduction such as ``total += row.amount``
+                self.kinds.add(ARITHMETIC)
+                if not self.expression(statement.value):
+                    return False
+            elif isinstance(statement, nodes.Expr) and _is_append(statement.value):
+                if not self.expression(statement.value.args[0]):
+                    return False
+            elif isinstance(statement, nodes.Return) and statement.value is not None:
+                if not self.expression(statement.value):
+                    return False
+            elif not isinstance(statement, nodes.Pass):
+                return False
+        return True
+
+    def subscript_is_row_bound(self, node: nodes.Subscript) -> bool:
+        """Whether the store into ``node`` only depends on the current row, e.g. ``df.loc[i, "total"]``."""
+        return (
+            all(self.expression(child) for child in node.slice.get_children())
+            if isinstance(node.slice, nodes.Tuple)
+            else self.expression(node.slice)
+        )
+
+    def expression(self, node: nodes.NodeNG) -> bool:
+        if isinstance(node, nodes.Const):
+            return True
+        if isinstance(node, nodes.Name):
+            if node.name in self.rows:
+                # The whole row is used, e.g. passed to a function
+                return False
+            if node.name in self.carried and node.name not in self.assigned:
+                # Assigned by an earlier iteration
+                kind = self.carried[node.name]
+                if kind is None:
+                    return False
+                self.kinds.add(kind)
+            return True
+        if self.is_cell(node):
+            return True
+        if self.is_previous_cell(node):
+            self.kinds.add(PREVIOUS_ROW)
+            return True
+        if isinstance(node, nodes.BinOp) and any(
+            isinstance(operand, nodes.Const) and isinstance(operand.value, str) for operand in (node.left, node.right)
+        ):
+            # ``row.first + " " + row.last``
+            self.kinds.add(STRING)
+        elif isinstance(node, (nodes.BinOp, nodes.UnaryOp, nodes.Compare, nodes.BoolOp)):
+            self.kinds.add(ARITHMETIC)
+        elif isinstance(node, nodes.IfExp):
+            self.kinds.add(CONDITIONAL)
+        elif isinstance(node, (nodes.JoinedStr, nodes.FormattedValue)):
+            self.kinds.add(STRING)
+        elif isinstance(node, nodes.Call):
+            return self.call(node)
+        elif not isinstance(node, (nodes.Tuple, nodes.List)):
+            return False
+        return all(self.expression(child) for child in node.get_children())
+
+    def call(self, node: nodes.Call) -> bool:
+        if node.keywords:
+            return False
+        call_name = get_call_name(node)
+        if isinstance(node.func, nodes.Attribute) and node.func.attrname in _STR_METHODS:
+            self.kinds.add(STRING)
+            arguments = [node.func.expr, *node.args]
+        elif call_name.root == "str" and not call_name.attrs:
+            self.kinds.add(STRING)
+            arguments = node.args
+        elif call_name.root in _NUMERIC_BUILTINS and not call_name.attrs:
+            self.kinds.add(ARITHMETIC)
+            arguments = node.args
+        else:
+            qualified_name = self.checker.import_table(node).qualify(call_name)
+            if qualified_name in ("numpy.where", "numpy.select"):
+                self.kinds.add(CONDITIONAL)
+            elif qualified_name is not None and qualified_name.split(".", 1)[0] in ("numpy", "math"):
+                self.kinds.add(ARITHMETIC)
+            else:
+                return False
+            arguments = node.args
+        return all(self.expression(argument) for argument in arguments)
+
+    def is_cell(self, node: nodes.NodeNG) -> bool:
+        """Whether ``node`` reads a field of the current row."""
+        if isinstance(node, nodes.Attribute):
+            # ``row.amount``
+            return isinstance(node.expr, nodes.Name) and node.expr.name in self.rows
+        if not isinstance(node, nodes.Subscript):
+            return False
+        value = node.value
+        if isinstance(value, nodes.Name) and value.name in self.rows:
+            # ``row["amount"]``
+            return isinstance(node.slice, nodes.Const)
+        label = self.cell_label(node)
+        return isinstance(label, nodes.Name) and label.name == self.index
+
+    def is_previous_cell(self, node: nodes.NodeNG) -> bool:
+        """Whether ``node`` reads a field of an earlier row, as ``df.loc[i - 1, "amount"]``."""
+        label = self.cell_label(node) if isinstance(node, nodes.Subscript) else None
+        if not (isinstance(label, nodes.BinOp) and label.op == "-" and isinstance(label.right, nodes.Const)):
+            return False
+        offset = label.right.value
+        return (
+            isinstance(label.left, nodes.Name)
+            and label.left.name == self.index
+            and isinstance(offset, int)
+            and offset > 0
+        )
+
+    def cell_label(self, node: nodes.Subscript) -> nodes.NodeNG | None:
+        """The row label of a read of one cell of ``frame``, ``i`` in ``df["amount"][i]`` or ``df.loc[i, "amount"]``."""
+        if self.index is None or self.frame is None:
+            return None
+        value = node.value
+        if isinstance(value, nodes.Subscript):
+            # ``df["amount"][i]``
+            if (
+                isinstance(value.value, nodes.Name)
+                and value.value.name == self.frame
+                and isinstance(value.slice, nodes.Const)
+            ):
+                return node.slice
+            return None
+        # ``df.loc[i, "amount"]``
+        if not (
+            isinstance(value, nodes.Attribute)
+            and value.attrname in _CELL_ACCESSORS
+            and isinstance(value.expr, nodes.Name)
+            and value.expr.name == self.frame
+        ):
+            return None
+        if (
+            isinstance(node.slice, nodes.Tuple)
+            and len(node.slice.elts) == 2
+            and isinstance(node.slice.elts[1], nodes.Const)
+        ):
+            return node.slice.elts[0]
+        return None
+
+
+class PandasRowIterationChecker(LibraryHandler):
+    name = "pandas-row-iteration"
+    library = "pandas"
+    msgs = {
+        "W8120": (
+            "Row-wise %s over '%s' only does %s, use %s for a %s speedup",
+            "pandas-row-iteration",
+            "Iterating over the rows of a DataFrame runs Python code for every row. Bodies that only combine "
+            "the fields of the current row can work on whole columns instead, reads of the previous row can use "
+            "Series.shift() and running totals Series.cumsum(). Bodies that read other rows in other ways, carry "
+            "other values between iterations or call other code have no such rewrite and are not reported.",
+        ),
+    }
+
+    @only_required_for_messages("pandas-row-iteration")
+    @only_if_library_imported
+    def visit_for(self, node: nodes.For) -> None:
+        if node.orelse or not isinstance(node.iter, nodes.Call):
+            return
+        call = node.iter
+        frame = None
+        index = None
+        rows: set[str] = set()
+        if isinstance(call.func, nodes.Attribute) and isinstance(call.func.expr, nodes.Name):
+            frame = call.func.expr
+            if call.func.attrname == "iterrows" and isinstance(node.target, nodes.Tuple):
+                rows = {elt.name for elt in node.target.elts[1:] if isinstance(elt, nodes.AssignName)}
+            elif call.func.attrname == "itertuples" and isinstance(node.target, nodes.AssignName):
+                rows = {node.target.name}
+            if not rows:
+                return
+            method = f"{call.func.attrname}()"
+        else:
+            frame = range_len_argument(call)
+            if frame is None or not isinstance(node.target, nodes.AssignName):
+                return
+            index = node.target.name
+            method = "loop over range(len())"
+        if self.inferred_type(frame) != DATAFRAME:
+            return
+        self._report(node, method, frame.name, RowBody(self, rows, frame.name, index).classify(node.body))
+
+    @only_required_for_messages("pandas-row-iteration")
+    @only_if_library_imported
+    def visit_call(self, node: nodes.Call) -> None:
+        func = node.func
+        if not _is_row_apply(node) or self.inferred_type(func.expr) != DATAFRAME:
+            return
+        function = node.args[0]
+        if isinstance(function, nodes.Name):
+            definitions = function.lookup(function.name)[1]
+            function = definitions[0] if len(definitions) == 1 else None
+        if not isinstance(function, (nodes.Lambda, nodes.FunctionDef)) or len(function.args.args) != 1:
+            return
+        body = RowBody(self, {function.args.args[0].name}, None, None)
+        if isinstance(function, nodes.FunctionDef):
+            kind = body.classify(function.body)
+        else:
+            kind = body.classify_expression(function.body)
+        self._report(node, "apply(axis=1)", func.expr.name, kind)
+
+    def _report(self, node: nodes.NodeNG, method: str, frame: str, kind: str | None) -> None:
+        self.rule_matched()
+        # Bodies that depend on other rows in other ways or call arbitrary code are not reported, see the description
+        if kind is not None:
+            vectorized, speedup = _VECTORIZED[kind]
+            self.add_message(
+                "pandas-row-iteration",
+                node=node,
+                args=(method, frame, kind, vectorized, speedup),
+                confidence=HIGH,
+            )
+
+
+def _is_append(node: nodes.NodeNG) -> bool:
+    return (
+        isinstance(node, nodes.Call)
+        and isinstance(node.func, nodes.Attribute)
+        and node.func.attrname == "append"
+        and len(node.args) == 1
+        and not node.keywords
+    )
+
+
+def _is_row_apply(node: nodes.Call) -> bool:
+    """Whether ``node`` is ``df.apply(function, axis=1)``."""
+    func = node.func
+    if not isinstance(func, nodes.Attribute) or func.attrname != "apply" or not isinstance(func.expr, nodes.Name):
+        return False
+    return len(node.args) == 1 and any(
+        keyword.arg == "axis" and isinstance(keyword.value, nodes.Const) and keyword.value.value in (1, "columns")
+        for keyword in node.keywords
+    )
@@ -7,15 +7,18 @@
 from __future__ import annotations
 
 from astroid import nodes
-from pylint.checkers import BaseChecker
 from pylint.checkers.utils import only_required_for_messages
 from pylint.interfaces import HIGH
 
+from pylint_ml.util.library_handler import LibraryHandler, only_if_library_imported
+from pylint_ml.util.type_inference import SERIES
+
 # Todo add version deprecated
 
 
-class PandasSeriesBoolChecker(BaseChecker):
+class PandasSeriesBoolChecker(LibraryHandler):
     name = "pandas-series-bool"
+    library = "pandas"
     msgs = {
         "W8105": (
             "Use of deprecated pandas Series.bool() method",
@@ -25,17 +28,10 @@ class PandasSeriesBoolChecker(BaseChecker):
     }
 
     @only_required_for_messages("pandas-series-bool")
+    @only_if_library_imported
     def visit_call(self, node: nodes.Call) -> None:
         if isinstance(node.func, nodes.Attribute):
             method_name = getattr(node.func, "attrname", None)
 
-            if method_name == "bool":
-                # Check if the object calling .bool() has a name starting with 'ser'
-                object_name = getattr(node.func.expr, "name", None)
-                if object_name and self._is_valid_series_name(object_name):
-                    self.add_message("pandas-series-bool", node=node, confidence=HIGH)
-
-    @staticmethod
-    def _is_valid_series_name(name: str) -> bool:
-        """Check if the Series name starts with 'ser_'."""
-        return name.startswith("ser_")
+            if method_name == "bool" and self.inferred_type(node.func.expr) == SERIES:
+                self.add_message("pandas-series-bool", node=node, confidence=HIGH)
@@ -7,15 +7,18 @@
 from __future__ import annotations
 
 from astroid import nodes
-from pylint.checkers import BaseChecker
 from pylint.checkers.utils import only_required_for_messages
 from pylint.interfaces import HIGH
 
+from pylint_ml.util.call_name import get_call_name
+from pylint_ml.util.library_handler import LibraryHandler, only_if_library_imported
 
-class PandasSeriesNamingChecker(BaseChecker):
+
+class PandasSeriesNamingChecker(LibraryHandler):
     name = "pandas-series-naming"
+    library = "pandas"
     msgs = {
-        "W8103": (
+        "W8107": (
             "Pandas Series variable names should start with 'ser_' followed by descriptive text",
             "pandas-series-naming",
             "Ensure that pandas Series variables follow the naming convention.",
@@ -23,12 +26,12 @@ class PandasSeriesNamingChecker(BaseChecker):
     }
 
     @only_required_for_messages("pandas-series-naming")
+    @only_if_library_imported
     def visit_assign(self, node: nodes.Assign) -> None:
         if isinstance(node.value, nodes.Call):
-            func_name = getattr(node.value.func, "attrname", None)
-            module_name = getattr(node.value.func.expr, "name", None)
+            call = get_call_name(node.value)
 
-            if func_name == "Series" and module_name == "pd":
+            if self.import_table(node).qualify(call) == "pandas.Series":
                 for target in node.targets:
                     if isinstance(target, nodes.AssignName):
                         var_name = target.name
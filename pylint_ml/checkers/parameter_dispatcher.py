@@ -0,0 +1,84 @@
+# Licensed under the MIT: https://mit-license.org/
+# For details: https://github.com/pylint-dev/pylint-ml/LICENSE
+# Copyright (c) https://github.com/pylint-dev/pylint-ml/CONTRIBUTORS.txt
+
+"""Visit every call once, match it against the rule database and dispatch the rules to the ``*_parameter`` rule sets."""
+
+from __future__ import annotations
+
+from astroid import nodes
+from pylint.checkers.utils import only_required_for_messages
+
+from pylint_ml.checkers.matplotlib.matplotlib_parameter import MatplotlibParameterChecker
+from pylint_ml.checkers.numpy.numpy_parameter import NumPyParameterChecker
+from pylint_ml.checkers.pandas.pandas_parameter import PandasParameterChecker
+from pylint_ml.checkers.scipy.scipy_parameter import ScipyParameterChecker
+from pylint_ml.checkers.sklearn.sklearn_parameter import SklearnParameterChecker
+from pylint_ml.checkers.tensorflow.tensor_parameter import TensorFlowParameterChecker
+from pylint_ml.checkers.torch.torch_parameter import PyTorchParameterChecker
+from pylint_ml.util import rule_database
+from pylint_ml.util.call_name import get_call_name
+from pylint_ml.util.library_handler import LibraryHandler, only_if_library_imported
+from pylint_ml.util.parameter_checker import ParameterChecker
+
+RULE_SETS: tuple[type[ParameterChecker], ...] = (
+    NumPyParameterChecker,
+    PandasParameterChecker,
+    ScipyParameterChecker,
+    SklearnParameterChecker,
+    TensorFlowParameterChecker,
+    PyTorchParameterChecker,
+    MatplotlibParameterChecker,
+)
+
+
+class ParameterDispatcher(LibraryHandler):
+    name = "ml-parameter"
+    msgs = {msgid: msg for rule_set in RULE_SETS for msgid, msg in rule_set.msgs.items()}
+
+    def __init__(self, linter):
+        super().__init__(linter)
+        self._rule_sets = [rule_set(linter) for rule_set in RULE_SETS]
+        self._enabled_rule_sets: dict[str, ParameterChecker] = {}
+        # Names that can match a rule, for every combination of imported libraries seen so far
+        self._tails_by_libraries: dict[frozenset[str], frozenset[str]] = {}
+        self._tails: frozenset[str] = frozenset()
+
+    def open(self) -> None:
+        super().open()
+        self._enabled_rule_sets = {
+            rule_set.library: rule_set
+            for rule_set in self._rule_sets
+            if self.linter.is_message_enabled(rule_set.message_symbol())
+        }
+        self._tails_by_libraries = {}
+        self._tails = self._rule_tails(frozenset(self._enabled_rule_sets))
+
+    def visit_module(self, node: nodes.Module) -> None:
+        super().visit_module(node)
+        if not self.library_active:
+            return
+        libraries = frozenset(
+            library for library in self._enabled_rule_sets if self._import_table.is_library_imported(library)
+        )
+        if libraries not in self._tails_by_libraries:
+            self._tails_by_libraries[libraries] = self._rule_tails(libraries)
+        self._tails = self._tails_by_libraries[libraries]
+        self.library_active = bool(self._tails)
+
+    @staticmethod
+    def _rule_tails(libraries: frozenset[str]) -> frozenset[str]:
+        """Names of the called functions that can match a rule of one of ``libraries``."""
+        tails = rule_database.rules().tails
+        return frozenset().union(*(tails.get(library, ()) for library in libraries))
+
+    @only_required_for_messages(*(rule_set.message_symbol() for rule_set in RULE_SETS))
+    @only_if_library_imported
+    def visit_call(self, node: nodes.Call) -> None:
+        call = get_call_name(node)
+        if call.tail not in self._tails:
+            return
+        for rule in rule_database.rules().match(call, self.import_table(node)):
+            rule_set = self._enabled_rule_sets.get(rule.library)
+            if rule_set is not None:
+                rule_set.check_rule(node, rule)
@@ -0,0 +1,53 @@
+# Licensed under the MIT: https://mit-license.org/
+# For details: https://github.com/pylint-dev/pylint-ml/LICENSE
+# Copyright (c) https://github.com/pylint-dev/pylint-ml/CONTRIBUTORS.txt
+
+"""Options of the instrumentation mode, which reports what every pylint-ml checker costs."""
+
+from __future__ import annotations
+
+from pylint.checkers import BaseChecker
+from pylint.lint import PyLinter
+
+from pylint_ml.util import profiler
+from pylint_ml.util.profiler import Profiler
+
+
+class ProfilerChecker(BaseChecker):
+    """Holds the profiling options and merges the statistics of ``pylint -j`` workers.
+
+    The library checkers instrument themselves when they are opened with ``ml-profile`` set, and
+    the last one to be closed reports the profile of a run without workers.
+    """
+
+    name = "ml-profiler"
+    options = (
+        (
+            "ml-profile",
+            {
+                "default": False,
+                "type": "yn",
+                "metavar": "<y or n>",
+                "help": "Time every visit method of the pylint-ml checkers and count the nodes they match and the "
+                "messages they emit. The profile is printed to stderr at the end of the run.",
+            },
+        ),
+        (
+            "ml-profile-output",
+            {
+                "default": "",
+                "type": "string",
+                "metavar": "<file>",
+                "help": "Write the profile to this file as JSON instead of printing it.",
+            },
+        ),
+    )
+
+    def get_map_data(self):
+        if Profiler.active is None:
+            return None
+        return Profiler.active.take()
+
+    def reduce_map_data(self, linter: PyLinter, data) -> None:
+        profiler.report(linter, profiler.merge(data))
+        Profiler.active = None
@@ -0,0 +1,179 @@
+# Licensed under the MIT: https://mit-license.org/
+# For details: https://github.com/pylint-dev/pylint-ml/LICENSE
+# Copyright (c) https://github.com/pylint-dev/pylint-ml/CONTRIBUTORS.txt
+
+"""Replay the messages of unchanged modules from the result cache instead of checking them again."""
+
+from __future__ import annotations
+
+import hashlib
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+import astroid
+import pylint
+from astroid import nodes
+from pylint.checkers import BaseChecker
+
+from pylint_ml.util.dependencies import ModuleDigests, project_imports
+from pylint_ml.util.lazy_checker import LazyChecker
+from pylint_ml.util.libraries import DISTRIBUTIONS
+from pylint_ml.util.library_handler import LibraryHandler
+from pylint_ml.util.result_cache import RESULT_CACHE_CHECKER, ModuleResults, ResultCache
+from pylint_ml.util.source_prefilter import module_source
+
+
+class ResultCacheChecker(BaseChecker):
+    """Look up every module in the result cache before the library checkers look at it.
+
+    On a hit the cached messages are replayed and every library checker is turned off for the
+    module. On a miss the messages of the library checkers are recorded and stored when the last
+    of them leaves the module.
+
+    The library checkers drive the cache: they acquire it when they are opened and report when
+    they enter and leave a module. The linter only opens checkers with an enabled message, so the
+    cache works whatever messages are enabled, also when ``ml-cache-write-failed`` is not.
+    """
+
+    name = RESULT_CACHE_CHECKER
+    msgs = {
+        "W8201": (
+            "Could not write to the pylint-ml result cache: %s",
+            "ml-cache-write-failed",
+            "Emitted once per process when an entry of the result cache set with ``ml-cache-dir`` cannot be "
+            "written. Linting continues without storing results.",
+        ),
+    }
+    options = (
+        (
+            "ml-cache-dir",
+            {
+                "default": "",
+                "type": "string",
+                "metavar": "<directory>",
+                "help": "Directory in which the messages of pylint-ml are cached per module content and, "
+                "unless --persistent=n, what the functions of the project return. The cache is disabled "
+                "when empty.",
+            },
+        ),
+        (
+            "ml-cache-max-entries",
+            {
+                "default": 10000,
+                "type": "int",
+                "metavar": "<int>",
+                "help": "Number of modules kept in the result cache; the least recently used ones are removed.",
+            },
+        ),
+    )
+
+    def __init__(self, linter):
+        super().__init__(linter)
+        self._cache: ResultCache | None = None
+        self._configuration = ""
+        self._dependencies = ModuleDigests()
+        self._key: str | None = None
+        self._write_failed = False
+        self._users = 0
+        # How many library checkers entered the module they are in
+        self._entered: dict[nodes.Module, int] = {}
+
+    def acquire(self) -> None:
+        """Open the cache for the checkers about to run, once for all of them."""
+        self._users += 1
+        if self._users > 1:
+            return
+        directory = self.linter.config.ml_cache_dir
+        max_entries = self.linter.config.ml_cache_max_entries
+        if not directory:
+            self._cache = None
+        elif self._cache is None or self._cache.directory != Path(directory) or self._cache.max_entries != max_entries:
+            # ``pylint -j`` opens the checkers for every file; keep the cache and its write count
+            self._cache = ResultCache(directory, max_entries)
+        self._configuration = self.configuration_digest()
+        self._dependencies = ModuleDigests()
+
+    def configuration_digest(self) -> str:
+        """Hash of everything besides the module itself that the messages of the plugin depend on."""
+        digest = hashlib.sha256(environment_fingerprint().encode())
+        for checker in self.linter.get_checkers():
+            if not isinstance(checker, (LibraryHandler, LazyChecker)):
+                continue
+            enabled = sorted(msgid for msgid in checker.msgs if self.linter.is_message_enabled(msgid))
+            options = [(name, getattr(self.linter.config, name.replace("-", "_"))) for name, _ in checker.options]
+            digest.update(repr((checker.name, enabled, options)).encode())
+        return digest.hexdigest()
+
+    def cache_key(self, module: nodes.Module, source: bytes) -> str:
+        digest = hashlib.sha256(self._configuration.encode())
+        digest.update(module.name.encode())
+        digest.update(hashlib.sha256(source).digest())
+        # Names imported from project modules can re-export a library, and their functions type values
+        digest.update(self._dependencies.digest(project_imports(source, module.name, module.package)).encode())
+        return digest.hexdigest()
+
+    def release(self) -> None:
+        self._users -= 1
+
+    def module_entered(self, node: nodes.Module) -> None:
+        """Called by every library checker in ``visit_module``, the first one looks ``node`` up."""
+        if node not in self._entered:
+            self._entered = {node: 0}
+            self._look_up(node)
+        self._entered[node] += 1
+
+    def module_left(self, node: nodes.Module) -> None:
+        """Called by every library checker in ``leave_module``, the last one stores the messages of ``node``."""
+        if node not in self._entered:
+            return
+        self._entered[node] -= 1
+        if not self._entered[node]:
+            self._entered = {}
+            self._store(node)
+
+    def _look_up(self, node: nodes.Module) -> None:
+        self._key = None
+        if self._cache is None or ModuleResults.is_started(node):
+            return
+        source = module_source(node)
+        if source is None:
+            return
+        self._key = self.cache_key(node, source)
+        messages = self._cache.get(self._key)
+        if messages is None:
+            ModuleResults.record_module(node)
+        else:
+            ModuleResults.replay_module(self.linter, node, messages)
+
+    def _store(self, node: nodes.Module) -> None:
+        messages = ModuleResults.finish(node)
+        if messages is None or self._cache is None or self._key is None:
+            return
+        try:
+            self._cache.put(self._key, messages)
+        except OSError as ex:
+            if not self._write_failed:
+                self._write_failed = True
+                self.add_message("ml-cache-write-failed", node=node, args=str(ex))
+
+
+@lru_cache(maxsize=1)
+def environment_fingerprint() -> str:
+    """Versions of the interpreter, pylint, astroid, the supported libraries and the plugin's own files."""
+    # Imported here, it is slow to import and only needed when the cache is enabled
+    from importlib import metadata  # pylint: disable=import-outside-toplevel
+
+    versions = [sys.version, pylint.__version__, astroid.__version__]
+    # The versions of the libraries are part of every cache key, rules can depend on them
+    for distribution in ("pylint-ml", *sorted(DISTRIBUTIONS.values())):
+        try:
+            versions.append(metadata.version(distribution))
+        except metadata.PackageNotFoundError:
+            versions.append("")
+    # Also catches changed rules of a plugin that is installed in development mode
+    package = Path(__file__).parent.parent
+    for path in sorted(path for path in package.rglob("*") if path.suffix in (".py", ".json")):
+        stat = path.stat()
+        versions.append(f"{path.relative_to(package)}:{stat.st_size}:{stat.st_mtime_ns}")
+    return "\n".join(versions)
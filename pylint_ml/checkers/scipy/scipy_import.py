@@ -7,15 +7,17 @@
 from __future__ import annotations
 
 from astroid import nodes
-from pylint.checkers import BaseChecker
 from pylint.checkers.utils import only_required_for_messages
 from pylint.interfaces import HIGH
 
+from pylint_ml.util.library_handler import LibraryHandler, only_if_library_imported
 
-class ScipyImportChecker(BaseChecker):
+
+class ScipyImportChecker(LibraryHandler):
     name = "scipy-import"
+    library = "scipy"
     msgs = {
-        "W8401": (
+        "W8501": (
             "Direct or aliased Scipy import detected",
             "scipy-import",
             "Using `import scipy` or `import scipy as ...` is not recommended. For better clarity and consistency, "
@@ -26,6 +28,7 @@ class ScipyImportChecker(BaseChecker):
     }
 
     @only_required_for_messages("scipy-import", "scipy-wildcard-import")
+    @only_if_library_imported
     def visit_import(self, node: nodes.Import) -> None:
         for name, _alias in node.names:
             if name == "scipy":
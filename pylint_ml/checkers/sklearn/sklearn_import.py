@@ -7,15 +7,17 @@
 from __future__ import annotations
 
 from astroid import nodes
-from pylint.checkers import BaseChecker
 from pylint.checkers.utils import only_required_for_messages
 from pylint.interfaces import HIGH
 
+from pylint_ml.util.library_handler import LibraryHandler, only_if_library_imported
 
-class SklearnImportChecker(BaseChecker):
+
+class SklearnImportChecker(LibraryHandler):
     name = "sklearn-import"
+    library = "sklearn"
     msgs = {
-        "W8401": (
+        "W8601": (
             "Direct or aliased Sklearn import detected",
             "sklearn-import",
             "Using `import sklearn` or `import sklearn as ...` is not recommended. For better clarity and consistency, "
@@ -26,6 +28,7 @@ class SklearnImportChecker(BaseChecker):
     }
 
     @only_required_for_messages("sklearn-import")
+    @only_if_library_imported
     def visit_import(self, node: nodes.Import) -> None:
         for name, _ in node.names:
             if name == "sklearn":
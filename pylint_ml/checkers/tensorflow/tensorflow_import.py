@@ -7,13 +7,15 @@
 from __future__ import annotations
 
 from astroid import nodes
-from pylint.checkers import BaseChecker
 from pylint.checkers.utils import only_required_for_messages
 from pylint.interfaces import HIGH
 
+from pylint_ml.util.library_handler import LibraryHandler, only_if_library_imported
 
-class TensorflowImportChecker(BaseChecker):
+
+class TensorflowImportChecker(LibraryHandler):
     name = "tensorflow-import"
+    library = "tensorflow"
     msgs = {
         "W8401": (
             "Tensorflow imported with incorrect alias",
@@ -33,12 +35,14 @@ class TensorflowImportChecker(BaseChecker):
     }
 
     @only_required_for_messages("tensorflow-import")
+    @only_if_library_imported
     def visit_import(self, node: nodes.Import) -> None:
         for name, alias in node.names:
             if name == "tensorflow" and alias != "tf":
                 self.add_message("tensorflow-import", node=node, confidence=HIGH)
 
     @only_required_for_messages("tensorflow-importfrom")
+    @only_if_library_imported
     def visit_importfrom(self, node: nodes.ImportFrom) -> None:
         if node.modname == "tensorflow":
             self.add_message("tensorflow-importfrom", node=node, confidence=HIGH)
@@ -0,0 +1,127 @@
+# Licensed under the MIT: https://mit-license.org/
+# For details: https://github.com/pylint-dev/pylint-ml/LICENSE
+# Copyright (c) https://github.com/pylint-dev/pylint-ml/CONTRIBUTORS.txt
+
+"""Check for tensors grown by torch.cat or torch.stack inside a loop, and for torch.tensor() copies of tensors."""
+
+from __future__ import annotations
+
+from astroid import nodes
+from pylint.checkers.utils import only_required_for_messages
+from pylint.interfaces import HIGH
+
+from pylint_ml.util.call_name import get_call_name
+from pylint_ml.util.def_use import bound_name, uses
+from pylint_ml.util.library_handler import LibraryHandler, only_if_library_imported
+from pylint_ml.util.loop_index import operand_names
+from pylint_ml.util.type_inference import NDARRAY, TORCH_TENSOR
+
+# torch functions that copy the sequence of tensors passed to them into a new one
+_FUNCTIONS = {
+    "torch.cat",
+    "torch.concat",
+    "torch.concatenate",
+    "torch.stack",
+    "torch.vstack",
+    "torch.hstack",
+    "torch.dstack",
+    "torch.column_stack",
+    "torch.row_stack",
+}
+_TAILS = frozenset(name.rsplit(".", 1)[-1] for name in _FUNCTIONS)
+
+
+class TorchAccumulationChecker(LibraryHandler):
+    name = "torch-accumulation"
+    library = "torch"
+    msgs = {
+        "W8705": (
+            "'%s' is grown with %s in the loop at line %s",
+            "torch-cat-in-loop",
+            "Every iteration allocates a new tensor and copies the whole accumulated one into it. On a GPU the "
+            "growing blocks also fragment the caching allocator. Collect the pieces in a list and call "
+            "torch.cat once after the loop, or preallocate the tensor with torch.empty and fill it.",
+        ),
+        "W8706": (
+            "'%s' copies %s, use %s",
+            "torch-tensor-copy",
+            "torch.tensor() always copies its data and builds a tensor from a list element by element. "
+            "torch.stack joins a list of tensors in one kernel, torch.as_tensor and torch.from_numpy reuse "
+            "the memory of an existing tensor or array.",
+        ),
+    }
+
+    @only_required_for_messages("torch-cat-in-loop", "torch-tensor-copy")
+    @only_if_library_imported
+    def visit_call(self, node: nodes.Call) -> None:
+        call_name = get_call_name(node)
+        if call_name.tail == "tensor":
+            if self.import_table(node).qualify(call_name) == "torch.tensor":
+                self.rule_matched()
+                self._check_tensor(node)
+            return
+        if call_name.tail not in _TAILS or not isinstance(
+            node.parent, (nodes.Assign, nodes.AnnAssign, nodes.NamedExpr)
+        ):
+            return
+        if self.import_table(node).qualify(call_name) not in _FUNCTIONS:
+            return
+        self.rule_matched()
+        operands = operand_names(
+            [*node.args[:1], *(keyword.value for keyword in node.keywords if keyword.arg == "tensors")]
+        )
+
+        accumulation = self.loop_index(node).accumulation(node, operands)
+        if accumulation is not None:
+            accumulator, context = accumulation
+            self.add_message(
+                "torch-cat-in-loop",
+                node=node,
+                args=(accumulator, f"{call_name.tail}()", context.lineno),
+                confidence=HIGH,
+            )
+
+    def _check_tensor(self, node: nodes.Call) -> None:
+        data = node.args[0] if node.args else next((kw.value for kw in node.keywords if kw.arg == "data"), None)
+        if data is None:
+            return
+        data_type = self.inferred_type(data)
+        if data_type == TORCH_TENSOR:
+            copied, replacement = "an existing tensor", "torch.as_tensor() to reuse it or .clone().detach() to copy it"
+        elif data_type == NDARRAY:
+            copied, replacement = "a numpy array", "torch.from_numpy() or torch.as_tensor() to share its memory"
+        elif self._is_tensor_list(data):
+            copied, replacement = "a list of tensors", "torch.stack()"
+        else:
+            return
+        self.add_message(
+            "torch-tensor-copy",
+            node=node,
+            args=(node.as_string(), copied, replacement),
+            confidence=HIGH,
+        )
+
+    def _is_tensor_list(self, node: nodes.NodeNG) -> bool:
+        """A list literal or comprehension of tensors, or a list the tensors are appended to."""
+        if isinstance(node, (nodes.List, nodes.Tuple)):
+            return bool(node.elts) and all(self.inferred_type(item) == TORCH_TENSOR for item in node.elts)
+        if isinstance(node, nodes.ListComp):
+            return self.inferred_type(node.elt) == TORCH_TENSOR
+        if not isinstance(node, nodes.Name):
+            return False
+        for binding in node.lookup(node.name)[1]:
+            if not (isinstance(binding.parent, nodes.Assign) and bound_name(binding.parent.value) is binding):
+                continue
+            if self._is_tensor_list(binding.parent.value):
+                return True
+            for use in uses(binding):
+                append = use.parent
+                if (
+                    isinstance(append, nodes.Attribute)
+                    and append.attrname == "append"
+                    and isinstance(append.parent, nodes.Call)
+                    and append.parent.args
+                    and self.inferred_type(append.parent.args[0]) == TORCH_TENSOR
+                ):
+                    return True
+        return False
@@ -0,0 +1,194 @@
+# Licensed under the MIT: https://mit-license.org/
+# For details: https://github.com/pylint-dev/pylint-ml/LICENSE
+# Copyright (c) https://github.com/pylint-dev/pylint-ml/CONTRIBUTORS.txt
+
+"""Check ``DataLoader`` settings that keep the GPU waiting for batches.
+
+The settings are checked against ``LOADER_RULES``. Like the rules of the ``*_parameter``
+checkers, each rule names a parameter, but it also looks at the value passed for it and
+only applies when the way the loader is used makes the setting matter.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import NamedTuple
+
+from astroid import nodes
+from pylint.checkers.utils import only_required_for_messages
+from pylint.interfaces import HIGH
+
+from pylint_ml.util.call_name import get_call_name
+from pylint_ml.util.def_use import bound_name, uses
+from pylint_ml.util.devices import moves_to_cuda, root_name
+from pylint_ml.util.library_handler import LibraryHandler, only_if_library_imported
+from pylint_ml.util.loop_index import LoopContext
+
+_DATALOADER = "torch.utils.data.DataLoader"
+
+# Positions of the parameters of ``DataLoader`` that may be passed positionally
+_POSITIONS = {"batch_size": 1, "batch_sampler": 4, "num_workers": 5, "pin_memory": 7}
+
+# Builtins and helpers that iterate their argument in a ``for`` loop, e.g. ``enumerate(loader)``
+_ITERATING_CALLS = {"enumerate", "iter", "tqdm", "zip"}
+
+# Builtins that do not iterate the loader they are passed
+_INSPECTING_CALLS = {"isinstance", "len", "print", "repr", "str", "type"}
+
+
+class LoaderUse(NamedTuple):
+    """How the loader built by one ``DataLoader`` call is used."""
+
+    # Batches are moved to a CUDA device in a loop over the loader
+    moves_to_cuda: bool
+    # The loader is iterated again on every step of an outer loop, one per epoch
+    across_epochs: bool
+    # A loop over the loader runs a training step
+    trains: bool
+
+
+class LoaderRule(NamedTuple):
+    name: str
+    param: str
+    # Whether the value passed for ``param``, ``None`` when it is left out, starves the GPU
+    violated: Callable[[nodes.NodeNG | None], bool]
+    applies: Callable[[LoaderUse], bool]
+    problem: str
+    fix: str
+
+
+def _missing_or(value: object) -> Callable[[nodes.NodeNG | None], bool]:
+    return lambda node: node is None or (isinstance(node, nodes.Const) and node.value == value)
+
+
+LOADER_RULES = (
+    LoaderRule(
+        name="dataloader-workers",
+        param="num_workers",
+        violated=_missing_or(0),
+        applies=lambda use: True,
+        problem="loads every batch in the main process",
+        fix="num_workers > 0",
+    ),
+    LoaderRule(
+        name="dataloader-pin-memory",
+        param="pin_memory",
+        violated=_missing_or(False),
+        applies=lambda use: use.moves_to_cuda,
+        problem="copies batches to the GPU from pageable memory",
+        fix="pin_memory=True",
+    ),
+    LoaderRule(
+        name="dataloader-persistent-workers",
+        param="persistent_workers",
+        violated=_missing_or(False),
+        applies=lambda use: use.across_epochs,
+        problem="starts its worker processes again for every epoch",
+        fix="persistent_workers=True",
+    ),
+    LoaderRule(
+        name="dataloader-batch-size",
+        param="batch_size",
+        # ``batch_size`` defaults to 1
+        violated=_missing_or(1),
+        applies=lambda use: use.trains,
+        problem="runs a training step for every single sample",
+        fix="a larger batch_size",
+    ),
+)
+
+
+class TorchDataLoaderChecker(LibraryHandler):
+    name = "torch-dataloader"
+    library = "torch"
+    msgs = {
+        "W8704": (
+            "DataLoader '%s' %s, pass %s (rule %s)",
+            "torch-dataloader-throughput",
+            "A DataLoader that prepares batches slower than the model consumes them leaves the GPU idle. "
+            "Load batches in worker processes, keep the workers alive between epochs, pin memory for "
+            "transfers to the GPU and train on batches rather than single samples.",
+        ),
+    }
+
+    @only_required_for_messages("torch-dataloader-throughput")
+    @only_if_library_imported
+    def visit_call(self, node: nodes.Call) -> None:
+        if self.import_table(node).qualify(get_call_name(node)) != _DATALOADER:
+            return
+        if any(keyword.arg is None for keyword in node.keywords) or any(
+            isinstance(arg, nodes.Starred) for arg in node.args
+        ):
+            # ``**kwargs`` may pass any setting
+            return
+        self.rule_matched()
+        use = self._use(node)
+        binding = bound_name(node)
+        label = binding.name if binding is not None else node.func.as_string()
+        for rule in LOADER_RULES:
+            if rule.param == "batch_size" and _argument(node, "batch_sampler") is not None:
+                continue
+            if rule.applies(use) and rule.violated(_argument(node, rule.param)):
+                self.add_message(
+                    "torch-dataloader-throughput",
+                    node=node,
+                    args=(label, rule.problem, rule.fix, rule.name),
+                    confidence=HIGH,
+                )
+
+    def _use(self, call: nodes.Call) -> LoaderUse:
+        binding = bound_name(call)
+        references = uses(binding) if binding is not None else [call]
+        created_in = _loops(self.loop_index(call).context(call))
+        loops = [loop for loop in map(_iterating_loop, references) if loop is not None]
+        # Passed on, e.g. ``train_one_epoch(model, loader)``, the loader is iterated by the callee
+        passed = [
+            reference
+            for reference in references
+            if isinstance(reference.parent, nodes.Call)
+            and not (isinstance(reference.parent.func, nodes.Name) and reference.parent.func.name in _INSPECTING_CALLS)
+        ]
+        across_epochs = any(_loops(self.loop_index(node).context(node)) - created_in for node in (*loops, *passed))
+        return LoaderUse(
+            moves_to_cuda=any(_moves_to_cuda(loop) for loop in loops),
+            across_epochs=across_epochs,
+            trains=any(self.training_loops(call).trains(loop) for loop in loops),
+        )
+
+
+def _argument(call: nodes.Call, param: str) -> nodes.NodeNG | None:
+    for keyword in call.keywords:
+        if keyword.arg == param:
+            return keyword.value
+    position = _POSITIONS.get(param)
+    if position is not None and position < len(call.args):
+        return call.args[position]
+    return None
+
+
+def _loops(context: LoopContext | None) -> set[nodes.NodeNG]:
+    return {loop.loop for loop in context.enclosing_loops()} if context is not None else set()
+
+
+def _iterating_loop(node: nodes.NodeNG) -> nodes.For | None:
+    """The ``for`` loop that iterates ``node``, also through ``enumerate(node)`` and the like."""
+    while (
+        isinstance(node.parent, nodes.Call)
+        and node in node.parent.args
+        and isinstance(node.parent.func, nodes.Name)
+        and node.parent.func.name in _ITERATING_CALLS
+    ):
+        node = node.parent
+    if isinstance(node.parent, nodes.For) and node.parent.iter is node:
+        return node.parent
+    return None
+
+
+def _moves_to_cuda(loop: nodes.For) -> bool:
+    """Whether the body of ``loop`` moves its loop variables to a CUDA device."""
+    batch = {name.name for name in loop.target.nodes_of_class(nodes.AssignName)}
+    return any(
+        root_name(call.func.expr) in batch and moves_to_cuda(call)
+        for call in loop.nodes_of_class(nodes.Call)
+        if isinstance(call.func, nodes.Attribute)
+    )
@@ -0,0 +1,177 @@
+# Licensed under the MIT: https://mit-license.org/
+# For details: https://github.com/pylint-dev/pylint-ml/LICENSE
+# Copyright (c) https://github.com/pylint-dev/pylint-ml/CONTRIBUTORS.txt
+
+"""Check for transfers to the device that are repeated or block on every iteration of a loop.
+
+Each ``x.to(device)`` or ``x.cuda()`` in a loop is either loop-invariant, when none of the names
+it reads is assigned or changed in the loop, or per-iteration. Invariant transfers are reported
+at the outermost loop they do not depend on. Per-iteration transfers of the loop variables are
+batches, and are reported when they block.
+"""
+
+from __future__ import annotations
+
+from astroid import nodes
+from pylint.checkers.utils import only_required_for_messages
+from pylint.interfaces import HIGH
+
+from pylint_ml.util.call_name import get_call_name
+from pylint_ml.util.def_use import assigned_names
+from pylint_ml.util.devices import is_transfer, moves_to_cuda, root_name
+from pylint_ml.util.library_handler import LibraryHandler, only_if_library_imported
+from pylint_ml.util.loop_index import LoopContext
+from pylint_ml.util.type_inference import TORCH_FUNCTIONS
+
+# torch functions that build the same tensor whenever they are called with the same arguments, all
+# the tensor functions the type inference knows but the random ones
+_CONSTRUCTORS = frozenset(name for name in TORCH_FUNCTIONS if not name.startswith("torch.rand"))
+
+# Tensor methods that compute the same result from the same receiver
+_PURE_METHODS = frozenset(
+    ("bool", "clone", "contiguous", "detach", "double", "float", "half", "int", "long", "reshape", "t", "unsqueeze")
+)
+
+
+class TorchDeviceTransferChecker(LibraryHandler):
+    name = "torch-device-transfer"
+    library = "torch"
+    msgs = {
+        "W8707": (
+            "'%s' moves the same data to the device on every iteration of the loop at line %s, hoist %s above "
+            "the loop",
+            "torch-loop-invariant-transfer",
+            "Nothing the transfer reads changes in the loop, so every iteration after the first copies the "
+            "same data again and waits for it. Move it to the device once before the loop.",
+        ),
+        "W8708": (
+            "'%s' blocks until the batch is copied to the device, pass non_blocking=True and load the batches "
+            "with pin_memory=True",
+            "torch-blocking-transfer",
+            "A transfer from pageable memory stalls the host until the copy is done. From pinned memory with "
+            "non_blocking=True the copy runs asynchronously and overlaps with the computation on the previous "
+            "batch.",
+        ),
+    }
+
+    def __init__(self, linter):
+        super().__init__(linter)
+        # Names each loop of the module assigns or changes, computed once per loop
+        self._assigned: dict[nodes.NodeNG, set[str]] = {}
+
+    def leave_module(self, node: nodes.Module) -> None:
+        super().leave_module(node)
+        self._assigned = {}
+
+    @only_required_for_messages("torch-loop-invariant-transfer", "torch-blocking-transfer")
+    @only_if_library_imported
+    def visit_call(self, node: nodes.Call) -> None:
+        if not is_transfer(node):
+            return
+        context = self.loop_index(node).context(node)
+        loops = list(context.enclosing_loops()) if context is not None else []
+        loops = [loop for loop in loops if not isinstance(loop.loop, nodes.Comprehension)]
+        if not loops:
+            return
+        self.rule_matched()
+        hoist_above = None
+        for loop in loops:
+            if not self._is_invariant(node, loop):
+                break
+            hoist_above = loop
+        if hoist_above is not None:
+            if not _runs_conditionally(node, hoist_above):
+                self.add_message(
+                    "torch-loop-invariant-transfer",
+                    node=node,
+                    args=(node.as_string(), hoist_above.lineno, _hoisted(node)),
+                    confidence=HIGH,
+                )
+        elif (
+            isinstance(loops[0].loop, nodes.For)
+            and root_name(node.func.expr) in loops[0].variables
+            and not _iterates_range(loops[0].loop)
+            and moves_to_cuda(node)
+            and not _non_blocking(node)
+        ):
+            self.add_message("torch-blocking-transfer", node=node, args=(node.as_string(),), confidence=HIGH)
+
+    def _is_invariant(self, transfer: nodes.Call, loop: LoopContext) -> bool:
+        """Whether nothing ``transfer`` reads is assigned or changed in ``loop``."""
+        if loop.loop not in self._assigned:
+            self._assigned[loop.loop] = assigned_names(loop.loop, self.import_table(transfer))
+        assigned = self._assigned[loop.loop]
+        receiver = _reassigned_receiver(transfer)
+        if receiver is not None and not _assigned_elsewhere(receiver, transfer.parent, loop.loop):
+            assigned = assigned - {receiver}
+        imports = self.import_table(transfer)
+        for child in (transfer.func.expr, *transfer.args, *(keyword.value for keyword in transfer.keywords)):
+            # ``masks[step]`` and ``weights * 2`` are invariant if the names they read are
+            for node in child.nodes_of_class((nodes.Name, nodes.Attribute, nodes.Call)):
+                if isinstance(node, nodes.Call):
+                    if not _is_pure(node, imports.qualify(get_call_name(node))):
+                        return False
+                elif isinstance(node, (nodes.Name, nodes.Attribute)) and node.as_string() in assigned:
+                    return False
+        return True
+
+
+def _is_pure(call: nodes.Call, qualified_name: str | None) -> bool:
+    if qualified_name is not None:
+        return qualified_name in _CONSTRUCTORS or qualified_name == "torch.device"
+    return isinstance(call.func, nodes.Attribute) and call.func.attrname in _PURE_METHODS
+
+
+def _reassigned_receiver(transfer: nodes.Call) -> str | None:
+    """``model`` for ``model = model.to(device)``, which moves the same object again."""
+    statement = transfer.parent
+    if isinstance(statement, nodes.Assign) and len(statement.targets) == 1:
+        target = statement.targets[0].as_string()
+        if target == transfer.func.expr.as_string():
+            return target
+    return None
+
+
+def _assigned_elsewhere(name: str, statement: nodes.Assign, loop: nodes.NodeNG) -> bool:
+    """Whether ``loop`` assigns ``name`` other than in ``statement``, e.g. as the loop variable."""
+    return any(
+        target.as_string() == name and target is not statement.targets[0]
+        for target in loop.nodes_of_class((nodes.AssignName, nodes.AssignAttr))
+    )
+
+
+def _hoisted(transfer: nodes.Call) -> str:
+    """The statement to move above the loop, or the transfer itself if it is part of an expression."""
+    statement = transfer.parent
+    if isinstance(statement, (nodes.Expr, nodes.Assign, nodes.AnnAssign)) and statement.value is transfer:
+        return f"the statement at line {statement.lineno}"
+    return "it into a variable"
+
+
+def _runs_conditionally(node: nodes.NodeNG, loop: LoopContext) -> bool:
+    """Whether ``node`` is under an ``if`` or ``try`` in ``loop``, e.g. only on the first iteration."""
+    parent = node.parent
+    while parent is not None and parent is not loop.loop:
+        if isinstance(parent, (nodes.If, nodes.IfExp, nodes.Try)):
+            return True
+        parent = parent.parent
+    return False
+
+
+def _iterates_range(loop: nodes.For) -> bool:
+    """``for i in range(n)`` or ``enumerate(range(n))``, which do not yield data."""
+    iterated = loop.iter
+    while isinstance(iterated, nodes.Call) and isinstance(iterated.func, nodes.Name):
+        if iterated.func.name == "range":
+            return True
+        if iterated.func.name != "enumerate" or not iterated.args:
+            return False
+        iterated = iterated.args[0]
+    return False
+
+
+def _non_blocking(transfer: nodes.Call) -> bool:
+    return any(
+        keyword.arg == "non_blocking" and not (isinstance(keyword.value, nodes.Const) and not keyword.value.value)
+        for keyword in transfer.keywords
+    )
@@ -0,0 +1,127 @@
+# Licensed under the MIT: https://mit-license.org/
+# For details: https://github.com/pylint-dev/pylint-ml/LICENSE
+# Copyright (c) https://github.com/pylint-dev/pylint-ml/CONTRIBUTORS.txt
+
+"""Check for host-device synchronizations in every step of a training loop."""
+
+from __future__ import annotations
+
+from astroid import nodes
+from pylint.checkers.utils import only_required_for_messages
+from pylint.interfaces import HIGH
+
+from pylint_ml.util.call_name import get_call_name
+from pylint_ml.util.library_handler import LibraryHandler, only_if_library_imported
+from pylint_ml.util.loop_index import LoopContext
+from pylint_ml.util.type_inference import TORCH_TENSOR
+
+# Tensor methods that copy the value to the host, waiting for the kernels that compute it
+_SYNC_METHODS = {"cpu", "item", "numpy", "tolist"}
+
+# torch functions that return Python values or set up state rather than compute on tensors
+_HOST_FUNCTIONS = ("torch.cuda.", "torch.backends.", "torch.no_grad", "torch.enable_grad", "torch.inference_mode")
+
+
+class TorchHostSyncChecker(LibraryHandler):
+    name = "torch-host-sync"
+    library = "torch"
+    msgs = {
+        "W8701": (
+            "'%s' synchronizes with the device on every step of the training loop at line %s",
+            "torch-host-sync-in-loop",
+            "Reading a tensor's value on the host waits for every queued kernel, so the GPU idles while the "
+            "next step is prepared. Accumulate metrics on the device, e.g. total += loss.detach(), and read "
+            "them once per epoch or every N steps.",
+        ),
+    }
+
+    @only_required_for_messages("torch-host-sync-in-loop")
+    @only_if_library_imported
+    def visit_call(self, node: nodes.Call) -> None:
+        func = node.func
+        if isinstance(func, nodes.Attribute) and func.attrname in _SYNC_METHODS and not node.args:
+            # ``arr.tolist()`` of an array or a list does not touch the device
+            if self.inferred_type(func.expr) not in (None, TORCH_TENSOR):
+                return
+            loop = self._training_loop(node)
+        elif isinstance(func, nodes.Name) and func.name == "print":
+            loop = self._training_loop(node)
+            if loop is not None:
+                self.rule_matched()
+                if not any(self._is_tensor(value, loop) for value in _printed(node)):
+                    return
+        else:
+            return
+        if loop is not None:
+            self._report(node, node.as_string(), loop)
+
+    @only_required_for_messages("torch-host-sync-in-loop")
+    @only_if_library_imported
+    def visit_if(self, node: nodes.If) -> None:
+        loop = self._training_loop(node)
+        if loop is None:
+            return
+        self.rule_matched()
+        if self._is_tensor(node.test, loop):
+            self._report(node.test, f"if {node.test.as_string()}", loop)
+
+    def _report(self, node: nodes.NodeNG, sync: str, loop: LoopContext) -> None:
+        self.add_message(
+            "torch-host-sync-in-loop",
+            node=node,
+            args=(sync, loop.lineno),
+            confidence=HIGH,
+        )
+
+    def _training_loop(self, node: nodes.NodeNG) -> LoopContext | None:
+        """The innermost training loop ``node`` runs in on every step."""
+        context = self.loop_index(node).context(node)
+        if context is None or _runs_every_n_steps(node, context):
+            return None
+        training = self.training_loops(node)
+        for loop in context.enclosing_loops():
+            if not isinstance(loop.loop, nodes.Comprehension) and training.trains(loop.loop):
+                return loop
+        return None
+
+    def _is_tensor(self, node: nodes.NodeNG, loop: LoopContext) -> bool:
+        """Whether ``node`` evaluates to a tensor, so that using it on the host syncs."""
+        if isinstance(node, (nodes.Name, nodes.Attribute)):
+            return self.inferred_type(node) == TORCH_TENSOR or node.as_string() in self.training_loops(node).losses(
+                loop.loop
+            )
+        if isinstance(node, (nodes.Compare, nodes.BoolOp, nodes.BinOp, nodes.UnaryOp)):
+            return any(self._is_tensor(child, loop) for child in node.get_children())
+        if isinstance(node, nodes.Call):
+            qualified_name = self.import_table(node).qualify(get_call_name(node))
+            if qualified_name is not None:
+                return qualified_name.startswith("torch.") and not qualified_name.startswith(_HOST_FUNCTIONS)
+            if isinstance(node.func, nodes.Attribute):
+                # ``(pred == y).all()``, but ``loss.item()`` is reported as a call of its own
+                return node.func.attrname not in _SYNC_METHODS and self._is_tensor(node.func.expr, loop)
+        return False
+
+
+def _printed(call: nodes.Call) -> list[nodes.NodeNG]:
+    """The values ``print`` formats, also inside f-strings."""
+    values = []
+    for argument in call.args:
+        if isinstance(argument, nodes.JoinedStr):
+            values.extend(value.value for value in argument.values if isinstance(value, nodes.FormattedValue))
+        else:
+            values.append(argument)
+    return values
+
+
+def _runs_every_n_steps(node: nodes.NodeNG, context: LoopContext) -> bool:
+    """Whether ``node`` is guarded by a test such as ``step % 100 == 0`` inside the loop."""
+    parent = node.parent
+    while parent is not None and parent is not context.loop:
+        if (
+            isinstance(parent, nodes.If)
+            and node is not parent.test
+            and any(binop.op == "%" for binop in parent.test.nodes_of_class(nodes.BinOp))
+        ):
+            return True
+        node, parent = parent, parent.parent
+    return False
@@ -0,0 +1,233 @@
+# Licensed under the MIT: https://mit-license.org/
+# For details: https://github.com/pylint-dev/pylint-ml/LICENSE
+# Copyright (c) https://github.com/pylint-dev/pylint-ml/CONTRIBUTORS.txt
+
+"""Check for forward passes in evaluation and inference code that still record autograd graphs."""
+
+from __future__ import annotations
+
+from astroid import nodes
+from pylint.checkers.utils import only_required_for_messages
+from pylint.interfaces import HIGH
+
+from pylint_ml.util.call_name import dotted_name, get_call_name
+from pylint_ml.util.def_use import uses
+from pylint_ml.util.library_handler import LibraryHandler, only_if_library_imported
+from pylint_ml.util.type_inference import parameter_annotation
+
+# Contexts and decorators that turn off gradient tracking
+_NO_GRAD = {"torch.no_grad", "torch.inference_mode"}
+
+# Methods of a module that return the module itself: ``Net().to(device).eval()``
+_MODULE_METHODS = {"cpu", "cuda", "double", "eval", "float", "half", "requires_grad_", "to", "train"}
+
+# Names conventionally given to models when nothing shows where they come from
+_MODEL_NAMES = {"model", "net", "network", "module"}
+
+# Methods whose result is no longer part of the autograd graph of the tensor they are called on
+_DETACHING_METHODS = {"argmax", "argmin", "argsort", "detach", "item", "numpy", "tolist"}
+
+# Methods that are part of training, or that run inside another module's forward pass
+_TRAINING_FUNCTIONS = {"forward", "training_step", "train_step", "train_one_epoch", "__call__"}
+
+
+class TorchNoGradChecker(LibraryHandler):
+    name = "torch-no-grad"
+    library = "torch"
+    msgs = {
+        "W8702": (
+            "Forward pass '%s' in %s has no backward() or optimizer step, run it under torch.no_grad() or "
+            "torch.inference_mode()",
+            "torch-missing-no-grad",
+            "Calling a model with gradient tracking on records the autograd graph and keeps every activation "
+            "alive until the output is freed. Code that never calls backward() only pays for it in memory "
+            "and time.",
+        ),
+        "W8703": (
+            "'%s' does not turn off gradient tracking, also run the evaluation under torch.no_grad() or "
+            "torch.inference_mode()",
+            "torch-eval-without-no-grad",
+            "Module.eval() only switches layers such as dropout and batch norm to inference behaviour. The "
+            "forward passes that follow still record autograd graphs unless they run in a no-grad context.",
+        ),
+    }
+
+    @only_required_for_messages("torch-missing-no-grad", "torch-eval-without-no-grad")
+    @only_if_library_imported
+    def visit_call(self, node: nodes.Call) -> None:
+        func = node.func
+        if isinstance(func, nodes.Attribute) and func.attrname == "eval" and not node.args:
+            if self._is_model(func.expr):
+                self._check_eval(node)
+        elif isinstance(func, (nodes.Name, nodes.Attribute)) and self._is_model(func):
+            self._check_forward(node)
+
+    def _check_forward(self, node: nodes.Call) -> None:
+        self.rule_matched()
+        region = self._region(node)
+        if region is None or self._trains(region) or self._in_no_grad(node):
+            return
+        if isinstance(region, nodes.FunctionDef) and _returns(node):
+            # The caller may well train on the output
+            return
+        label = f"'{region.name}'" if isinstance(region, nodes.FunctionDef) else f"the loop at line {region.lineno}"
+        self.add_message("torch-missing-no-grad", node=node, args=(node.as_string(), label), confidence=HIGH)
+
+    def _check_eval(self, node: nodes.Call) -> None:
+        self.rule_matched()
+        scope = node.scope()
+        if not isinstance(scope, (nodes.FunctionDef, nodes.Module)) or self._in_no_grad(node):
+            return
+        if self._trains(scope) or any(self._disables_grad(item) for item, _ in _with_items(scope)):
+            return
+        self.add_message("torch-eval-without-no-grad", node=node, args=(node.as_string(),), confidence=HIGH)
+
+    def _region(self, node: nodes.Call) -> nodes.FunctionDef | nodes.For | nodes.While | None:
+        """The function, or outside functions the outermost loop, the forward pass runs in."""
+        scope = node.scope()
+        if isinstance(scope, nodes.FunctionDef):
+            return None if scope.name in _TRAINING_FUNCTIONS else scope
+        if not isinstance(scope, nodes.Module):
+            return None
+        context = self.loop_index(node).context(node)
+        loops = [loop.loop for loop in context.enclosing_loops()] if context is not None else []
+        loops = [loop for loop in loops if isinstance(loop, (nodes.For, nodes.While))]
+        return loops[-1] if loops else None
+
+    def _trains(self, node: nodes.NodeNG) -> bool:
+        return self.training_loops(node).trains(node)
+
+    def _in_no_grad(self, node: nodes.NodeNG) -> bool:
+        """Whether a ``with`` block or a decorator of an enclosing function turns gradients off."""
+        parent = node.parent
+        while parent is not None:
+            if isinstance(parent, nodes.With) and any(self._disables_grad(item) for item, _ in parent.items):
+                return True
+            if isinstance(parent, nodes.FunctionDef) and parent.decorators is not None:
+                if any(self._disables_grad(decorator) for decorator in parent.decorators.nodes):
+                    return True
+            parent = parent.parent
+        return False
+
+    def _disables_grad(self, node: nodes.NodeNG) -> bool:
+        """``torch.no_grad()``, ``torch.no_grad``, ``torch.inference_mode()`` or ``torch.set_grad_enabled(False)``."""
+        imports = self.import_table(node)
+        if isinstance(node, nodes.Call):
+            qualified_name = imports.qualify(get_call_name(node))
+            if qualified_name == "torch.set_grad_enabled":
+                return bool(node.args) and isinstance(node.args[0], nodes.Const) and node.args[0].value is False
+            if qualified_name == "torch.inference_mode" and node.args:
+                return not (isinstance(node.args[0], nodes.Const) and node.args[0].value is False)
+            return qualified_name in _NO_GRAD
+        return imports.qualify(dotted_name(node)) in _NO_GRAD
+
+    def _is_model(self, node: nodes.NodeNG) -> bool:
+        """Whether ``node`` names a ``torch.nn.Module`` other than a loss function."""
+        if isinstance(node, nodes.Attribute):
+            # ``self.model``, nothing shows where it comes from
+            return node.attrname in _MODEL_NAMES
+        if not isinstance(node, nodes.Name):
+            return False
+        bindings = node.lookup(node.name)[1]
+        for binding in bindings:
+            if isinstance(binding.parent, nodes.Arguments):
+                annotation = parameter_annotation(binding.parent, binding)
+                if annotation is not None:
+                    return self.import_table(node).qualify(dotted_name(annotation)) == "torch.nn.Module"
+            elif isinstance(binding.parent, nodes.Assign) and isinstance(binding.parent.value, nodes.Call):
+                return self._creates_model(binding.parent.value)
+        return node.name in _MODEL_NAMES
+
+    def _creates_model(self, call: nodes.Call) -> bool:
+        while isinstance(call.func, nodes.Attribute) and call.func.attrname in _MODULE_METHODS:
+            if not isinstance(call.func.expr, nodes.Call):
+                return False
+            call = call.func.expr
+        qualified_name = self.import_table(call).qualify(get_call_name(call))
+        if qualified_name is not None:
+            return (
+                qualified_name.startswith("torch.nn.")
+                and not qualified_name.startswith("torch.nn.functional.")
+                and not qualified_name.endswith("Loss")
+            ) or qualified_name in ("torch.load", "torch.jit.load", "torch.compile")
+        # A class of the module that subclasses ``nn.Module``
+        if isinstance(call.func, nodes.Name):
+            classes = [klass for klass in call.func.lookup(call.func.name)[1] if isinstance(klass, nodes.ClassDef)]
+            return any(
+                self.import_table(call).qualify(dotted_name(base)) == "torch.nn.Module"
+                for klass in classes
+                for base in klass.bases
+            )
+        return False
+
+
+def _with_items(scope: nodes.NodeNG) -> list[tuple[nodes.NodeNG, nodes.NodeNG | None]]:
+    return [item for with_node in scope.nodes_of_class(nodes.With) for item in with_node.items]
+
+
+def _returns(call: nodes.Call) -> bool:
+    """Whether the output of ``call``, or a value computed from it, leaves the function.
+
+    Values are followed through expressions, assignments, loops and the containers they are added
+    to, so ``loss = criterion(model(x), y); return loss`` returns one. They leave the function when
+    they are returned, yielded or stored on an attribute. Predictions, comparisons and values taken
+    out of the autograd graph with ``item()`` or ``detach()`` are not followed.
+    """
+    pending: list[nodes.NodeNG] = [call]
+    seen = set()
+    while pending:
+        node = pending.pop()
+        if node in seen:
+            continue
+        seen.add(node)
+        expression, parent = node, node.parent
+        while not parent.is_statement:
+            if isinstance(parent, (nodes.Yield, nodes.YieldFrom)):
+                return True
+            if isinstance(parent, nodes.Compare) or (
+                isinstance(parent, nodes.Attribute) and parent.attrname in _DETACHING_METHODS
+            ):
+                break
+            if isinstance(parent, nodes.Call) and expression is not parent.func:
+                # ``outputs.append(out)``
+                if isinstance(parent.func, nodes.Attribute) and isinstance(parent.func.expr, nodes.Name):
+                    pending.extend(_reads(parent.func.expr))
+            expression, parent = parent, parent.parent
+        else:
+            if isinstance(parent, nodes.Return):
+                return True
+            for target in _targets(parent, expression):
+                if isinstance(target, nodes.AssignName):
+                    pending.extend(uses(target))
+                elif isinstance(target, nodes.AssignAttr) or not isinstance(target.value, nodes.Name):
+                    # ``self.outputs = out``, ``self.outputs[i] = out``
+                    return True
+                else:
+                    # ``outputs[i] = out``
+                    pending.extend(_reads(target.value))
+    return False
+
+
+def _targets(statement: nodes.NodeNG, value: nodes.NodeNG) -> list[nodes.NodeNG]:
+    """The names, attributes and items ``statement`` assigns ``value`` to."""
+    if isinstance(statement, nodes.Assign) and value is statement.value:
+        targets = statement.targets
+    elif isinstance(statement, (nodes.AnnAssign, nodes.AugAssign)) and value is statement.value:
+        targets = [statement.target]
+    elif isinstance(statement, nodes.For) and value is statement.iter:
+        targets = [statement.target]
+    else:
+        return []
+    return [
+        node
+        for target in targets
+        for node in target.nodes_of_class((nodes.AssignName, nodes.AssignAttr, nodes.Subscript))
+        if not isinstance(node.parent, nodes.Subscript)
+    ]
+
+
+def _reads(name: nodes.Name) -> list[nodes.Name]:
+    """The reads of the local name ``name`` that see the same bindings."""
+    return [
+        use for binding in name.lookup(name.name)[1] if isinstance(binding, nodes.AssignName) for use in uses(binding)
+    ]
@@ -2,35 +2,27 @@
 
 from pylint.lint import PyLinter
 
-from pylint_ml.checkers.numpy.numpy_import import NumpyImportChecker
-from pylint_ml.checkers.numpy.numpy_nan_comparison import NumpyNaNComparisonChecker
-from pylint_ml.checkers.pandas.pandas_import import PandasImportChecker
-from pylint_ml.checkers.scipy.scipy_import import ScipyImportChecker
-from pylint_ml.checkers.sklearn.sklearn_import import SklearnImportChecker
-from pylint_ml.checkers.tensorflow.tensorflow_import import TensorflowImportChecker
-from pylint_ml.checkers.torch.torch_parameter import PyTorchParameterChecker
+from pylint_ml.checkers.profiler import ProfilerChecker
+from pylint_ml.checkers.result_cache import ResultCacheChecker
+from pylint_ml.util.lazy_checker import LazyChecker
+from pylint_ml.util.manifest import load_manifest
 
 
 def register(linter: PyLinter) -> None:
     """Register checkers."""
-    # Numpy
-    linter.register_checker(NumpyImportChecker(linter))
-    linter.register_checker(NumpyNaNComparisonChecker(linter))
+    if any(isinstance(checker, ProfilerChecker) for checker in linter.get_checkers()):
+        # ``pylint -j`` workers load the plugins again into a copy of a linter that has them already,
+        # registering them twice would run every checker twice
+        return
 
-    # Pandas
-    linter.register_checker(PandasImportChecker(linter))
+    linter.register_checker(ProfilerChecker(linter))
 
-    # Tensorflow
-    linter.register_checker(TensorflowImportChecker(linter))
-
-    # Torch
-    linter.register_checker(PyTorchParameterChecker(linter))
-
-    # Scipy
-    linter.register_checker(ScipyImportChecker(linter))
-
-    # Sklearn
-    linter.register_checker(SklearnImportChecker(linter))
+    # Library checkers are only imported when one of their messages is enabled, see util/manifest.py
+    for entry in load_manifest():
+        linter.register_checker(LazyChecker(linter, entry))
 
     # Theano
     # Matplotlib
+
+    # Holds the options of the result cache, the library checkers drive it
+    linter.register_checker(ResultCacheChecker(linter))
@@ -0,0 +1,53 @@
+# Licensed under the MIT: https://mit-license.org/
+# For details: https://github.com/pylint-dev/pylint-ml/LICENSE
+# Copyright (c) https://github.com/pylint-dev/pylint-ml/CONTRIBUTORS.txt
+
+"""Resolve the dotted name of a called function once per call node."""
+
+from __future__ import annotations
+
+from typing import NamedTuple
+
+from astroid import nodes
+
+
+class CallName(NamedTuple):
+    """Dotted name of a call such as ``np.random.rand()``.
+
+    ``root`` is the name at the base of the attribute chain (``np``) or ``None`` when the chain
+    starts with something else, e.g. ``get_model().fit()``. ``attrs`` holds the attribute names
+    in source order (``("random", "rand")``).
+    """
+
+    root: str | None
+    attrs: tuple[str, ...]
+
+    @property
+    def tail(self) -> str | None:
+        """The name of the called function or method itself."""
+        if self.attrs:
+            return self.attrs[-1]
+        return self.root
+
+    @property
+    def parts(self) -> tuple[str, ...]:
+        """All resolved name parts, including the root when it is a plain name."""
+        if self.root is None:
+            return self.attrs
+        return (self.root, *self.attrs)
+
+
+def get_call_name(node: nodes.Call) -> CallName:
+    """Walk the attribute chain of ``node.func`` a single time."""
+    return dotted_name(node.func)
+
+
+def dotted_name(node: nodes.NodeNG) -> CallName:
+    """Dotted name of an expression that is not called, e.g. ``torch.no_grad`` in a decorator."""
+    attrs = []
+    while isinstance(node, nodes.Attribute):
+        attrs.append(node.attrname)
+        node = node.expr
+    attrs.reverse()
+    root = node.name if isinstance(node, nodes.Name) else None
+    return CallName(root, tuple(attrs))
@@ -0,0 +1,133 @@
+# Licensed under the MIT: https://mit-license.org/
+# For details: https://github.com/pylint-dev/pylint-ml/LICENSE
+# Copyright (c) https://github.com/pylint-dev/pylint-ml/CONTRIBUTORS.txt
+
+"""Def-use chains of local names, and how each use treats the value of the name."""
+
+from __future__ import annotations
+
+from astroid import nodes
+from astroid.const import Context
+
+from pylint_ml.util.call_name import get_call_name
+from pylint_ml.util.import_table import ImportTable
+from pylint_ml.util.libraries import SUPPORTED_LIBRARIES
+
+READ = "read"
+MUTATED = "mutated"
+# Passed somewhere the analysis cannot follow, e.g. returned or given to a project function
+ESCAPED = "escaped"
+
+# Accessors that index into a DataFrame or Series: ``df.loc[rows, "col"]``
+INDEXERS = frozenset(("at", "iat", "iloc", "loc"))
+
+# Methods that change a DataFrame, Series or array in place
+_MUTATING_METHODS = frozenset(
+    (
+        "fill",
+        "insert",
+        "itemset",
+        "pop",
+        "put",
+        "resize",
+        "setflags",
+        "sort",
+        "update",
+        "__setitem__",
+        "__delitem__",
+    )
+)
+
+# Builtins that only read their arguments
+_READING_BUILTINS = frozenset(("bool", "isinstance", "len", "print", "repr", "str", "type"))
+
+
+def uses(binding: nodes.AssignName) -> list[nodes.Name]:
+    """The reads of a name that ``binding`` reaches, in source order."""
+    return [
+        name
+        for name in binding.scope().nodes_of_class(nodes.Name)
+        if name.name == binding.name and binding in name.lookup(name.name)[1]
+    ]
+
+
+def bound_name(node: nodes.NodeNG) -> nodes.AssignName | None:
+    """The name ``node`` is assigned to in ``name = node``."""
+    parent = node.parent
+    if (
+        isinstance(parent, nodes.Assign)
+        and len(parent.targets) == 1
+        and isinstance(parent.targets[0], nodes.AssignName)
+    ):
+        return parent.targets[0]
+    if isinstance(parent, nodes.AnnAssign) and isinstance(parent.target, nodes.AssignName):
+        return parent.target
+    return None
+
+
+def assigned_names(node: nodes.NodeNG, imports: ImportTable) -> set[str]:
+    """Names and attributes, as written, that ``node`` assigns, deletes or changes in place.
+
+    Nested functions and classes are skipped, they do not run where they are defined.
+    """
+    names = set()
+    for child in node.nodes_of_class(
+        (nodes.AssignName, nodes.DelName, nodes.AssignAttr, nodes.DelAttr, nodes.Name),
+        skip_klass=(nodes.FunctionDef, nodes.Lambda, nodes.ClassDef),
+    ):
+        if isinstance(child, (nodes.AssignName, nodes.DelName)):
+            names.add(child.name)
+        elif isinstance(child, (nodes.AssignAttr, nodes.DelAttr)):
+            names.add(child.as_string())
+        elif not isinstance(child.parent, (nodes.AssignAttr, nodes.DelAttr)) and use_kind(child, imports) == MUTATED:
+            names.add(child.name)
+    return names
+
+
+def use_kind(name: nodes.Name, imports: ImportTable) -> str:
+    """Whether the use ``name`` reads the value, mutates it in place or lets it escape."""
+    accessed: nodes.NodeNG = name
+    parent = name.parent
+    while isinstance(parent, nodes.Attribute) and parent.expr is accessed and parent.attrname in INDEXERS:
+        accessed, parent = parent, parent.parent
+    if isinstance(parent, nodes.Subscript) and parent.value is accessed:
+        # ``df["col"] = 0``, ``df.loc[0] += 1`` and ``del df["col"]`` write to the value, a load
+        # returns a new object
+        return MUTATED if parent.ctx in (Context.Store, Context.Del) else READ
+    if accessed is not name:
+        return READ
+    if isinstance(parent, nodes.AssignAttr):
+        return MUTATED
+    if isinstance(parent, nodes.Attribute):
+        call = parent.parent
+        if isinstance(call, nodes.Call) and call.func is parent and _mutates(call):
+            return MUTATED
+        return READ
+    if isinstance(parent, (nodes.Expr, nodes.BinOp, nodes.Compare, nodes.UnaryOp, nodes.FormattedValue)):
+        return READ
+    if isinstance(parent, (nodes.For, nodes.Comprehension)) and parent.iter is name:
+        return READ
+    if isinstance(parent, (nodes.List, nodes.Tuple)):
+        # ``pd.concat([first, second])``
+        parent = parent.parent
+    if isinstance(parent, nodes.Keyword):
+        parent = parent.parent
+    if isinstance(parent, nodes.Call) and parent.func is not name:
+        call_name = get_call_name(parent)
+        if call_name.root in _READING_BUILTINS and not call_name.attrs:
+            return READ
+        qualified_name = imports.qualify(call_name)
+        if qualified_name is not None and qualified_name.split(".", 1)[0] in SUPPORTED_LIBRARIES:
+            return READ
+    return ESCAPED
+
+
+def _mutates(call: nodes.Call) -> bool:
+    if any(
+        keyword.arg == "inplace" and not (isinstance(keyword.value, nodes.Const) and not keyword.value.value)
+        for keyword in call.keywords
+    ):
+        return True
+    attrname = call.func.attrname
+    # In-place tensor methods end with an underscore: ``mask.fill_(0)``
+    return attrname in _MUTATING_METHODS or (attrname.endswith("_") and not attrname.startswith("_"))
@@ -0,0 +1,100 @@
+# Licensed under the MIT: https://mit-license.org/
+# For details: https://github.com/pylint-dev/pylint-ml/LICENSE
+# Copyright (c) https://github.com/pylint-dev/pylint-ml/CONTRIBUTORS.txt
+
+"""Hashes of project modules together with every module of the project they import, directly or not.
+
+The messages of a module depend on the modules it imports: names imported from them can re-export
+a library, and type inference follows calls of their functions through function summaries, which
+are resolved through the functions those modules call in turn. The result cache and the summary
+index key their entries on these hashes, so that an edit anywhere down the import chain invalidates
+them.
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from pylint_ml.util.libraries import STDLIB_MODULES, SUPPORTED_LIBRARIES
+from pylint_ml.util.source_prefilter import module_path, resolve_modname
+
+# Directories of installed distributions, whose modules are hashed but not followed
+_INSTALLED = {"site-packages", "dist-packages"}
+
+
+def project_imports(source: bytes, modname: str, is_package: bool) -> tuple[str, ...]:
+    """Absolute names of the modules ``source`` imports, in any scope, besides the stdlib and supported libraries.
+
+    ``import helpers`` gives ``helpers``, ``from pkg import helpers`` gives ``pkg`` and
+    ``pkg.helpers``, which is only a module if ``helpers`` is not a name defined in ``pkg``.
+    """
+    return tuple(
+        name
+        for name in dict.fromkeys(_imported_names(source, modname, is_package))
+        if name.split(".", 1)[0] not in STDLIB_MODULES and name.split(".", 1)[0] not in SUPPORTED_LIBRARIES
+    )
+
+
+def _imported_names(source: bytes, modname: str, is_package: bool) -> Iterator[str]:
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            yield from (alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            imported = resolve_modname(node.module or "", node.level, modname, is_package)
+            if imported is None:
+                continue
+            yield imported
+            yield from (f"{imported}.{alias.name}" for alias in node.names if alias.name != "*")
+
+
+class ModuleDigests:
+    """Source hashes and project imports of the modules read so far in this process."""
+
+    def __init__(self) -> None:
+        self._modules: dict[str, tuple[str, tuple[str, ...]] | None] = {}
+
+    def module(self, modname: str) -> tuple[str, tuple[str, ...]] | None:
+        """Hash of the source of ``modname`` and the modules it imports, ``None`` if it has no source.
+
+        The imports of installed modules are not followed, their versions are part of the cache keys.
+        """
+        if modname not in self._modules:
+            self._modules[modname] = self._read(modname)
+        return self._modules[modname]
+
+    def digest(self, modnames: Iterable[str]) -> str:
+        """Hash of the sources of ``modnames`` and of every module they import, directly or not."""
+        closure: dict[str, str] = {}
+        pending = list(modnames)
+        while pending:
+            name = pending.pop()
+            if name in closure:
+                continue
+            found = self.module(name)
+            closure[name] = found[0] if found is not None else "missing"
+            if found is not None:
+                pending.extend(found[1])
+        digest = hashlib.sha256()
+        for name in sorted(closure):
+            digest.update(f"{name}\n{closure[name]}\n".encode())
+        return digest.hexdigest()
+
+    @staticmethod
+    def _read(modname: str) -> tuple[str, tuple[str, ...]] | None:
+        path = module_path(modname)
+        if path is None:
+            return None
+        try:
+            source = Path(path).read_bytes()
+        except OSError:
+            return None
+        if _INSTALLED.intersection(Path(path).parts):
+            return hashlib.sha256(source).hexdigest(), ()
+        return hashlib.sha256(source).hexdigest(), project_imports(source, modname, Path(path).name == "__init__.py")
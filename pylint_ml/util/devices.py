@@ -0,0 +1,84 @@
+# Licensed under the MIT: https://mit-license.org/
+# For details: https://github.com/pylint-dev/pylint-ml/LICENSE
+# Copyright (c) https://github.com/pylint-dev/pylint-ml/CONTRIBUTORS.txt
+
+"""Recognize transfers of tensors and modules between devices, ``x.to(device)`` and ``x.cuda()``."""
+
+from __future__ import annotations
+
+from astroid import nodes
+
+# Names of the dtypes ``Tensor.to`` also accepts, ``x.to(torch.float16)`` converts on the same device
+_DTYPES = frozenset(
+    (
+        "bfloat16",
+        "bool",
+        "complex64",
+        "complex128",
+        "double",
+        "float",
+        "float16",
+        "float32",
+        "float64",
+        "half",
+        "int",
+        "int8",
+        "int16",
+        "int32",
+        "int64",
+        "long",
+        "uint8",
+    )
+)
+
+
+def device_arguments(call: nodes.Call) -> list[nodes.NodeNG]:
+    """The device arguments of ``x.to(...)``, the positional one and ``device=``."""
+    return [*call.args[:1], *(keyword.value for keyword in call.keywords if keyword.arg == "device")]
+
+
+def is_transfer(call: nodes.Call) -> bool:
+    """``x.cuda()`` or ``x.to(device)``, but not ``x.to(torch.float16)``."""
+    func = call.func
+    if not isinstance(func, nodes.Attribute):
+        return False
+    if func.attrname == "cuda":
+        return True
+    if func.attrname != "to":
+        return False
+    devices = device_arguments(call)
+    return bool(devices) and not any(_is_dtype(device) for device in devices)
+
+
+def moves_to_cuda(call: nodes.Call) -> bool:
+    """``x.cuda()`` or ``x.to(...)`` to a device that can be a GPU."""
+    return is_transfer(call) and (call.func.attrname == "cuda" or any(map(is_cuda, device_arguments(call))))
+
+
+def is_cuda(node: nodes.NodeNG, depth: int = 3) -> bool:
+    """Whether ``node`` can be a CUDA device, e.g. ``"cuda:0"`` or ``device`` assigned ``torch.device("cuda")``."""
+    if isinstance(node, nodes.Const):
+        return isinstance(node.value, str) and node.value.startswith("cuda")
+    if isinstance(node, nodes.IfExp):
+        return is_cuda(node.body, depth) or is_cuda(node.orelse, depth)
+    if isinstance(node, nodes.Call) and node.args:
+        # ``torch.device("cuda")``
+        return isinstance(node.func, (nodes.Name, nodes.Attribute)) and is_cuda(node.args[0], depth)
+    if isinstance(node, nodes.Name) and depth > 0:
+        for binding in node.lookup(node.name)[1]:
+            if isinstance(binding.parent, nodes.Assign) and is_cuda(binding.parent.value, depth - 1):
+                return True
+    return False
+
+
+def root_name(node: nodes.NodeNG) -> str | None:
+    """The name an attribute or subscript chain starts from, ``batch`` in ``batch["image"].pixels``."""
+    while isinstance(node, (nodes.Attribute, nodes.Subscript)):
+        node = node.expr if isinstance(node, nodes.Attribute) else node.value
+    return node.name if isinstance(node, nodes.Name) else None
+
+
+def _is_dtype(node: nodes.NodeNG) -> bool:
+    if isinstance(node, nodes.Attribute):
+        return node.attrname in _DTYPES or node.attrname == "dtype"
+    return isinstance(node, nodes.Name) and "dtype" in node.name
@@ -0,0 +1,125 @@
+# Licensed under the MIT: https://mit-license.org/
+# For details: https://github.com/pylint-dev/pylint-ml/LICENSE
+# Copyright (c) https://github.com/pylint-dev/pylint-ml/CONTRIBUTORS.txt
+
+"""Index of what the functions of the project's modules return, stored on disk per module source.
+
+Type inference uses it to type calls of functions imported from other modules, e.g. that
+``events = helpers.load_events()`` is a DataFrame because ``load_events`` returns
+``pd.read_parquet(...)``. The summaries of a module are computed the first time a process needs
+them and, when the result cache is enabled, written to the index, where later runs and the other
+``pylint -j`` workers find them.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from contextlib import suppress
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from astroid import MANAGER, nodes
+from astroid.exceptions import AstroidError
+
+from pylint_ml.util.dependencies import ModuleDigests
+from pylint_ml.util.import_table import ImportTable
+from pylint_ml.util.result_cache import ResultCache
+from pylint_ml.util.type_inference import FunctionSummary, TypeInference
+
+# Part of every key, changed when the summaries computed for the same source change
+SUMMARY_FORMAT = 1
+
+MAX_ENTRIES = 20000
+
+
+class SummaryIndex:
+    """Summaries of the module-level functions of project modules, see ``FunctionSummary``.
+
+    Entries are keyed by a hash of the module's source and of the project modules it imports,
+    directly or through other modules, see ``ModuleDigests``. The summaries of a module are thus
+    recomputed when it or one of those modules changes. Without a directory the summaries are only
+    kept in memory.
+    """
+
+    def __init__(self, directory: str | Path | None) -> None:
+        self._store = ResultCache(directory, MAX_ENTRIES) if directory is not None else None
+        self._modules: dict[str, dict[str, FunctionSummary]] = {}
+        self._digests = ModuleDigests()
+
+    def function(self, qualified_name: str) -> FunctionSummary | None:
+        """Summary of the function importable as ``qualified_name``, ``None`` if it is not one."""
+        modname, _, name = qualified_name.rpartition(".")
+        if not modname:
+            return None
+        return self.module(modname).get(name)
+
+    def module(self, modname: str) -> dict[str, FunctionSummary]:
+        """Summaries of the functions of ``modname`` by name."""
+        if modname in self._modules:
+            return self._modules[modname]
+        # Modules that import each other see no summaries while the other one is computed
+        self._modules[modname] = {}
+        if self._digests.module(modname) is None:
+            return {}
+        key = self._key(modname)
+        summaries = self._load(key)
+        if summaries is None:
+            summaries = self._summarize(modname)
+            if self._store is not None:
+                with suppress(OSError):
+                    self._store.store(key, {name: list(summary) for name, summary in summaries.items()})
+        self._modules[modname] = summaries
+        return summaries
+
+    def _key(self, modname: str) -> str:
+        """Hash of the source of ``modname`` and of every project module it imports, directly or not.
+
+        Summaries are resolved through the summaries of the functions they call, so a change
+        anywhere down the import chain can change them.
+        """
+        digest = hashlib.sha256(f"{SUMMARY_FORMAT}\n{modname}\n".encode())
+        digest.update(self._digests.digest([modname]).encode())
+        return digest.hexdigest()
+
+    def _load(self, key: str) -> dict[str, FunctionSummary] | None:
+        data = self._store.load(key) if self._store is not None else None
+        if not isinstance(data, dict):
+            return None
+        try:
+            return {
+                name: FunctionSummary(returns, tuple(passthrough), tuple(parameters))
+                for name, (returns, passthrough, parameters) in data.items()
+            }
+        except (TypeError, ValueError):
+            return None
+
+    def _summarize(self, modname: str) -> dict[str, FunctionSummary]:
+        try:
+            module = MANAGER.ast_from_module_name(modname)
+        except AstroidError:
+            return {}
+        inference = TypeInference(module, ImportTable.from_module(module), self.function)
+        summaries = {
+            statement.name: inference.summarize(statement)
+            for statement in module.body
+            if isinstance(statement, nodes.FunctionDef)
+        }
+        return {name: summary for name, summary in summaries.items() if summary is not None}
+
+
+def summary_directory(config: Any) -> Path | None:
+    """Where the index of a run is stored, in the result cache directory set with ``ml-cache-dir``.
+
+    ``None`` keeps the summaries in memory, when no cache directory is set or ``--persistent=n``.
+    """
+    directory = getattr(config, "ml_cache_dir", "")
+    if not directory or not getattr(config, "persistent", True):
+        return None
+    return Path(directory) / "summaries"
+
+
+@lru_cache(maxsize=1)
+def summary_index(directory: Path | None) -> SummaryIndex:
+    """The index of the process for ``directory``, see ``summary_directory``."""
+    return SummaryIndex(directory)
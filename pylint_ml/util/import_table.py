@@ -0,0 +1,224 @@
+# Licensed under the MIT: https://mit-license.org/
+# For details: https://github.com/pylint-dev/pylint-ml/LICENSE
+# Copyright (c) https://github.com/pylint-dev/pylint-ml/CONTRIBUTORS.txt
+
+"""Per-module table of the names bound by import statements."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+from astroid import MANAGER, nodes
+from astroid.exceptions import AstroidError, TooManyLevelsError
+
+from pylint_ml.util.call_name import CallName
+from pylint_ml.util.libraries import STDLIB_MODULES, SUPPORTED_LIBRARIES
+from pylint_ml.util.source_prefilter import may_bind_supported_library
+
+# How many ``from x import name`` hops are followed to find what a re-exported name binds to
+MAX_REEXPORT_DEPTH = 3
+
+# Used for names that nothing in the module binds, e.g. names pulled in with a wildcard import
+CONVENTIONAL_ALIASES = {
+    "np": "numpy",
+    "pd": "pandas",
+    "tf": "tensorflow",
+    "plt": "matplotlib.pyplot",
+}
+
+
+class ImportTable:
+    """Map the names bound by imports in one module to the qualified names they refer to.
+
+    ``import numpy as np`` binds ``np`` to ``numpy``, ``from torch import nn`` binds ``nn`` to
+    ``torch.nn``. Imports in every scope of the module are included. Lookups are plain dict
+    accesses.
+
+    The table of the module being linted is shared by every checker: it is built from the
+    ``locals`` of the module's scopes the first time a checker asks for it and dropped by
+    ``release``, so only one table is alive at any time.
+    """
+
+    __slots__ = ("_assigned", "_bindings", "_libraries", "_reexports", "module")
+
+    _current: ImportTable | None = None
+
+    def __init__(self, module: nodes.Module | None = None) -> None:
+        self.module = module
+        self._bindings: dict[str, str] = {}
+        self._libraries: set[str] = set()
+        # Names bound by anything but an import, e.g. ``np = NumberParser()``, in any scope
+        self._assigned: set[str] = set()
+        # Names imported from modules that might re-export a supported library, resolved on demand
+        self._reexports: list[tuple[str, str]] | None = []
+
+    @classmethod
+    def for_module(cls, module: nodes.Module, prefilter: bool = False) -> ImportTable:
+        """Return the shared table of ``module``, building it on first use.
+
+        With ``prefilter``, a module whose source cannot bind a supported library gets an empty
+        table without walking its scopes. Only use it when nothing is checked in such a module.
+        """
+        current = cls._current
+        if current is None or current.module is not module:
+            if prefilter and not may_bind_supported_library(module, MAX_REEXPORT_DEPTH):
+                current = cls(module)
+            else:
+                current = cls.from_module(module)
+            cls._current = current
+        return current
+
+    @classmethod
+    def release(cls, module: nodes.Module) -> None:
+        """Drop the shared table once ``module`` has been checked."""
+        if cls._current is not None and cls._current.module is module:
+            cls._current = None
+
+    @classmethod
+    def from_module(cls, module: nodes.Module) -> ImportTable:
+        table = cls(module)
+        seen = set()
+        scopes = [module]
+        while scopes:
+            scope = scopes.pop()
+            for name, assignments in scope.locals.items():
+                for node in assignments:
+                    if isinstance(node, (nodes.Import, nodes.ImportFrom)):
+                        if node not in seen:
+                            seen.add(node)
+                            table.add(node)
+                        continue
+                    table._assigned.add(name)
+                    if isinstance(node, (nodes.FunctionDef, nodes.ClassDef)) and node.parent is not None:
+                        scopes.append(node)
+        # Wildcard imports only show up in ``locals`` when the imported module could be analysed
+        for node in module.body:
+            if isinstance(node, nodes.ImportFrom) and node not in seen:
+                table.add(node)
+        return table
+
+    def add(self, node: nodes.Import | nodes.ImportFrom) -> None:
+        if isinstance(node, nodes.Import):
+            for name, alias in node.names:
+                # ``import numpy.linalg`` binds ``numpy``, ``import numpy.linalg as la`` binds ``la``
+                self._bind(alias or name.split(".", 1)[0], name if alias else name.split(".", 1)[0])
+            return
+
+        modname = absolute_modname(node.root(), node)
+        if not modname:
+            return
+        for name, alias in node.names:
+            if name == "*":
+                self._libraries.add(modname.split(".", 1)[0])
+            else:
+                self._bind(alias or name, f"{modname}.{name}")
+                package = modname.split(".", 1)[0]
+                if package not in SUPPORTED_LIBRARIES and package not in STDLIB_MODULES and self._reexports is not None:
+                    self._reexports.append((alias or name, f"{modname}.{name}"))
+
+    def _bind(self, name: str, qualified_name: str) -> None:
+        self._bindings[name] = qualified_name
+        self._libraries.add(qualified_name.split(".", 1)[0])
+
+    def _resolve_reexports(self) -> None:
+        """Rebind names imported from project modules that re-export a supported library."""
+        reexports, self._reexports = self._reexports, None
+        for name, imported_name in reexports or ():
+            qualified_name = resolve_reexport(imported_name)
+            if qualified_name is not None and self._bindings.get(name) == imported_name:
+                self._bind(name, qualified_name)
+
+    def qualified_name(self, name: str | None) -> str | None:
+        """The qualified name ``name`` is bound to (``numpy`` for ``np``), if it is imported."""
+        if name is None:
+            return None
+        qualified_name = self._bindings.get(name)
+        if qualified_name is None:
+            return CONVENTIONAL_ALIASES.get(name) if name not in self._assigned else None
+        if self._reexports and qualified_name.split(".", 1)[0] not in SUPPORTED_LIBRARIES:
+            self._resolve_reexports()
+            return self._bindings[name]
+        return qualified_name
+
+    def library_of(self, name: str | None) -> str | None:
+        """The top-level package ``name`` is bound to (``torch`` for ``nn``), if it is imported."""
+        qualified_name = self.qualified_name(name)
+        if qualified_name is None:
+            return None
+        return qualified_name.split(".", 1)[0]
+
+    def qualify(self, call: CallName) -> str | None:
+        """The qualified name of a call, e.g. ``numpy.random.rand`` for ``np.random.rand()``."""
+        qualified_name = self.qualified_name(call.root)
+        if qualified_name is None:
+            return None
+        return ".".join((qualified_name, *call.attrs))
+
+    def project_names(self) -> list[str]:
+        """Qualified names of the imports of project modules, e.g. ``helpers.load_events``."""
+        if self._reexports:
+            self._resolve_reexports()
+        return [
+            qualified_name
+            for qualified_name in self._bindings.values()
+            if qualified_name.split(".", 1)[0] not in SUPPORTED_LIBRARIES
+            and qualified_name.split(".", 1)[0] not in STDLIB_MODULES
+        ]
+
+    def is_library_imported(self, library: str) -> bool:
+        """Whether the module imports ``library`` directly or through a re-export."""
+        if library in self._libraries:
+            return True
+        if self._reexports:
+            self._resolve_reexports()
+            return library in self._libraries
+        return False
+
+
+def absolute_modname(module: nodes.Module, node: nodes.ImportFrom) -> str | None:
+    """Module ``node`` imports from, with relative imports resolved against ``module``."""
+    if not node.level:
+        return node.modname
+    try:
+        return module.relative_to_absolute_name(node.modname, node.level) or None
+    except TooManyLevelsError:
+        return None
+
+
+@lru_cache(maxsize=4096)
+def resolve_reexport(imported_name: str, depth: int = MAX_REEXPORT_DEPTH) -> str | None:
+    """Follow ``from pkg.compat import pd`` to the supported library ``pd`` is bound to in ``pkg.compat``.
+
+    Returns ``None`` if the name is not an import of a supported library or the module cannot be analysed.
+    """
+    modname, _, name = imported_name.rpartition(".")
+    try:
+        module = MANAGER.ast_from_module_name(modname)
+    except AstroidError:
+        return None
+    for node in module.locals.get(name, ()):
+        qualified_name = _imported_name(module, node, name)
+        if qualified_name is None:
+            continue
+        if qualified_name.split(".", 1)[0] in SUPPORTED_LIBRARIES:
+            return qualified_name
+        if depth > 1:
+            return resolve_reexport(qualified_name, depth - 1)
+    return None
+
+
+def _imported_name(module: nodes.Module, node: nodes.NodeNG, name: str) -> str | None:
+    """Qualified name the import ``node`` in ``module`` binds to ``name``, if ``node`` is an import."""
+    if isinstance(node, nodes.Import):
+        for imported, alias in node.names:
+            if alias == name:
+                return imported
+            if alias is None and imported.split(".", 1)[0] == name:
+                return name
+    elif isinstance(node, nodes.ImportFrom):
+        source = absolute_modname(module, node)
+        if source:
+            for imported, alias in node.names:
+                if (alias or imported) == name:
+                    return f"{source}.{imported}"
+    return None
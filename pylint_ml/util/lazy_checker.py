@@ -0,0 +1,44 @@
+# Licensed under the MIT: https://mit-license.org/
+# For details: https://github.com/pylint-dev/pylint-ml/LICENSE
+# Copyright (c) https://github.com/pylint-dev/pylint-ml/CONTRIBUTORS.txt
+
+"""Register a checker from its manifest entry and only import it when it is needed."""
+
+from __future__ import annotations
+
+from pylint.checkers import BaseChecker
+
+from pylint_ml.util.manifest import ManifestEntry, import_checker
+
+
+class LazyChecker(BaseChecker):
+    """Stand-in for a library checker whose module is imported the first time it is opened.
+
+    The messages come from the manifest, so they can be enabled, disabled and listed as usual.
+    ``PyLinter`` only opens checkers with an enabled message; the proxy then creates the real
+    checker and exposes its visit and leave methods for the AST walker to collect.
+    """
+
+    def __init__(self, linter, entry: ManifestEntry):
+        self.name = entry.name
+        self.msgs = entry.msgs
+        super().__init__(linter)
+        self.checker_path = entry.checker
+        self.checker: BaseChecker | None = None
+        self._forwarded: list[str] = []
+
+    def open(self) -> None:
+        if self.checker is None:
+            self.checker = import_checker(self.checker_path)(self.linter)
+        self.checker.open()
+        # Collected after opening, so the methods the profiler instrumented are the ones forwarded
+        self._forwarded = [name for name in dir(self.checker) if name.startswith(("visit_", "leave_"))]
+        for name in self._forwarded:
+            setattr(self, name, getattr(self.checker, name))
+
+    def close(self) -> None:
+        for name in self._forwarded:
+            delattr(self, name)
+        self._forwarded = []
+        if self.checker is not None:
+            self.checker.close()
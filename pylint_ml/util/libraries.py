@@ -0,0 +1,25 @@
+# Licensed under the MIT: https://mit-license.org/
+# For details: https://github.com/pylint-dev/pylint-ml/LICENSE
+# Copyright (c) https://github.com/pylint-dev/pylint-ml/CONTRIBUTORS.txt
+
+"""Libraries the checkers of the plugin know about."""
+
+from __future__ import annotations
+
+import sys
+
+SUPPORTED_LIBRARIES = frozenset(("matplotlib", "numpy", "pandas", "scipy", "sklearn", "tensorflow", "torch"))
+
+# Distribution that installs each library
+DISTRIBUTIONS = {
+    "matplotlib": "matplotlib",
+    "numpy": "numpy",
+    "pandas": "pandas",
+    "scipy": "scipy",
+    "sklearn": "scikit-learn",
+    "tensorflow": "tensorflow",
+    "torch": "torch",
+}
+
+# Modules that never re-export a supported library; Python < 3.10 has no list, so nothing is skipped there
+STDLIB_MODULES = frozenset(getattr(sys, "stdlib_module_names", ()))
@@ -1,31 +1,198 @@
+from __future__ import annotations
+
+import inspect
+from functools import wraps
+from typing import Any
+
+from astroid import nodes
 from pylint.checkers import BaseChecker
+from pylint.interfaces import Confidence
+
+from pylint_ml.util import profiler
+from pylint_ml.util.function_summaries import summary_directory, summary_index
+from pylint_ml.util.import_table import ImportTable
+from pylint_ml.util.loop_index import LoopIndex
+from pylint_ml.util.profiler import Profiler
+from pylint_ml.util.result_cache import RESULT_CACHE_CHECKER, CachedMessage, ModuleResults
+from pylint_ml.util.training import TrainingLoops
+from pylint_ml.util.type_inference import TypeInference
+
+# Parameters of the method ``LibraryHandler.add_message`` overrides, to record the messages passed to it
+_ADD_MESSAGE = inspect.signature(BaseChecker.add_message)
+
+
+def only_if_library_imported(method):
+    """Skip a visit method of a ``LibraryHandler`` in modules that do not import its library."""
+
+    @wraps(method)
+    def wrapper(self, node):
+        if self.library_active:
+            method(self, node)
+
+    return wrapper
 
 
 class LibraryHandler(BaseChecker):
+    """Base checker that knows which library each imported name of the current module binds to.
+
+    Checkers of a single library set ``library`` and decorate their visit methods with
+    ``only_if_library_imported``, which turns them off for modules that import neither the
+    library nor a name re-exported from it. Their messages are recorded for the result cache, and
+    when a module's messages are replayed from it all of them are turned off.
+    """
+
+    library: str | None = None
+
+    # Outside a module pass, e.g. when a unit test calls a visit method directly, checks always run
+    library_active = True
+
+    # Libraries whose types the project functions imported by the module being linted return
+    _returned: tuple[nodes.Module | None, frozenset[str]] = (None, frozenset())
 
     def __init__(self, linter):
         super().__init__(linter)
-        self.imports = {}
-
-    def visit_import(self, node):
-        for name, alias in node.names:
-            self.imports[alias or name] = name
-
-    def visit_importfrom(
-        self,
-        node,
-    ):
-        # TODO Update method to handle either:
-        #   1. Check of specific method-name imported?
-        #   2. Store all method names importfrom libname?
-
-        module = node.modname
-        for name, alias in node.names:
-            full_name = f"{module}.{name}"
-            self.imports[alias or name] = full_name
-
-    def is_library_imported(self, library_name):
-        return any(mod.startswith(library_name) for mod in self.imports.values())
+        self._import_table: ImportTable | None = None
+        self._loop_index: LoopIndex | None = None
+        self._type_inference: TypeInference | None = None
+        self._training_loops: TrainingLoops | None = None
+        self._profiled_methods: list[str] = []
+        # The ``ResultCacheChecker`` of the linter, it lives in the checkers package
+        self._result_cache: Any = None
+
+    def open(self) -> None:
+        # Only registered with the plugin, not in unit tests
+        self._result_cache = next(
+            (checker for checker in self.linter.get_checkers() if checker.name == RESULT_CACHE_CHECKER), None
+        )
+        if self._result_cache is not None:
+            self._result_cache.acquire()
+        # Options are only registered with the plugin, not in unit tests
+        if getattr(self.linter.config, "ml_profile", False):
+            self._profiled_methods = Profiler.acquire().instrument(self)
+
+    def close(self) -> None:
+        if self._result_cache is not None:
+            self._result_cache.release()
+            self._result_cache = None
+        if not self._profiled_methods:
+            return
+        for name in self._profiled_methods:
+            delattr(self, name)
+        self._profiled_methods = []
+        if Profiler.active.release() and not profiler.runs_in_parallel(self.linter):
+            # ``pylint -j`` workers hand their statistics to ``ProfilerChecker.reduce_map_data`` instead
+            profiler.report(self.linter, profiler.merge([Profiler.active.take()]))
+            Profiler.active = None
+
+    def visit_module(self, node: nodes.Module) -> None:
+        if self._result_cache is not None:
+            self._result_cache.module_entered(node)
+        if ModuleResults.is_replayed(node):
+            # The messages of the module were replayed from the result cache
+            self.library_active = False
+            return
+        # A module whose source cannot bind a supported library turns every library checker off,
+        # so its import table is left empty
+        self._import_table = ImportTable.for_module(node, prefilter=True)
+        self.library_active = self.is_active(self._import_table)
+
+    def leave_module(self, node: nodes.Module) -> None:
+        ImportTable.release(node)
+        LoopIndex.release(node)
+        TypeInference.release(node)
+        self._import_table = None
+        self._loop_index = None
+        self._type_inference = None
+        self._training_loops = None
+        if LibraryHandler._returned[0] is node:
+            LibraryHandler._returned = (None, frozenset())
+        if self._result_cache is not None:
+            self._result_cache.module_left(node)
+
+    def add_message(self, msgid: str, *args: Any, **kwargs: Any) -> None:
+        """Emit a message like ``BaseChecker.add_message``, which takes the same arguments."""
+        super().add_message(msgid, *args, **kwargs)
+        passed = _ADD_MESSAGE.bind(self, msgid, *args, **kwargs)
+        passed.apply_defaults()
+        message = passed.arguments
+        confidence: Confidence | None = message["confidence"]
+        ModuleResults.record(
+            CachedMessage(
+                msgid,
+                message["line"],
+                message["col_offset"],
+                message["end_lineno"],
+                message["end_col_offset"],
+                message["args"],
+                confidence.name if confidence else None,
+                None,
+            ),
+            message["node"],
+        )
+        if Profiler.active is not None:
+            Profiler.active.message_emitted()
+
+    def rule_matched(self) -> None:
+        """Count the node being visited as matched by a rule, also when no message is emitted."""
+        if Profiler.active is not None:
+            Profiler.active.matched = True
+
+    def is_active(self, imports: ImportTable) -> bool:
+        """Whether the checker has to look at a module with the given imports.
+
+        A module that only does ``from helpers import load_events`` still gets DataFrames from
+        ``load_events()`` when its summary says it returns one, so it activates the checkers of
+        pandas like an import of pandas does.
+        """
+        if self.library is None or imports.is_library_imported(self.library):
+            return True
+        return self.library in self.returned_libraries(imports)
+
+    def returned_libraries(self, imports: ImportTable) -> frozenset[str]:
+        """Libraries of the types returned by the functions of project modules the module imports."""
+        module, libraries = LibraryHandler._returned
+        if module is None or module is not imports.module:
+            index = summary_index(summary_directory(self.linter.config))
+            summaries = []
+            for name in imports.project_names():
+                summaries.append(index.function(name))
+                summaries.extend(index.module(name).values())
+            libraries = frozenset(
+                summary.returns.split(".", 1)[0] for summary in summaries if summary is not None and summary.returns
+            )
+            LibraryHandler._returned = (imports.module, libraries)
+        return libraries
+
+    def import_table(self, node: nodes.NodeNG) -> ImportTable:
+        """Import table of the module ``node`` belongs to."""
+        if self._import_table is None:
+            # Checkers called outside a full module pass, e.g. in unit tests
+            self._import_table = ImportTable.for_module(node.root())
+        return self._import_table
+
+    def loop_index(self, node: nodes.NodeNG) -> LoopIndex:
+        """Loop index of the module ``node`` belongs to, built the first time a checker needs it."""
+        if self._loop_index is None:
+            self._loop_index = LoopIndex.for_module(self.import_table(node).module or node.root())
+        return self._loop_index
+
+    def training_loops(self, node: nodes.NodeNG) -> TrainingLoops:
+        """Training loops of the module ``node`` belongs to, found the first time a checker needs them."""
+        if self._training_loops is None:
+            self._training_loops = TrainingLoops(self.import_table(node))
+        return self._training_loops
+
+    def inferred_type(self, node: nodes.NodeNG) -> str | None:
+        """Qualified name of the type of ``node`` if it is a DataFrame, Series, array or tensor."""
+        if self._type_inference is None:
+            imports = self.import_table(node)
+            self._type_inference = TypeInference.for_module(
+                imports.module or node.root(), imports, summary_index(summary_directory(self.linter.config)).function
+            )
+        return self._type_inference.type_of(node)
+
+    def is_library_imported(self, library_name: str, node: nodes.NodeNG) -> bool:
+        return self.import_table(node).is_library_imported(library_name)
 
     # def is_library_version_valid(self, lib_version):
     #     # TODO update solution
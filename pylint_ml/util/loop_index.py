@@ -0,0 +1,195 @@
+# Licensed under the MIT: https://mit-license.org/
+# For details: https://github.com/pylint-dev/pylint-ml/LICENSE
+# Copyright (c) https://github.com/pylint-dev/pylint-ml/CONTRIBUTORS.txt
+
+"""Per-module index of the loops every node runs in."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+
+from astroid import nodes
+
+_COMPREHENSIONS = (nodes.ListComp, nodes.SetComp, nodes.DictComp, nodes.GeneratorExp)
+
+
+class LoopContext:
+    """The innermost loop a node runs in.
+
+    ``loop`` is a ``For``, ``While`` or ``Comprehension`` node, ``depth`` is 1 for a loop that
+    is not nested in another loop of the same function, and ``parent`` is the context of the
+    enclosing loop.
+    """
+
+    __slots__ = ("depth", "loop", "parent", "variables")
+
+    def __init__(self, loop: nodes.For | nodes.While | nodes.Comprehension, parent: LoopContext | None) -> None:
+        self.loop = loop
+        self.parent = parent
+        self.depth = parent.depth + 1 if parent is not None else 1
+        # Names the loop assigns on every iteration, none for ``while`` loops
+        target = getattr(loop, "target", None)
+        self.variables = (
+            frozenset(name.name for name in target.nodes_of_class(nodes.AssignName))
+            if target is not None
+            else frozenset()
+        )
+
+    @property
+    def lineno(self) -> int:
+        """Line of the loop statement, or of the comprehension expression."""
+        if isinstance(self.loop, nodes.Comprehension):
+            return self.loop.parent.lineno
+        return self.loop.lineno
+
+    def enclosing_loops(self) -> Iterator[LoopContext]:
+        """This loop and the loops it is nested in, innermost first."""
+        context = self
+        while context is not None:
+            yield context
+            context = context.parent
+
+
+class LoopIndex:
+    """Map the nodes of one module that run repeatedly to the innermost loop they run in.
+
+    Bodies of ``for`` and ``while`` loops, the tests of ``while`` loops and everything but the
+    first iterable of comprehensions are in a loop. The iterable and the ``else`` clause of a
+    ``for`` loop run once. Function and lambda bodies start over at depth 0, because a function
+    defined in a loop does not necessarily run in it.
+
+    The index is built in one pass over the module and lookups are plain dict accesses. Like
+    the ``ImportTable``, the index of the module being linted is shared by every checker and
+    dropped by ``release``.
+    """
+
+    __slots__ = ("_contexts", "module")
+
+    _current: LoopIndex | None = None
+
+    def __init__(self, module: nodes.Module) -> None:
+        self.module = module
+        # Only nodes in a loop are stored, the others are at depth 0
+        self._contexts: dict[nodes.NodeNG, LoopContext] = {}
+        self._index(module)
+
+    @classmethod
+    def for_module(cls, module: nodes.Module) -> LoopIndex:
+        """Return the shared index of ``module``, building it on first use."""
+        current = cls._current
+        if current is None or current.module is not module:
+            current = cls._current = cls(module)
+        return current
+
+    @classmethod
+    def release(cls, module: nodes.Module) -> None:
+        """Drop the shared index once ``module`` has been checked."""
+        if cls._current is not None and cls._current.module is module:
+            cls._current = None
+
+    def _index(self, module: nodes.Module) -> None:
+        contexts = self._contexts
+        stack: list[tuple[nodes.NodeNG, LoopContext | None]] = [(module, None)]
+        while stack:
+            node, context = stack.pop()
+            if context is not None:
+                contexts[node] = context
+            if isinstance(node, nodes.For):
+                inner = LoopContext(node, context)
+                stack.append((node.iter, context))
+                stack.extend((child, context) for child in node.orelse)
+                stack.append((node.target, inner))
+                stack.extend((child, inner) for child in node.body)
+            elif isinstance(node, nodes.While):
+                inner = LoopContext(node, context)
+                stack.extend((child, context) for child in node.orelse)
+                stack.append((node.test, inner))
+                stack.extend((child, inner) for child in node.body)
+            elif isinstance(node, _COMPREHENSIONS):
+                inner = context
+                for position, generator in enumerate(node.generators):
+                    # The first iterable is evaluated once, before the comprehension loops
+                    stack.append((generator.iter, context if position == 0 else inner))
+                    inner = LoopContext(generator, inner)
+                    contexts[generator] = inner
+                    stack.append((generator.target, inner))
+                    stack.extend((condition, inner) for condition in generator.ifs)
+                if isinstance(node, nodes.DictComp):
+                    stack.extend(((node.key, inner), (node.value, inner)))
+                else:
+                    stack.append((node.elt, inner))
+            elif isinstance(node, (nodes.FunctionDef, nodes.Lambda)):
+                # Decorators and default values are evaluated where the function is defined
+                body = {id(child) for child in (node.body if isinstance(node.body, list) else [node.body])}
+                stack.extend((child, None if id(child) in body else context) for child in node.get_children())
+            else:
+                stack.extend((child, context) for child in node.get_children())
+
+    def context(self, node: nodes.NodeNG) -> LoopContext | None:
+        """The innermost loop ``node`` runs in, ``None`` outside loops."""
+        return self._contexts.get(node)
+
+    def depth(self, node: nodes.NodeNG) -> int:
+        """How many loops of its function ``node`` is nested in."""
+        context = self._contexts.get(node)
+        return context.depth if context is not None else 0
+
+    def loop_variables(self, node: nodes.NodeNG) -> frozenset[str]:
+        """Names assigned by the innermost loop ``node`` runs in."""
+        context = self._contexts.get(node)
+        return context.variables if context is not None else frozenset()
+
+    def accumulation(self, call: nodes.Call, operands: set[str]) -> tuple[str, LoopContext] | None:
+        """The variable ``call`` grows in a loop and that loop, see ``reassigned_operand``.
+
+        ``None`` when the result is not assigned back to one of ``operands`` or the call is not in a
+        loop. A loop variable is assigned anew on every iteration, nothing accumulates in it.
+        """
+        accumulator = reassigned_operand(call, operands)
+        context = self._contexts.get(call)
+        if accumulator is None or context is None or accumulator in context.variables:
+            return None
+        return accumulator, context
+
+
+def operand_names(values: Iterable[nodes.NodeNG]) -> set[str]:
+    """Source of the names and attributes in ``values``, including the items of lists and tuples."""
+    names = set()
+    for value in values:
+        items = value.elts if isinstance(value, (nodes.List, nodes.Tuple)) else [value]
+        names.update(item.as_string() for item in items if isinstance(item, (nodes.Name, nodes.Attribute)))
+    return names
+
+
+def reassigned_operand(call: nodes.Call, operands: set[str]) -> str | None:
+    """The name or attribute the result of ``call`` is assigned to, if it is one of ``operands``.
+
+    This is how a loop accumulates into a variable: ``arr = np.append(arr, x)``.
+    """
+    parent = call.parent
+    if isinstance(parent, nodes.Assign) and parent.value is call:
+        targets = parent.targets
+    elif isinstance(parent, (nodes.AnnAssign, nodes.NamedExpr)) and parent.value is call:
+        targets = [parent.target]
+    else:
+        return None
+    for target in targets:
+        if isinstance(target, (nodes.AssignName, nodes.AssignAttr)) and target.as_string() in operands:
+            return target.as_string()
+    return None
+
+
+def range_len_argument(call: nodes.Call) -> nodes.Name | None:
+    """``df`` in ``range(len(df))``."""
+    if not (isinstance(call.func, nodes.Name) and call.func.name == "range" and len(call.args) == 1):
+        return None
+    length = call.args[0]
+    if (
+        isinstance(length, nodes.Call)
+        and isinstance(length.func, nodes.Name)
+        and length.func.name == "len"
+        and len(length.args) == 1
+        and isinstance(length.args[0], nodes.Name)
+    ):
+        return length.args[0]
+    return None
@@ -0,0 +1,99 @@
+# Licensed under the MIT: https://mit-license.org/
+# For details: https://github.com/pylint-dev/pylint-ml/LICENSE
+# Copyright (c) https://github.com/pylint-dev/pylint-ml/CONTRIBUTORS.txt
+
+"""Names and messages of the library checkers, read by the plugin without importing the checkers.
+
+Regenerate ``manifest.json`` after adding a checker or changing a message:
+python -m pylint_ml.util.manifest
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+from pathlib import Path
+from typing import Any, NamedTuple
+
+MANIFEST_PATH = Path(__file__).parent.parent / "manifest.json"
+
+# Library checkers in registration order, as ``module:class``
+CHECKERS = (
+    # Required parameters of all libraries, dispatched from a single visit_call
+    "pylint_ml.checkers.parameter_dispatcher:ParameterDispatcher",
+    # Numpy
+    "pylint_ml.checkers.numpy.numpy_import:NumpyImportChecker",
+    "pylint_ml.checkers.numpy.numpy_nan_comparison:NumpyNaNComparisonChecker",
+    "pylint_ml.checkers.numpy.numpy_dot:NumpyDotChecker",
+    "pylint_ml.checkers.numpy.numpy_append_in_loop:NumpyAppendInLoopChecker",
+    "pylint_ml.checkers.numpy.numpy_vectorizable_loop:NumpyVectorizableLoopChecker",
+    # Pandas
+    "pylint_ml.checkers.pandas.pandas_import:PandasImportChecker",
+    "pylint_ml.checkers.pandas.pandas_dataframe_naming:PandasDataFrameNamingChecker",
+    "pylint_ml.checkers.pandas.pandas_series_naming:PandasSeriesNamingChecker",
+    "pylint_ml.checkers.pandas.pandas_dataframe_bool:PandasDataFrameBoolChecker",
+    "pylint_ml.checkers.pandas.pandas_series_bool:PandasSeriesBoolChecker",
+    "pylint_ml.checkers.pandas.pandas_dataframe_iterrows:PandasIterrowsChecker",
+    "pylint_ml.checkers.pandas.pandas_inplace:PandasInplaceChecker",
+    "pylint_ml.checkers.pandas.pandas_dataframe_values:PandasValuesChecker",
+    "pylint_ml.checkers.pandas.pandas_dataframe_empty_column:PandasEmptyColumnChecker",
+    "pylint_ml.checkers.pandas.pandas_dataframe_column_selection:PandasColumnSelectionChecker",
+    "pylint_ml.checkers.pandas.pandas_concat_in_loop:PandasConcatInLoopChecker",
+    "pylint_ml.checkers.pandas.pandas_row_iteration:PandasRowIterationChecker",
+    "pylint_ml.checkers.pandas.pandas_copy_on_write:PandasCopyOnWriteChecker",
+    "pylint_ml.checkers.pandas.pandas_read_efficiency:PandasReadEfficiencyChecker",
+    "pylint_ml.checkers.pandas.pandas_categorical_dtype:PandasCategoricalDtypeChecker",
+    # PyTorch
+    "pylint_ml.checkers.torch.torch_host_sync:TorchHostSyncChecker",
+    "pylint_ml.checkers.torch.torch_no_grad:TorchNoGradChecker",
+    "pylint_ml.checkers.torch.torch_dataloader:TorchDataLoaderChecker",
+    "pylint_ml.checkers.torch.torch_accumulation:TorchAccumulationChecker",
+    "pylint_ml.checkers.torch.torch_device_transfer:TorchDeviceTransferChecker",
+    # Tensorflow
+    "pylint_ml.checkers.tensorflow.tensorflow_import:TensorflowImportChecker",
+    # Scipy
+    "pylint_ml.checkers.scipy.scipy_import:ScipyImportChecker",
+    # Sklearn
+    "pylint_ml.checkers.sklearn.sklearn_import:SklearnImportChecker",
+)
+
+
+class ManifestEntry(NamedTuple):
+    name: str
+    checker: str
+    msgs: dict[str, tuple[Any, ...]]
+
+
+def import_checker(path: str) -> type:
+    module, _, class_name = path.partition(":")
+    return getattr(importlib.import_module(module), class_name)
+
+
+def build_manifest() -> list[ManifestEntry]:
+    """Import every checker of ``CHECKERS`` and describe it."""
+    entries = []
+    for path in CHECKERS:
+        checker = import_checker(path)
+        if checker.options:
+            # Options have to be known before the configuration is read, long before a checker is opened
+            raise ValueError(f"{path} has options and cannot be loaded lazily")
+        entries.append(ManifestEntry(checker.name, path, dict(checker.msgs)))
+    return entries
+
+
+def load_manifest() -> list[ManifestEntry]:
+    with open(MANIFEST_PATH, encoding="utf-8") as stream:
+        return [
+            ManifestEntry(name, checker, {msgid: tuple(msg) for msgid, msg in msgs.items()})
+            for name, checker, msgs in json.load(stream)
+        ]
+
+
+def write_manifest() -> None:
+    with open(MANIFEST_PATH, "w", encoding="utf-8") as stream:
+        json.dump(build_manifest(), stream, indent=2)
+        stream.write("\n")
+
+
+if __name__ == "__main__":
+    write_manifest()
@@ -0,0 +1,48 @@
+# Licensed under the MIT: https://mit-license.org/
+# For details: https://github.com/pylint-dev/pylint-ml/LICENSE
+# Copyright (c) https://github.com/pylint-dev/pylint-ml/CONTRIBUTORS.txt
+
+"""Base class for the library specific ``*_parameter`` rule sets."""
+
+from __future__ import annotations
+
+from astroid import nodes
+from pylint.interfaces import HIGH
+
+from pylint_ml.util import rule_database
+from pylint_ml.util.call_name import get_call_name
+from pylint_ml.util.library_handler import LibraryHandler, only_if_library_imported
+from pylint_ml.util.rule_database import Rule
+
+
+class ParameterChecker(LibraryHandler):
+    """Report calls that leave out parameters the rule database requires for ``library``.
+
+    Subclasses only provide their messages and ``library``. When the plugin is loaded they are
+    not registered on their own: ``ParameterDispatcher`` matches each call against the rule
+    database once and hands every matching rule to the rule set of its library.
+    """
+
+    @classmethod
+    def message_symbol(cls) -> str:
+        _, symbol, _ = next(iter(cls.msgs.values()))
+        return symbol
+
+    @only_if_library_imported
+    def visit_call(self, node: nodes.Call) -> None:
+        for rule in rule_database.rules().match(get_call_name(node), self.import_table(node)):
+            if rule.library == self.library:
+                self.check_rule(node, rule)
+
+    def check_rule(self, node: nodes.Call, rule: Rule) -> None:
+        self.rule_matched()
+        provided_keywords = {kw.arg for kw in node.keywords if kw.arg is not None}
+        # Collect all missing parameters
+        missing_params = [param for param in rule.params if param not in provided_keywords]
+        if missing_params:
+            self.add_message(
+                self.message_symbol(),
+                node=node,
+                confidence=HIGH,
+                args=(", ".join(missing_params), rule.label),
+            )
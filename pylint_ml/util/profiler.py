@@ -0,0 +1,156 @@
+# Licensed under the MIT: https://mit-license.org/
+# For details: https://github.com/pylint-dev/pylint-ml/LICENSE
+# Copyright (c) https://github.com/pylint-dev/pylint-ml/CONTRIBUTORS.txt
+
+"""Time the visit methods of the checkers and count the nodes they match and the messages they emit."""
+
+from __future__ import annotations
+
+import json
+import sys
+from collections.abc import Callable
+from functools import wraps
+from time import perf_counter
+from typing import IO
+
+from astroid import nodes
+from pylint.checkers import BaseChecker
+from pylint.lint import PyLinter
+
+
+class MethodStats:
+    __slots__ = ("calls", "matched", "messages", "seconds")
+
+    def __init__(self, calls: int = 0, seconds: float = 0.0, matched: int = 0, messages: int = 0) -> None:
+        self.calls = calls
+        self.seconds = seconds
+        self.matched = matched
+        self.messages = messages
+
+    def as_tuple(self) -> tuple[int, float, int, int]:
+        return self.calls, self.seconds, self.matched, self.messages
+
+
+class Profiler:
+    """Statistics of every instrumented ``visit_*`` and ``leave_*`` method of the run.
+
+    One profiler is shared by the checkers that instrument themselves while it is ``active``; it
+    is created by the first checker that acquires it. Checkers that are not instrumented only pay
+    for the ``active is None`` test when they emit a message.
+    """
+
+    active: Profiler | None = None
+
+    def __init__(self) -> None:
+        self.stats: dict[tuple[str, str], MethodStats] = {}
+        self.users = 0
+        # Set when the method being timed matches a rule or emits a message
+        self.matched = False
+        self.messages = 0
+
+    @classmethod
+    def acquire(cls) -> Profiler:
+        if cls.active is None:
+            cls.active = cls()
+        cls.active.users += 1
+        return cls.active
+
+    def release(self) -> bool:
+        """Whether this was the last user of the profiler."""
+        self.users -= 1
+        return self.users == 0
+
+    def instrument(self, checker: BaseChecker) -> list[str]:
+        """Replace the visit and leave methods of ``checker`` by timed ones, return their names."""
+        names = [name for name in dir(checker) if name.startswith(("visit_", "leave_"))]
+        for name in names:
+            setattr(checker, name, self.wrap(checker.name, name, getattr(checker, name)))
+        return names
+
+    def wrap(self, checker_name: str, method_name: str, method: Callable[[nodes.NodeNG], None]):
+        stats = self.stats.setdefault((checker_name, method_name), MethodStats())
+
+        @wraps(method)
+        def timed(node: nodes.NodeNG) -> None:
+            self.matched = False
+            messages = self.messages
+            start = perf_counter()
+            try:
+                method(node)
+            finally:
+                stats.seconds += perf_counter() - start
+                stats.calls += 1
+                stats.messages += self.messages - messages
+                if self.matched:
+                    stats.matched += 1
+
+        return timed
+
+    def message_emitted(self) -> None:
+        self.matched = True
+        self.messages += 1
+
+    def take(self) -> dict[tuple[str, str], tuple[int, float, int, int]]:
+        """Remove and return the statistics collected so far."""
+        stats, self.stats = self.stats, {}
+        return {key: method_stats.as_tuple() for key, method_stats in stats.items()}
+
+
+def merge(collected: list[dict[tuple[str, str], tuple[int, float, int, int]]]) -> dict[tuple[str, str], MethodStats]:
+    """Sum the statistics taken from several profilers, e.g. those of ``pylint -j`` workers."""
+    merged: dict[tuple[str, str], MethodStats] = {}
+    for stats in collected:
+        for key, (calls, seconds, matched, messages) in stats.items():
+            total = merged.setdefault(key, MethodStats())
+            total.calls += calls
+            total.seconds += seconds
+            total.matched += matched
+            total.messages += messages
+    return merged
+
+
+def write_report(stats: dict[tuple[str, str], MethodStats], stream: IO[str], as_json: bool = False) -> None:
+    """Write the statistics sorted by time, slowest method first."""
+    rows = sorted(stats.items(), key=lambda item: item[1].seconds, reverse=True)
+    if as_json:
+        json.dump(
+            [
+                {
+                    "checker": checker,
+                    "method": method,
+                    "calls": method_stats.calls,
+                    "matched": method_stats.matched,
+                    "messages": method_stats.messages,
+                    "seconds": method_stats.seconds,
+                }
+                for (checker, method), method_stats in rows
+            ],
+            stream,
+            indent=2,
+        )
+        stream.write("\n")
+        return
+    stream.write(
+        f"{'pylint-ml checker':<48}{'calls':>10}{'matched':>10}{'messages':>10}{'seconds':>10}{'us/call':>9}\n"
+    )
+    for (checker, method), method_stats in rows:
+        per_call = method_stats.seconds / method_stats.calls * 1e6 if method_stats.calls else 0.0
+        stream.write(
+            f"{checker + '.' + method:<48}{method_stats.calls:>10}{method_stats.matched:>10}"
+            f"{method_stats.messages:>10}{method_stats.seconds:>10.4f}{per_call:>9.2f}\n"
+        )
+
+
+def runs_in_parallel(linter: PyLinter) -> bool:
+    """Whether ``linter`` hands the files to ``pylint -j`` workers, mirroring ``PyLinter.check``."""
+    return not linter.config.from_stdin and linter.config.jobs > 1
+
+
+def report(linter: PyLinter, stats: dict[tuple[str, str], MethodStats]) -> None:
+    """Write the profile to the file set with ``ml-profile-output`` as JSON, or as a table to stderr."""
+    output = linter.config.ml_profile_output
+    if output:
+        with open(output, "w", encoding="utf-8") as stream:
+            write_report(stats, stream, as_json=True)
+    else:
+        write_report(stats, sys.stderr)
@@ -0,0 +1,235 @@
+# Licensed under the MIT: https://mit-license.org/
+# For details: https://github.com/pylint-dev/pylint-ml/LICENSE
+# Copyright (c) https://github.com/pylint-dev/pylint-ml/CONTRIBUTORS.txt
+
+"""On-disk cache of the messages the plugin emitted for a module, keyed by a content hash."""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import time
+from contextlib import suppress
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from astroid import nodes
+from astroid.nodes.utils import Position
+from pylint.interfaces import CONFIDENCE_MAP
+from pylint.lint import PyLinter
+from pylint.utils import get_module_and_frameid
+
+# Name of the checker that holds the options of the cache and drives it, see checkers/result_cache.py
+RESULT_CACHE_CHECKER = "ml-result-cache"
+
+# Every process trims the cache after this many writes; the first write of a process trims it as well
+EVICT_EVERY = 32
+
+# Temporary files of writers that died before renaming them are removed after an hour
+STALE_TEMPFILE_NS = 3600 * 10**9
+
+
+class CachedMessage(NamedTuple):
+    """A message with the location ``PyLinter.add_message`` resolved for it."""
+
+    msgid: str
+    line: int | None
+    col_offset: int | None
+    end_lineno: int | None
+    end_col_offset: int | None
+    args: Any
+    confidence: str | None
+    # Names of the frames enclosing the node, ``None`` for messages emitted without a node
+    frame: tuple[str, ...] | None
+
+
+class ResultCache:
+    """Directory with one JSON file of cached messages per key, trimmed to ``max_entries`` files.
+
+    Reading an entry updates its modification time, and trimming removes the entries that were
+    least recently used. Entries are written to a temporary file and renamed into place, so
+    concurrent ``pylint -j`` workers only ever read complete entries. An entry that cannot be read
+    is a cache miss.
+    """
+
+    def __init__(self, directory: str | os.PathLike[str], max_entries: int) -> None:
+        self.directory = Path(directory)
+        self.max_entries = max_entries
+        self._writes_since_eviction = EVICT_EVERY
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> list[CachedMessage] | None:
+        data = self.load(key)
+        try:
+            return [
+                CachedMessage(
+                    msgid,
+                    line,
+                    col_offset,
+                    end_lineno,
+                    end_col_offset,
+                    tuple(args) if isinstance(args, list) else args,
+                    confidence,
+                    None if frame is None else tuple(frame),
+                )
+                for msgid, line, col_offset, end_lineno, end_col_offset, args, confidence, frame in data
+            ]
+        except (TypeError, ValueError):
+            return None
+
+    def put(self, key: str, messages: list[CachedMessage]) -> None:
+        self.store(key, [list(message) for message in messages])
+
+    def load(self, key: str) -> Any:
+        """The JSON data of an entry, ``None`` if there is none or it cannot be read."""
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except OSError:
+            return None
+        try:
+            return json.loads(data)
+        except ValueError:
+            return None
+
+    def store(self, key: str, data: Any) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tempfile_path = tempfile.mkstemp(dir=self.directory, prefix=".tmp-", suffix=".json")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as stream:
+                json.dump(data, stream, default=str)
+            os.replace(tempfile_path, self._path(key))
+        except BaseException:
+            with suppress(OSError):
+                os.unlink(tempfile_path)
+            raise
+        self._writes_since_eviction += 1
+        if self._writes_since_eviction >= EVICT_EVERY:
+            self.evict()
+
+    def evict(self) -> None:
+        """Remove the least recently used entries above ``max_entries``."""
+        self._writes_since_eviction = 0
+        now = time.time_ns()
+        entries = []
+        with os.scandir(self.directory) as scan:
+            for entry in scan:
+                if not entry.name.endswith(".json"):
+                    continue
+                try:
+                    mtime = entry.stat().st_mtime_ns
+                except OSError:
+                    # Removed by another worker in the meantime
+                    continue
+                if entry.name.startswith(".tmp-"):
+                    if now - mtime > STALE_TEMPFILE_NS:
+                        with suppress(OSError):
+                            os.unlink(entry.path)
+                    continue
+                entries.append((mtime, entry.path))
+        if len(entries) <= self.max_entries:
+            return
+        entries.sort()
+        for _, path in entries[: len(entries) - self.max_entries]:
+            with suppress(OSError):
+                os.unlink(path)
+
+
+class ModuleResults:
+    """Messages the checkers of the plugin emit for the module being linted.
+
+    Like the import table, there is a single slot shared by every checker. Messages are only
+    recorded when the result cache missed for the module; when it hit, the cached messages were
+    replayed and the library checkers stay off.
+    """
+
+    _module: nodes.Module | None = None
+    _replayed = False
+    _messages: list[CachedMessage] | None = None
+
+    @classmethod
+    def record_module(cls, module: nodes.Module) -> None:
+        cls._module, cls._replayed, cls._messages = module, False, []
+
+    @classmethod
+    def replay_module(cls, linter: PyLinter, module: nodes.Module, messages: list[CachedMessage]) -> None:
+        cls._module, cls._replayed, cls._messages = module, True, None
+        for message in messages:
+            node = None if message.frame is None else _ReplayedNode(module, message)
+            linter.add_message(
+                message.msgid,
+                line=message.line,
+                node=node,
+                args=message.args,
+                confidence=CONFIDENCE_MAP.get(message.confidence) if message.confidence else None,
+                col_offset=message.col_offset,
+                end_lineno=message.end_lineno,
+                end_col_offset=message.end_col_offset,
+            )
+
+    @classmethod
+    def is_started(cls, module: nodes.Module) -> bool:
+        """Whether ``module`` is already being recorded or was replayed."""
+        return cls._module is module
+
+    @classmethod
+    def is_replayed(cls, module: nodes.Module) -> bool:
+        return cls._replayed and cls._module is module
+
+    @classmethod
+    def record(cls, message: CachedMessage, node: nodes.NodeNG | None) -> None:
+        """Record a message emitted on ``node`` with its location resolved the way ``PyLinter.add_message`` does."""
+        if cls._messages is None:
+            return
+        if node is not None:
+            position = node.position or Position(node.fromlineno, node.col_offset, node.end_lineno, node.end_col_offset)
+            _, obj = get_module_and_frameid(node)
+            message = message._replace(
+                line=message.line or position.lineno,
+                col_offset=message.col_offset or position.col_offset,
+                end_lineno=message.end_lineno or position.end_lineno,
+                end_col_offset=message.end_col_offset or position.end_col_offset,
+                frame=tuple(obj.split(".")) if obj else (),
+            )
+        cls._messages.append(message)
+
+    @classmethod
+    def finish(cls, module: nodes.Module) -> list[CachedMessage] | None:
+        """The messages recorded for ``module``, ``None`` if they were not recorded."""
+        messages = cls._messages if cls._module is module else None
+        cls._module, cls._replayed, cls._messages = None, False, None
+        return messages
+
+
+class _ReplayedFrame:
+    def __init__(self, name: str, parent: nodes.NodeNG | _ReplayedFrame) -> None:
+        self.name = name
+        self.parent = parent
+
+    def frame(self) -> _ReplayedFrame:
+        return self
+
+
+class _ReplayedNode:
+    """Stand-in for the node a cached message was emitted on.
+
+    It only provides what ``PyLinter.add_message`` reads from a node: the position, the names of
+    the enclosing frames and the module.
+    """
+
+    def __init__(self, module: nodes.Module, message: CachedMessage) -> None:
+        self.position = Position(message.line, message.col_offset, message.end_lineno, message.end_col_offset)
+        self._module = module
+        self._frame: nodes.NodeNG | _ReplayedFrame = module
+        for name in message.frame or ():
+            self._frame = _ReplayedFrame(name, self._frame)
+
+    def frame(self) -> nodes.NodeNG | _ReplayedFrame:
+        return self._frame
+
+    def root(self) -> nodes.Module:
+        return self._module
@@ -0,0 +1,207 @@
+# Licensed under the MIT: https://mit-license.org/
+# For details: https://github.com/pylint-dev/pylint-ml/LICENSE
+# Copyright (c) https://github.com/pylint-dev/pylint-ml/CONTRIBUTORS.txt
+
+"""Rule database of the parameters that calls of library functions and methods should pass.
+
+The rules live in ``required_params.json``. Every rule has:
+
+- ``name``: qualified name of the function, class or method, e.g. ``pandas.DataFrame.fillna``.
+  The library is its first component.
+- ``params``: the keyword arguments a call has to pass.
+- ``aliases``: other qualified names of the same object, e.g. ``tensorflow.keras.models.Sequential``.
+- ``label``: the name shown in messages, by default the last component of ``name``.
+- ``versions``: the library versions the rule applies to, e.g. ``>=1.0,<2.1``. Without it, the
+  rule applies to every version.
+- ``method``: ``true`` for methods, which are called on instances whose type is usually unknown.
+  They are then matched by their name. ``by_method_name: false`` turns that off for methods
+  whose name is too common.
+- ``note``: a comment.
+
+The database is compiled once into lookup tables, which are cached in pylint's home directory.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import operator
+import os
+import pickle
+import re
+import sys
+import tempfile
+from contextlib import suppress
+from functools import cache, lru_cache
+from pathlib import Path
+from typing import NamedTuple
+
+from pylint.constants import PYLINT_HOME
+
+from pylint_ml.util.call_name import CallName
+from pylint_ml.util.import_table import ImportTable
+from pylint_ml.util.libraries import DISTRIBUTIONS, SUPPORTED_LIBRARIES
+
+RULES_PATH = Path(__file__).parent.parent / "required_params.json"
+
+# Version of the format of ``required_params.json``
+DATABASE_VERSION = 1
+
+# Bump when the compiled structures change, so that cached databases are compiled again
+COMPILED_FORMAT = 1
+
+_OPERATORS = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+_SPECIFIER = re.compile(r"\s*(<=|>=|==|!=|<|>)\s*(\d+(?:\.\d+)*)\s*$")
+_VERSION = re.compile(r"\d+(?:\.\d+)*")
+
+
+class Rule(NamedTuple):
+    library: str
+    name: str
+    label: str
+    params: tuple[str, ...]
+    versions: tuple[tuple[str, tuple[int, ...]], ...]
+    method: bool
+
+
+class RuleDatabase:
+    """The rules compiled into lookups by qualified name and by method name.
+
+    ``match`` looks calls of imported names up by their qualified name. Calls on anything else,
+    typically an instance, are looked up by the method name. They only match when exactly one of
+    the libraries imported by the module has a rule for it, because the receiver could belong
+    to any of them.
+    """
+
+    def __init__(self, compiled: list[Rule], names: dict[Rule, tuple[str, ...]], by_method_name: set[Rule]) -> None:
+        self.by_name: dict[str, tuple[Rule, ...]] = {}
+        self.by_method_name: dict[str, tuple[Rule, ...]] = {}
+        tails: dict[str, set[str]] = {}
+        for rule in compiled:
+            for name in names[rule]:
+                self.by_name[name] = (*self.by_name.get(name, ()), rule)
+                tails.setdefault(rule.library, set()).add(name.rsplit(".", 1)[-1])
+            tail = rule.name.rsplit(".", 1)[-1]
+            if rule in by_method_name and all(
+                other.library != rule.library for other in self.by_method_name.get(tail, ())
+            ):
+                # The first method of a library with that name is the one matched
+                self.by_method_name[tail] = (*self.by_method_name.get(tail, ()), rule)
+        # Names of the called functions that can match a rule, per library
+        self.tails = {library: frozenset(names) for library, names in tails.items()}
+
+    def match(self, call: CallName, imports: ImportTable) -> tuple[Rule, ...]:
+        """Rules of the installed library versions that apply to ``call``."""
+        qualified_name = imports.qualify(call)
+        if qualified_name is not None and qualified_name.split(".", 1)[0] in SUPPORTED_LIBRARIES:
+            matched = self.by_name.get(qualified_name, ())
+        else:
+            matched = tuple(
+                rule for rule in self.by_method_name.get(call.tail, ()) if imports.is_library_imported(rule.library)
+            )
+            if len(matched) > 1:
+                return ()
+        return tuple(rule for rule in matched if not rule.versions or version_applies(rule))
+
+    @classmethod
+    def compile(cls, data: dict) -> RuleDatabase:
+        if data.get("version") != DATABASE_VERSION:
+            raise ValueError(f"unsupported rule database version {data.get('version')!r}")
+        compiled = []
+        names = {}
+        by_method_name = set()
+        for entry in data["rules"]:
+            name = entry["name"]
+            rule = Rule(
+                library=name.split(".", 1)[0],
+                name=name,
+                label=entry.get("label", name.rsplit(".", 1)[-1]),
+                params=tuple(entry["params"]),
+                versions=parse_specifiers(entry.get("versions", "")),
+                method=entry.get("method", False),
+            )
+            if rule.library not in SUPPORTED_LIBRARIES:
+                raise ValueError(f"rule {name!r} is not for a supported library")
+            compiled.append(rule)
+            names[rule] = (name, *entry.get("aliases", ()))
+            if rule.method and entry.get("by_method_name", True):
+                by_method_name.add(rule)
+        return cls(compiled, names, by_method_name)
+
+
+def parse_specifiers(text: str) -> tuple[tuple[str, tuple[int, ...]], ...]:
+    specifiers = []
+    for specifier in filter(None, text.split(",")):
+        match = _SPECIFIER.match(specifier)
+        if match is None:
+            raise ValueError(f"invalid version specifier {specifier!r}")
+        specifiers.append((match.group(1), parse_version(match.group(2))))
+    return tuple(specifiers)
+
+
+def parse_version(text: str) -> tuple[int, ...]:
+    """Numeric release of a version, without trailing zeros so that ``2.1`` equals ``2.1.0``."""
+    match = _VERSION.match(text)
+    if match is None:
+        return ()
+    release = [int(part) for part in match.group().split(".")]
+    while release and release[-1] == 0:
+        release.pop()
+    return tuple(release)
+
+
+@cache
+def installed_version(library: str) -> tuple[int, ...] | None:
+    # Imported here, it is slow to import and only needed for rules with a version range
+    from importlib import metadata  # pylint: disable=import-outside-toplevel
+
+    try:
+        return parse_version(metadata.version(DISTRIBUTIONS[library]))
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def version_applies(rule: Rule) -> bool:
+    """Whether the installed version of the library is in the range of ``rule``, never if it is unknown."""
+    version = installed_version(rule.library)
+    return version is not None and all(_OPERATORS[op](version, bound) for op, bound in rule.versions)
+
+
+def load(path: Path = RULES_PATH, cache_dir: Path | None = None) -> RuleDatabase:
+    """Compile the rules at ``path``, or load them from the cache if they were compiled before."""
+    source = path.read_bytes()
+    digest = hashlib.sha256(source)
+    digest.update(f"{COMPILED_FORMAT}:{sys.version_info[:2]}".encode())
+    cache_path = (cache_dir or Path(PYLINT_HOME) / "pylint_ml") / f"{path.stem}-{digest.hexdigest()[:16]}.pickle"
+    try:
+        with open(cache_path, "rb") as stream:
+            database = pickle.load(stream)
+        if isinstance(database, RuleDatabase):
+            return database
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        pass
+    database = RuleDatabase.compile(json.loads(source))
+    with suppress(OSError):
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tempfile_path = tempfile.mkstemp(dir=cache_path.parent, prefix=".tmp-", suffix=".pickle")
+        try:
+            with os.fdopen(fd, "wb") as stream:
+                pickle.dump(database, stream, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tempfile_path, cache_path)
+        except OSError:
+            os.unlink(tempfile_path)
+            raise
+    return database
+
+
+@lru_cache(maxsize=1)
+def rules() -> RuleDatabase:
+    """The rule database of the plugin."""
+    return load()
@@ -0,0 +1,115 @@
+# Licensed under the MIT: https://mit-license.org/
+# For details: https://github.com/pylint-dev/pylint-ml/LICENSE
+# Copyright (c) https://github.com/pylint-dev/pylint-ml/CONTRIBUTORS.txt
+
+"""Decide from the raw source of a module whether it can bind a supported library at all."""
+
+from __future__ import annotations
+
+import os
+import re
+from collections.abc import Iterator
+from functools import lru_cache
+
+from astroid import nodes
+from astroid.modutils import file_from_modpath
+
+from pylint_ml.util.libraries import STDLIB_MODULES, SUPPORTED_LIBRARIES
+
+# Any mention of a library, including comments and strings, so that every import of it is caught
+LIBRARY_NAME = re.compile(rb"\b(?:" + b"|".join(name.encode() for name in sorted(SUPPORTED_LIBRARIES)) + rb")\b")
+
+# ``from <module> import``, anywhere in the source and across line continuations
+FROM_IMPORT = re.compile(rb"\bfrom[\s\\]+(\.*)[\s\\]*([^\s\\(]*)[\s\\]+import\b")
+
+
+def may_bind_supported_library(module: nodes.Module, depth: int) -> bool:
+    """Whether an import of ``module`` can bind a supported library.
+
+    Only the source bytes are scanned: a module that never names a supported library and only
+    imports from the standard library cannot bind one. Names imported from other modules might be
+    re-exports, so their sources are scanned the same way, up to ``depth`` hops away. Whenever the
+    answer is not certain the module is reported as possibly binding a library.
+    """
+    source = module_source(module)
+    if source is None:
+        return True
+    return _source_may_bind(source, module.name, module.package, depth)
+
+
+def module_source(module: nodes.Module) -> bytes | None:
+    """Source bytes of ``module``, if it was built from source."""
+    source = module.file_bytes
+    if source is None:
+        if not module.file or not module.file.endswith(".py"):
+            return None
+        try:
+            with open(module.file, "rb") as stream:
+                return stream.read()
+        except OSError:
+            return None
+    if isinstance(source, str):
+        return source.encode("utf-8")
+    return source
+
+
+def imported_modules(source: bytes, modname: str, is_package: bool) -> Iterator[str | None]:
+    """Absolute names of the modules ``source`` imports names from, ``None`` if one cannot be resolved."""
+    for match in FROM_IMPORT.finditer(source):
+        yield resolve_modname(match[2].decode("utf-8", "replace"), len(match[1]), modname, is_package)
+
+
+def module_path(modname: str) -> str | None:
+    """Path of the source file of the module importable as ``modname``."""
+    try:
+        path = file_from_modpath(modname.split("."))
+    except ImportError:
+        return None
+    return path if path and path.endswith(".py") else None
+
+
+def read_module(modname: str) -> tuple[bytes, bool] | None:
+    """Source bytes of the module importable as ``modname`` and whether it is a package."""
+    path = module_path(modname)
+    if path is None:
+        return None
+    try:
+        with open(path, "rb") as stream:
+            return stream.read(), os.path.basename(path) == "__init__.py"
+    except OSError:
+        return None
+
+
+def _source_may_bind(source: bytes, modname: str, is_package: bool, depth: int) -> bool:
+    if LIBRARY_NAME.search(source):
+        return True
+    for imported in imported_modules(source, modname, is_package):
+        if imported is None:
+            return True
+        if imported.split(".", 1)[0] in STDLIB_MODULES:
+            continue
+        if depth <= 0 or _module_may_bind(imported, depth - 1):
+            return True
+    return False
+
+
+@lru_cache(maxsize=4096)
+def _module_may_bind(modname: str, depth: int) -> bool:
+    """Like ``may_bind_supported_library`` for the module importable as ``modname``."""
+    module = read_module(modname)
+    if module is None:
+        return True
+    source, is_package = module
+    return _source_may_bind(source, modname, is_package, depth)
+
+
+def resolve_modname(name: str, level: int, modname: str, is_package: bool) -> str | None:
+    """Resolve ``from <level dots><name> import`` in the module ``modname``."""
+    if not level:
+        return name or None
+    package = modname if is_package else modname.rpartition(".")[0]
+    for _ in range(level - 1):
+        package = package.rpartition(".")[0]
+    if not package:
+        return None
+    return f"{package}.{name}" if name else package
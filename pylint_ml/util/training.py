@@ -0,0 +1,77 @@
+# Licensed under the MIT: https://mit-license.org/
+# For details: https://github.com/pylint-dev/pylint-ml/LICENSE
+# Copyright (c) https://github.com/pylint-dev/pylint-ml/CONTRIBUTORS.txt
+
+"""Recognize the training steps of PyTorch code, ``loss.backward()`` and ``optimizer.step()``."""
+
+from __future__ import annotations
+
+from astroid import nodes
+
+from pylint_ml.util.call_name import get_call_name
+from pylint_ml.util.import_table import ImportTable
+
+# Nested scopes do not run where they are defined
+_SCOPES = (nodes.FunctionDef, nodes.Lambda, nodes.ClassDef)
+
+
+def is_backward(call: nodes.Call) -> bool:
+    """``loss.backward()``."""
+    return isinstance(call.func, nodes.Attribute) and call.func.attrname == "backward"
+
+
+def is_optimizer_step(call: nodes.Call, imports: ImportTable) -> bool:
+    """``optimizer.step()``, or ``scaler.step(optimizer)`` with a gradient scaler."""
+    if not (isinstance(call.func, nodes.Attribute) and call.func.attrname == "step"):
+        return False
+    return any(is_optimizer(node, imports) for node in (call.func.expr, *call.args[:1]))
+
+
+def is_optimizer(node: nodes.NodeNG, imports: ImportTable) -> bool:
+    """Whether ``node`` names an optimizer, by its name or by the ``torch.optim`` class it is created from."""
+    if not isinstance(node, (nodes.Name, nodes.Attribute)):
+        return False
+    if "optim" in node.as_string().lower():
+        return True
+    if isinstance(node, nodes.Name):
+        for binding in node.lookup(node.name)[1]:
+            value = binding.parent.value if isinstance(binding.parent, nodes.Assign) else None
+            if isinstance(value, nodes.Call):
+                qualified_name = imports.qualify(get_call_name(value))
+                if qualified_name is not None and qualified_name.startswith("torch.optim."):
+                    return True
+    return False
+
+
+def training_calls(node: nodes.NodeNG, imports: ImportTable) -> list[nodes.Call]:
+    """The ``backward()`` and optimizer step calls that run in the loop or function ``node``."""
+    return [
+        call
+        for call in node.nodes_of_class(nodes.Call, skip_klass=_SCOPES)
+        if is_backward(call) or is_optimizer_step(call, imports)
+    ]
+
+
+class TrainingLoops:
+    """The training steps of the loops and functions of one module, computed once per node."""
+
+    def __init__(self, imports: ImportTable) -> None:
+        self.imports = imports
+        self._calls: dict[nodes.NodeNG, list[nodes.Call]] = {}
+
+    def calls(self, node: nodes.NodeNG) -> list[nodes.Call]:
+        if node not in self._calls:
+            self._calls[node] = training_calls(node, self.imports)
+        return self._calls[node]
+
+    def trains(self, node: nodes.NodeNG) -> bool:
+        """Whether the loop or function ``node`` runs a training step."""
+        return bool(self.calls(node))
+
+    def losses(self, node: nodes.NodeNG) -> set[str]:
+        """The tensors the loop or function ``node`` calls ``backward()`` on, as written."""
+        return {
+            call.func.expr.as_string()
+            for call in self.calls(node)
+            if is_backward(call) and isinstance(call.func.expr, (nodes.Name, nodes.Attribute))
+        }
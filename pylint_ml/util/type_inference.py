@@ -0,0 +1,612 @@
+# Licensed under the MIT: https://mit-license.org/
+# For details: https://github.com/pylint-dev/pylint-ml/LICENSE
+# Copyright (c) https://github.com/pylint-dev/pylint-ml/CONTRIBUTORS.txt
+
+"""Infer which names hold DataFrames, Series, arrays and tensors without astroid's inference.
+
+Types are propagated from calls of constructor and IO functions, e.g. ``pd.read_csv``, through
+assignments, the methods of the types and arithmetic, and from annotations of parameters and
+variables. Calls of the functions of the project are typed with a ``FunctionSummary`` of what
+the function returns.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import NamedTuple
+
+from astroid import nodes
+
+from pylint_ml.util.call_name import get_call_name
+from pylint_ml.util.import_table import ImportTable
+from pylint_ml.util.libraries import STDLIB_MODULES, SUPPORTED_LIBRARIES
+
+DATAFRAME = "pandas.DataFrame"
+SERIES = "pandas.Series"
+NDARRAY = "numpy.ndarray"
+TORCH_TENSOR = "torch.Tensor"
+TF_TENSOR = "tensorflow.Tensor"
+
+# How many assignments, calls and operations are followed to type an expression
+MAX_DEPTH = 8
+
+# torch functions that return a tensor
+TORCH_FUNCTIONS = frozenset(
+    (
+        "torch.arange",
+        "torch.as_tensor",
+        "torch.cat",
+        "torch.empty",
+        "torch.eye",
+        "torch.from_numpy",
+        "torch.full",
+        "torch.linspace",
+        "torch.matmul",
+        "torch.ones",
+        "torch.ones_like",
+        "torch.rand",
+        "torch.rand_like",
+        "torch.randint",
+        "torch.randn",
+        "torch.randn_like",
+        "torch.stack",
+        "torch.tensor",
+        "torch.tril",
+        "torch.triu",
+        "torch.zeros",
+        "torch.zeros_like",
+    )
+)
+
+# Type of the value returned by library functions, by qualified name
+_FUNCTIONS = {
+    **dict.fromkeys(
+        (
+            "pandas.DataFrame",
+            "pandas.concat",
+            "pandas.crosstab",
+            "pandas.get_dummies",
+            "pandas.json_normalize",
+            "pandas.merge",
+            "pandas.merge_asof",
+            "pandas.pivot_table",
+        ),
+        DATAFRAME,
+    ),
+    "pandas.Series": SERIES,
+    **dict.fromkeys(
+        (
+            "numpy.append",
+            "numpy.arange",
+            "numpy.array",
+            "numpy.asanyarray",
+            "numpy.asarray",
+            "numpy.column_stack",
+            "numpy.concatenate",
+            "numpy.dstack",
+            "numpy.empty",
+            "numpy.empty_like",
+            "numpy.eye",
+            "numpy.full",
+            "numpy.full_like",
+            "numpy.genfromtxt",
+            "numpy.hstack",
+            "numpy.identity",
+            "numpy.linspace",
+            "numpy.loadtxt",
+            "numpy.logspace",
+            "numpy.ones",
+            "numpy.ones_like",
+            "numpy.random.normal",
+            "numpy.random.permutation",
+            "numpy.random.rand",
+            "numpy.random.randint",
+            "numpy.random.randn",
+            "numpy.random.random",
+            "numpy.random.standard_normal",
+            "numpy.random.uniform",
+            "numpy.stack",
+            "numpy.vstack",
+            "numpy.zeros",
+            "numpy.zeros_like",
+        ),
+        NDARRAY,
+    ),
+    **dict.fromkeys(TORCH_FUNCTIONS, TORCH_TENSOR),
+    **dict.fromkeys(
+        (
+            "tensorflow.cast",
+            "tensorflow.concat",
+            "tensorflow.constant",
+            "tensorflow.convert_to_tensor",
+            "tensorflow.fill",
+            "tensorflow.linspace",
+            "tensorflow.matmul",
+            "tensorflow.ones",
+            "tensorflow.ones_like",
+            "tensorflow.random.normal",
+            "tensorflow.random.uniform",
+            "tensorflow.range",
+            "tensorflow.reshape",
+            "tensorflow.stack",
+            "tensorflow.transpose",
+            "tensorflow.zeros",
+            "tensorflow.zeros_like",
+        ),
+        TF_TENSOR,
+    ),
+}
+
+# Qualified name prefixes of functions that return a known type
+_FUNCTION_PREFIXES = (("pandas.read_", DATAFRAME),)
+
+# Type of the value returned by the methods of each type
+_METHODS = {
+    DATAFRAME: {
+        **dict.fromkeys(
+            (
+                "abs",
+                "add_prefix",
+                "add_suffix",
+                "append",
+                "assign",
+                "astype",
+                "bfill",
+                "clip",
+                "copy",
+                "corr",
+                "cov",
+                "cumsum",
+                "describe",
+                "diff",
+                "drop",
+                "drop_duplicates",
+                "dropna",
+                "ffill",
+                "fillna",
+                "filter",
+                "head",
+                "interpolate",
+                "isna",
+                "isnull",
+                "join",
+                "mask",
+                "melt",
+                "merge",
+                "nlargest",
+                "notna",
+                "nsmallest",
+                "pct_change",
+                "pivot",
+                "pivot_table",
+                "query",
+                "rank",
+                "reindex",
+                "rename",
+                "replace",
+                "reset_index",
+                "round",
+                "sample",
+                "select_dtypes",
+                "set_index",
+                "shift",
+                "sort_index",
+                "sort_values",
+                "tail",
+                "transpose",
+                "where",
+            ),
+            DATAFRAME,
+        ),
+        **dict.fromkeys(
+            (
+                "all",
+                "any",
+                "count",
+                "duplicated",
+                "idxmax",
+                "idxmin",
+                "max",
+                "mean",
+                "median",
+                "min",
+                "nunique",
+                "std",
+                "sum",
+                "var",
+            ),
+            SERIES,
+        ),
+        "to_numpy": NDARRAY,
+    },
+    SERIES: {
+        **dict.fromkeys(
+            (
+                "abs",
+                "append",
+                "astype",
+                "between",
+                "clip",
+                "copy",
+                "cumsum",
+                "diff",
+                "drop",
+                "drop_duplicates",
+                "dropna",
+                "fillna",
+                "head",
+                "isin",
+                "isna",
+                "isnull",
+                "map",
+                "mask",
+                "notna",
+                "pct_change",
+                "rank",
+                "rename",
+                "replace",
+                "round",
+                "sample",
+                "shift",
+                "sort_index",
+                "sort_values",
+                "tail",
+                "value_counts",
+                "where",
+            ),
+            SERIES,
+        ),
+        "to_frame": DATAFRAME,
+        "to_numpy": NDARRAY,
+        "unique": NDARRAY,
+    },
+    NDARRAY: dict.fromkeys(
+        (
+            "astype",
+            "clip",
+            "copy",
+            "cumsum",
+            "flatten",
+            "ravel",
+            "reshape",
+            "round",
+            "squeeze",
+            "swapaxes",
+            "transpose",
+        ),
+        NDARRAY,
+    ),
+    TORCH_TENSOR: {
+        **dict.fromkeys(
+            (
+                "abs",
+                "clone",
+                "contiguous",
+                "cpu",
+                "cuda",
+                "detach",
+                "double",
+                "flatten",
+                "float",
+                "half",
+                "int",
+                "long",
+                "matmul",
+                "permute",
+                "reshape",
+                "squeeze",
+                "to",
+                "transpose",
+                "unsqueeze",
+                "view",
+            ),
+            TORCH_TENSOR,
+        ),
+        "numpy": NDARRAY,
+    },
+    TF_TENSOR: {"numpy": NDARRAY},
+}
+
+# Type of the attributes of each type
+_ATTRIBUTES = {
+    DATAFRAME: {"T": DATAFRAME, "values": NDARRAY},
+    SERIES: {"values": NDARRAY},
+    NDARRAY: {"T": NDARRAY},
+    TORCH_TENSOR: {"T": TORCH_TENSOR, "data": TORCH_TENSOR, "grad": TORCH_TENSOR},
+}
+
+_ANNOTATIONS = {DATAFRAME, SERIES, NDARRAY, TORCH_TENSOR, TF_TENSOR}
+
+# Methods and attributes that return a value of the type of their receiver, whatever it is
+_SAME_TYPE = frozenset(
+    name
+    for table in (*_METHODS.values(), *_ATTRIBUTES.values())
+    for name, returned in table.items()
+    if all(
+        other_table[name] == receiver
+        for receiver, other_table in (*_METHODS.items(), *_ATTRIBUTES.items())
+        if name in other_table
+    )
+)
+
+# Type of a name whose assignments are being inferred. An assignment that depends on the name
+# itself, e.g. ``df = df.dropna()``, does not change its type.
+_PENDING = "pending"
+
+
+class FunctionSummary(NamedTuple):
+    """What a function returns.
+
+    ``returns`` is the type every returned value has, if they agree. Otherwise ``passthrough``
+    names the parameters whose value is returned, possibly through methods that keep its type
+    as in ``return df.dropna()``, so that calls get the type of their arguments.
+    ``parameters`` are the names of the positional parameters.
+    """
+
+    returns: str | None
+    passthrough: tuple[str, ...]
+    parameters: tuple[str, ...]
+
+
+class TypeInference:
+    """Types of the expressions of one module.
+
+    The type of a name is the type every assignment of the name in its scope agrees on, whatever
+    the order of the assignments. It is computed the first time it is asked for and memoized per
+    scope, so that every checker reuses it. Like the ``ImportTable``, the inference of the module
+    being linted is shared by every checker and dropped by ``release``.
+    """
+
+    __slots__ = ("_functions", "_imports", "_names", "_summaries", "module")
+
+    _current: TypeInference | None = None
+
+    def __init__(
+        self,
+        module: nodes.Module,
+        imports: ImportTable,
+        summaries: Callable[[str], FunctionSummary | None] | None = None,
+    ) -> None:
+        self.module = module
+        self._imports = imports
+        # Summary of a function of another module of the project, by qualified name
+        self._summaries = summaries
+        self._names: dict[tuple[nodes.LocalsDictNodeNG, str], str | None] = {}
+        self._functions: dict[nodes.FunctionDef, FunctionSummary] = {}
+
+    @classmethod
+    def for_module(
+        cls,
+        module: nodes.Module,
+        imports: ImportTable,
+        summaries: Callable[[str], FunctionSummary | None] | None = None,
+    ) -> TypeInference:
+        """Return the shared inference of ``module``, creating it on first use."""
+        current = cls._current
+        if current is None or current.module is not module:
+            current = cls._current = cls(module, imports, summaries)
+        return current
+
+    @classmethod
+    def release(cls, module: nodes.Module) -> None:
+        """Drop the shared inference once ``module`` has been checked."""
+        if cls._current is not None and cls._current.module is module:
+            cls._current = None
+
+    def type_of(self, node: nodes.NodeNG) -> str | None:
+        """Qualified name of the type of the value of ``node``, e.g. ``pandas.DataFrame``, if it is known."""
+        inferred = self._type_of(node, 0)
+        return None if inferred is _PENDING else inferred
+
+    def _type_of(self, node: nodes.NodeNG, depth: int) -> str | None:
+        if depth > MAX_DEPTH:
+            return None
+        if isinstance(node, nodes.Name):
+            return self._name_type(node, depth)
+        if isinstance(node, nodes.Call):
+            return self._call_type(node, depth)
+        if isinstance(node, nodes.Attribute):
+            receiver = self._type_of(node.expr, depth + 1)
+            if receiver is _PENDING:
+                return _PENDING if node.attrname in _SAME_TYPE else None
+            return _ATTRIBUTES.get(receiver, {}).get(node.attrname)
+        if isinstance(node, nodes.Subscript):
+            value = node.value
+            indexer = isinstance(value, nodes.Attribute) and value.attrname in ("loc", "iloc")
+            receiver = self._type_of(value.expr if indexer else value, depth + 1)
+            if receiver in (DATAFRAME, SERIES, _PENDING) and is_row_filter(node.slice):
+                # ``df[df["price"] > 0]`` and ``s.iloc[:10]`` select rows
+                return receiver
+            if receiver == DATAFRAME and not indexer:
+                # ``df["price"]`` selects a column, ``df[["price", "quantity"]]`` several
+                if isinstance(node.slice, nodes.Const) and isinstance(node.slice.value, str):
+                    return SERIES
+                if isinstance(node.slice, nodes.List):
+                    return DATAFRAME
+            return None
+        if isinstance(node, nodes.BinOp):
+            # Arithmetic with numbers or a value of the same type keeps the type
+            types = {
+                _PENDING if isinstance(operand, nodes.Const) else self._type_of(operand, depth + 1)
+                for operand in (node.left, node.right)
+            }
+            types.discard(_PENDING)
+            return types.pop() if len(types) == 1 else None
+        return None
+
+    def _call_type(self, node: nodes.Call, depth: int) -> str | None:
+        if isinstance(node.func, nodes.Attribute):
+            receiver = self._type_of(node.func.expr, depth + 1)
+            if receiver is _PENDING:
+                # ``df = df.dropna()`` keeps the type of ``df``, ``df = df.to_numpy()`` does not
+                return _PENDING if node.func.attrname in _SAME_TYPE else None
+            if receiver is not None:
+                return _METHODS.get(receiver, {}).get(node.func.attrname)
+        qualified_name = self._imports.qualify(get_call_name(node))
+        if qualified_name is not None:
+            inferred = _FUNCTIONS.get(qualified_name)
+            if inferred is not None:
+                return inferred
+            for prefix, prefix_type in _FUNCTION_PREFIXES:
+                if qualified_name.startswith(prefix):
+                    return prefix_type
+            package = qualified_name.split(".", 1)[0]
+            if self._summaries is None or package in SUPPORTED_LIBRARIES or package in STDLIB_MODULES:
+                return None
+            summary = self._summaries(qualified_name)
+        elif isinstance(node.func, nodes.Name):
+            # A function of the module itself
+            definitions = node.func.lookup(node.func.name)[1]
+            if len(definitions) != 1 or not isinstance(definitions[0], nodes.FunctionDef):
+                return None
+            # Builtins such as ``sorted`` are looked up to their stubs in astroid's builtins module
+            if definitions[0].root() is not node.root():
+                return None
+            summary = self.summarize(definitions[0])
+        else:
+            return None
+        if summary is None:
+            return None
+        if summary.returns is not None or not summary.passthrough:
+            return summary.returns
+        types = {self._type_of(argument, depth + 1) for argument in _passed_arguments(node, summary)}
+        return types.pop() if len(types) == 1 else None
+
+    def summarize(self, function: nodes.FunctionDef) -> FunctionSummary | None:
+        """What ``function`` returns, see ``FunctionSummary``, ``None`` if it has no source, e.g. a builtin."""
+        if function.args.args is None:
+            return None
+        summary = self._functions.get(function)
+        if summary is not None:
+            return summary
+        parameters = tuple(arg.name for arg in (*function.args.posonlyargs, *function.args.args))
+        # Recursive calls have no type
+        self._functions[function] = FunctionSummary(None, (), parameters)
+        values = [
+            statement.value
+            for statement in function.nodes_of_class(nodes.Return, skip_klass=(nodes.FunctionDef, nodes.ClassDef))
+        ]
+        if not values or None in values:
+            return self._functions[function]
+        types = {self.type_of(value) for value in values}
+        if len(types) == 1 and None not in types:
+            summary = FunctionSummary(types.pop(), (), parameters)
+        else:
+            # Every returned value has to be a parameter
+            returned = {_returned_parameter(function, value) for value in values}
+            passthrough = () if None in returned else tuple(sorted(returned))
+            summary = FunctionSummary(None, passthrough, parameters)
+        self._functions[function] = summary
+        return summary
+
+    def _name_type(self, node: nodes.Name, depth: int) -> str | None:
+        scope, _ = node.lookup(node.name)
+        key = (scope, node.name)
+        if key in self._names:
+            return self._names[key]
+        self._names[key] = _PENDING
+        types = {self._binding_type(binding, depth + 1) for binding in scope.locals.get(node.name, ())}
+        types.discard(_PENDING)
+        inferred = types.pop() if len(types) == 1 else None
+        self._names[key] = inferred
+        return inferred
+
+    def _binding_type(self, binding: nodes.NodeNG, depth: int) -> str | None:
+        if not isinstance(binding, nodes.AssignName):
+            return None
+        parent = binding.parent
+        if isinstance(parent, nodes.AugAssign):
+            return _PENDING
+        if isinstance(parent, nodes.AnnAssign):
+            return self.annotation_type(parent.annotation) or (
+                self._type_of(parent.value, depth) if parent.value is not None else None
+            )
+        if isinstance(parent, (nodes.Assign, nodes.NamedExpr)):
+            return self._type_of(parent.value, depth)
+        if isinstance(parent, nodes.Arguments):
+            return self.annotation_type(parameter_annotation(parent, binding))
+        return None
+
+    def annotation_type(self, annotation: nodes.NodeNG | None) -> str | None:
+        """The type an annotation such as ``pd.DataFrame`` names, if it is one of the inferred types."""
+        if not isinstance(annotation, (nodes.Name, nodes.Attribute)):
+            return None
+        root, _, rest = annotation.as_string().partition(".")
+        qualified_name = self._imports.qualified_name(root)
+        if qualified_name is None:
+            return None
+        qualified_name = f"{qualified_name}.{rest}" if rest else qualified_name
+        return qualified_name if qualified_name in _ANNOTATIONS else None
+
+
+def is_row_filter(node: nodes.NodeNG) -> bool:
+    """Whether ``node`` indexes rows, a boolean mask such as ``df["price"] > 0`` or a slice."""
+    if isinstance(node, nodes.BinOp):
+        return node.op in ("&", "|", "^") and is_row_filter(node.left) and is_row_filter(node.right)
+    if isinstance(node, nodes.UnaryOp):
+        return node.op == "~" and is_row_filter(node.operand)
+    return isinstance(node, (nodes.Compare, nodes.Slice))
+
+
+def same_type_receiver(node: nodes.NodeNG) -> nodes.NodeNG:
+    """The value whose type a chain of methods, attributes and arithmetic with numbers keeps.
+
+    ``df`` in ``df.dropna().T * 2``.
+    """
+    while True:
+        if isinstance(node, nodes.Call) and isinstance(node.func, nodes.Attribute) and node.func.attrname in _SAME_TYPE:
+            node = node.func.expr
+        elif isinstance(node, nodes.Attribute) and node.attrname in _SAME_TYPE:
+            node = node.expr
+        elif isinstance(node, nodes.BinOp) and isinstance(node.right, nodes.Const):
+            node = node.left
+        elif isinstance(node, nodes.BinOp) and isinstance(node.left, nodes.Const):
+            node = node.right
+        else:
+            return node
+
+
+def _returned_parameter(function: nodes.FunctionDef, value: nodes.NodeNG) -> str | None:
+    """The parameter of ``function`` that ``value`` returns, possibly through methods that keep its type."""
+    receiver = same_type_receiver(value)
+    if not isinstance(receiver, nodes.Name):
+        return None
+    bindings = function.locals.get(receiver.name, ())
+    for binding in bindings:
+        parent = binding.parent
+        if isinstance(parent, nodes.Assign):
+            # ``df = df.dropna()``
+            rebound = same_type_receiver(parent.value)
+            if not isinstance(rebound, nodes.Name) or rebound.name != receiver.name:
+                return None
+        elif not isinstance(parent, (nodes.Arguments, nodes.AugAssign)):
+            return None
+    if any(isinstance(binding.parent, nodes.Arguments) for binding in bindings):
+        return receiver.name
+    return None
+
+
+def _passed_arguments(call: nodes.Call, summary: FunctionSummary) -> list[nodes.NodeNG | None]:
+    """The arguments of ``call`` for the parameters of ``summary.passthrough``, ``None`` for defaults."""
+    arguments: list[nodes.NodeNG | None] = []
+    for parameter in summary.passthrough:
+        position = summary.parameters.index(parameter) if parameter in summary.parameters else len(call.args)
+        if position < len(call.args):
+            arguments.append(call.args[position])
+        else:
+            keyword = next((keyword for keyword in call.keywords if keyword.arg == parameter), None)
+            arguments.append(keyword.value if keyword is not None else None)
+    return arguments
+
+
+def parameter_annotation(arguments: nodes.Arguments, parameter: nodes.AssignName) -> nodes.NodeNG | None:
+    """Annotation of a parameter of a function or lambda."""
+    for group, group_annotations in (
+        (arguments.posonlyargs, arguments.posonlyargs_annotations),
+        (arguments.args, arguments.annotations),
+        (arguments.kwonlyargs, arguments.kwonlyargs_annotations),
+    ):
+        # Indexed rather than zipped, zip(strict=) needs Python 3.10
+        if parameter in group:
+            return group_annotations[group.index(parameter)]
+    return None
@@ -0,0 +1,113 @@
+import astroid
+import pylint.testutils
+from pylint.interfaces import HIGH
+
+from pylint_ml.checkers.numpy.numpy_append_in_loop import NumpyAppendInLoopChecker
+
+
+class TestNumpyAppendInLoopChecker(pylint.testutils.CheckerTestCase):
+    CHECKER_CLASS = NumpyAppendInLoopChecker
+
+    def test_append_in_for_loop(self):
+        node = astroid.extract_node(
+            """
+            import numpy as np
+            arr = np.array([])
+            for value in values:
+                arr = np.append(arr, value * 2)  #@
+            """
+        )
+        append_call = node.value
+
+        with self.assertAddsMessages(
+            pylint.testutils.MessageTest(
+                msg_id="numpy-append-in-loop",
+                confidence=HIGH,
+                node=append_call,
+                args=("arr", "append()", 4),
+            ),
+            ignore_position=True,
+        ):
+            self.checker.visit_call(append_call)
+
+    def test_vstack_in_while_loop_with_other_alias(self):
+        node = astroid.extract_node(
+            """
+            import numpy as numeric
+            rows = numeric.empty((0, 3))
+            while reader.has_next():
+                rows = numeric.vstack([rows, reader.next_row()])  #@
+            """
+        )
+        vstack_call = node.value
+
+        with self.assertAddsMessages(
+            pylint.testutils.MessageTest(
+                msg_id="numpy-append-in-loop",
+                confidence=HIGH,
+                node=vstack_call,
+                args=("rows", "vstack()", 4),
+            ),
+            ignore_position=True,
+        ):
+            self.checker.visit_call(vstack_call)
+
+    def test_concatenate_in_comprehension(self):
+        node = astroid.extract_node(
+            """
+            from numpy import concatenate
+            steps = [(acc := concatenate((acc, chunk))) for chunk in chunks]  #@
+            """
+        )
+        concatenate_call = node.value.elt.value
+
+        with self.assertAddsMessages(
+            pylint.testutils.MessageTest(
+                msg_id="numpy-append-in-loop",
+                confidence=HIGH,
+                node=concatenate_call,
+                args=("acc", "concatenate()", 3),
+            ),
+            ignore_position=True,
+        ):
+            self.checker.visit_call(concatenate_call)
+
+    def test_stack_once_after_loop(self):
+        node = astroid.extract_node(
+            """
+            import numpy as np
+            rows = []
+            for record in records:
+                rows.append(record.features)
+            matrix = np.vstack(rows)  #@
+            """
+        )
+        vstack_call = node.value
+
+        with self.assertNoMessages():
+            self.checker.visit_call(vstack_call)
+
+    def test_append_outside_loop(self):
+        node = astroid.extract_node(
+            """
+            import numpy as np
+            arr = np.append(arr, [1, 2, 3])  #@
+            """
+        )
+        append_call = node.value
+
+        with self.assertNoMessages():
+            self.checker.visit_call(append_call)
+
+    def test_list_append_in_loop(self):
+        node = astroid.extract_node(
+            """
+            import numpy as np
+            for value in values:
+                arr = arr.append(value)  #@
+            """
+        )
+        append_call = node.value
+
+        with self.assertNoMessages():
+            self.checker.visit_call(append_call)
@@ -9,9 +9,9 @@ class TestNumpyDotChecker(pylint.testutils.CheckerTestCase):
     CHECKER_CLASS = NumpyDotChecker
 
     def test_warning_for_dot(self):
-        import_np, node = astroid.extract_node(
+        node = astroid.extract_node(
             """
-        import numpy as np #@
+        import numpy as np
         a = np.array([1, 2])
         b = np.array([3, 4])
         np.dot(a, b) #@
@@ -26,5 +26,33 @@ class TestNumpyDotChecker(pylint.testutils.CheckerTestCase):
             ),
             ignore_position=True,
         ):
-            self.checker.visit_import(import_np)
+            self.checker.visit_call(node)
+
+    def test_warning_for_dot_with_other_alias(self):
+        node = astroid.extract_node(
+            """
+        import numpy as npy
+        npy.dot(a, b) #@
+        """
+        )
+
+        with self.assertAddsMessages(
+            pylint.testutils.MessageTest(
+                msg_id="numpy-dot-usage",
+                node=node,
+                confidence=HIGH,
+            ),
+            ignore_position=True,
+        ):
+            self.checker.visit_call(node)
+
+    def test_no_warning_for_other_library_named_np(self):
+        node = astroid.extract_node(
+            """
+        import mylib as np
+        np.dot(a, b) #@
+        """
+        )
+
+        with self.assertNoMessages():
             self.checker.visit_call(node)
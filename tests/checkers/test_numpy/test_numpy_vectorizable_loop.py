@@ -0,0 +1,187 @@
+import astroid
+import pylint.testutils
+from pylint.interfaces import HIGH
+
+from pylint_ml.checkers.numpy.numpy_vectorizable_loop import NumpyVectorizableLoopChecker
+
+
+class TestNumpyVectorizableLoopChecker(pylint.testutils.CheckerTestCase):
+    CHECKER_CLASS = NumpyVectorizableLoopChecker
+
+    def test_index_loop_with_arithmetic(self):
+        node = astroid.extract_node(
+            """
+            import numpy as np
+            arr = np.linspace(0, 1, 100)
+            out = np.empty_like(arr)
+            for i in range(len(arr)):  #@
+                out[i] = np.sqrt(arr[i]) * 2 + 1
+            """
+        )
+
+        with self.assertAddsMessages(
+            pylint.testutils.MessageTest(
+                msg_id="numpy-vectorizable-loop",
+                confidence=HIGH,
+                node=node,
+                args=("arr", "arithmetic and math functions"),
+            ),
+            ignore_position=True,
+        ):
+            self.checker.visit_for(node)
+
+    def test_element_loop_with_comparison_and_reduction(self):
+        node = astroid.extract_node(
+            """
+            import numpy as np
+            def positive_total(values: np.ndarray) -> float:
+                total = 0.0
+                for value in values:  #@
+                    if value > 0:
+                        total += value
+                return total
+            """
+        )
+
+        with self.assertAddsMessages(
+            pylint.testutils.MessageTest(
+                msg_id="numpy-vectorizable-loop",
+                confidence=HIGH,
+                node=node,
+                args=("values", "comparisons and reductions"),
+            ),
+            ignore_position=True,
+        ):
+            self.checker.visit_for(node)
+
+    def test_enumerate_loop_into_list(self):
+        node = astroid.extract_node(
+            """
+            import numpy as np
+            scores = np.random.rand(10)
+            labels = []
+            for i, score in enumerate(scores):  #@
+                labels.append(score >= 0.5)
+            """
+        )
+
+        with self.assertAddsMessages(
+            pylint.testutils.MessageTest(
+                msg_id="numpy-vectorizable-loop",
+                confidence=HIGH,
+                node=node,
+                args=("scores", "comparisons"),
+            ),
+            ignore_position=True,
+        ):
+            self.checker.visit_for(node)
+
+    def test_loop_calling_other_function(self):
+        node = astroid.extract_node(
+            """
+            import numpy as np
+            arr = np.arange(10)
+            for x in arr:  #@
+                out.append(fetch(x))
+            """
+        )
+
+        with self.assertNoMessages():
+            self.checker.visit_for(node)
+
+    def test_loop_with_side_effects(self):
+        node = astroid.extract_node(
+            """
+            import numpy as np
+            arr = np.arange(10)
+            for x in arr:  #@
+                print(x * 2)
+            """
+        )
+
+        with self.assertNoMessages():
+            self.checker.visit_for(node)
+
+    def test_loop_over_list(self):
+        node = astroid.extract_node(
+            """
+            import numpy as np
+            values = [1, 2, 3]
+            total = 0
+            for value in values:  #@
+                total += value * 2
+            """
+        )
+
+        with self.assertNoMessages():
+            self.checker.visit_for(node)
+
+    def test_conditional_count(self):
+        node = astroid.extract_node(
+            """
+            import numpy as np
+            arr = np.random.rand(10)
+            count = 0
+            for i in range(len(arr)):  #@
+                if arr[i] > 0.5:
+                    count += 1
+            """
+        )
+
+        with self.assertAddsMessages(
+            pylint.testutils.MessageTest(
+                msg_id="numpy-vectorizable-loop",
+                confidence=HIGH,
+                node=node,
+                args=("arr", "comparisons and reductions"),
+            ),
+            ignore_position=True,
+        ):
+            self.checker.visit_for(node)
+
+    def test_temporary_assigned_before_it_is_read(self):
+        node = astroid.extract_node(
+            """
+            import numpy as np
+            arr = np.linspace(0, 1, 100)
+            out = np.empty_like(arr)
+            for i in range(len(arr)):  #@
+                scaled = arr[i] * 2
+                out[i] = scaled + 1
+            """
+        )
+
+        with self.assertAddsMessages(
+            pylint.testutils.MessageTest(
+                msg_id="numpy-vectorizable-loop",
+                confidence=HIGH,
+                node=node,
+                args=("arr", "arithmetic"),
+            ),
+            ignore_position=True,
+        ):
+            self.checker.visit_for(node)
+
+    def test_loop_carried_recurrence(self):
+        nodes = astroid.extract_node(
+            """
+            import numpy as np
+            signal = np.random.rand(100)
+            out = np.empty_like(signal)
+            for i in range(len(signal)):  #@
+                out[i] = 0.1 * signal[i] + 0.9 * out[i - 1]
+            level = 0.0
+            smoothed = []
+            for x in signal:  #@
+                level = 0.9 * level + 0.1 * x
+                smoothed.append(level)
+            previous = 0.0
+            for x in signal:  #@
+                smoothed.append(x - previous)
+                previous = x
+            """
+        )
+
+        with self.assertNoMessages():
+            for node in nodes:
+                self.checker.visit_for(node)
@@ -0,0 +1,143 @@
+import astroid
+import pylint.testutils
+from pylint.interfaces import HIGH
+
+from pylint_ml.checkers.pandas.pandas_categorical_dtype import PandasCategoricalDtypeChecker
+
+
+class TestPandasCategoricalDtypeChecker(pylint.testutils.CheckerTestCase):
+    CHECKER_CLASS = PandasCategoricalDtypeChecker
+
+    def test_columns_compared_grouped_and_merged(self):
+        node = astroid.extract_node(
+            """
+            import pandas as pd
+            def swedish_orders(regions):
+                orders = pd.read_csv("orders.csv", dtype={"region": str})  #@
+                swedish = orders[orders["country"] == "SE"]
+                totals = swedish.groupby("country")["amount"].sum()
+                return pd.merge(orders, regions, on="region"), totals
+            """
+        )
+        read_call = node.value
+
+        with self.assertAddsMessages(
+            pylint.testutils.MessageTest(
+                msg_id="pandas-categorical-column",
+                confidence=HIGH,
+                node=read_call,
+                args=(
+                    "country",
+                    "orders",
+                    "equality and grouping",
+                    "category",
+                    "read_csv(dtype={'country': 'category'})",
+                ),
+            ),
+            pylint.testutils.MessageTest(
+                msg_id="pandas-categorical-column",
+                confidence=HIGH,
+                node=read_call,
+                args=(
+                    "region",
+                    "orders",
+                    "merge keys",
+                    "string[pyarrow]",
+                    "read_csv(dtype={'region': 'string[pyarrow]'})",
+                ),
+            ),
+            ignore_position=True,
+        ):
+            self.checker.visit_call(read_call)
+
+    def test_reader_without_dtype_uses_astype(self):
+        node = astroid.extract_node(
+            """
+            import pandas as pd
+            tickets = pd.read_parquet("tickets.parquet")  #@
+            open_tickets = tickets.loc[tickets["status"].isin(["open", "reopened"]), "id"]
+            """
+        )
+        read_call = node.value
+
+        with self.assertAddsMessages(
+            pylint.testutils.MessageTest(
+                msg_id="pandas-categorical-column",
+                confidence=HIGH,
+                node=read_call,
+                args=("status", "tickets", "equality", "category", ".astype({'status': 'category'})"),
+            ),
+            ignore_position=True,
+        ):
+            self.checker.visit_call(read_call)
+
+    def test_columns_used_otherwise(self):
+        nodes = astroid.extract_node(
+            """
+            import pandas as pd
+            users = pd.read_csv("users.csv")  #@
+            admins = users[users["role"] == "admin"]
+            users["email"] = users["email"].str.lower()
+            users.groupby("team").size()
+            print(users[users["email"] != ""])
+            events = pd.read_csv("events.csv", dtype={"kind": "category"})  #@
+            clicks = events[events["kind"] == "click"]
+            """
+        )
+
+        with self.assertAddsMessages(
+            pylint.testutils.MessageTest(
+                msg_id="pandas-categorical-column",
+                confidence=HIGH,
+                node=nodes[0].value,
+                args=("role", "users", "equality", "category", "read_csv(dtype={'role': 'category'})"),
+            ),
+            ignore_position=True,
+        ):
+            for node in nodes:
+                self.checker.visit_call(node.value)
+
+    def test_callee_without_name(self):
+        nodes = astroid.extract_node(
+            """
+            import pandas as pd
+            frame = handlers[0]("orders.csv")  #@
+            other = make_reader()("orders.csv")  #@
+            """
+        )
+
+        with self.assertNoMessages():
+            for node in nodes:
+                self.checker.visit_call(node.value)
+
+    def test_frame_used_in_ways_not_followed(self):
+        nodes = astroid.extract_node(
+            """
+            import pandas as pd
+            orders = pd.read_csv("orders.csv")  #@
+            swedish = orders[(orders["country"] == "SE") & (orders["region"] == "north")]
+            print(orders.country.str.lower())
+            customers = pd.read_csv("customers.csv")  #@
+            vip = customers[customers["tier"] == "gold"]
+            customers.to_csv("customers_out.csv")
+            def load_events():
+                events = pd.read_csv("events.csv")  #@
+                clicks = events[events["kind"] == "click"]
+                return events
+            logs = pd.read_csv("logs.csv")  #@
+            errors = logs[logs["level"] == "error"]
+            archive(logs)
+            """
+        )
+
+        with self.assertAddsMessages(
+            pylint.testutils.MessageTest(
+                msg_id="pandas-categorical-column",
+                confidence=HIGH,
+                node=nodes[0].value,
+                args=("region", "orders", "equality", "category", "read_csv(dtype={'region': 'category'})"),
+            ),
+            ignore_position=True,
+        ):
+            for node in nodes:
+                self.checker.visit_call(node.value)
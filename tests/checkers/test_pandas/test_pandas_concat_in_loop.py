@@ -0,0 +1,138 @@
+import astroid
+import pylint.testutils
+from pylint.interfaces import HIGH
+
+from pylint_ml.checkers.pandas.pandas_concat_in_loop import PandasConcatInLoopChecker
+
+
+class TestPandasConcatInLoopChecker(pylint.testutils.CheckerTestCase):
+    CHECKER_CLASS = PandasConcatInLoopChecker
+
+    def test_concat_in_for_loop(self):
+        node = astroid.extract_node(
+            """
+            import pandas as pd
+            df_acc = pd.DataFrame()
+            for path in paths:
+                df_chunk = pd.read_csv(path)
+                df_acc = pd.concat([df_acc, df_chunk], ignore_index=True)  #@
+            """
+        )
+        concat_call = node.value
+
+        with self.assertAddsMessages(
+            pylint.testutils.MessageTest(
+                msg_id="pandas-concat-in-loop",
+                confidence=HIGH,
+                node=concat_call,
+                args=("df_acc", "concat()", 4),
+            ),
+            ignore_position=True,
+        ):
+            self.checker.visit_call(concat_call)
+
+    def test_append_in_while_loop(self):
+        node = astroid.extract_node(
+            """
+            import pandas as pd
+            df_results = pd.DataFrame()
+            while has_more():
+                df_results = df_results.append(fetch_page())  #@
+            """
+        )
+        append_call = node.value
+
+        with self.assertAddsMessages(
+            pylint.testutils.MessageTest(
+                msg_id="pandas-concat-in-loop",
+                confidence=HIGH,
+                node=append_call,
+                args=("df_results", "append()", 4),
+            ),
+            ignore_position=True,
+        ):
+            self.checker.visit_call(append_call)
+
+    def test_merge_in_nested_loop_on_attribute(self):
+        node = astroid.extract_node(
+            """
+            import pandas as pd
+            class Report:
+                def build(self, groups):
+                    for group in groups:
+                        for df_part in group:
+                            self.df_all = pd.merge(self.df_all, df_part, on="id")  #@
+            """
+        )
+        merge_call = node.value
+
+        with self.assertAddsMessages(
+            pylint.testutils.MessageTest(
+                msg_id="pandas-concat-in-loop",
+                confidence=HIGH,
+                node=merge_call,
+                args=("self.df_all", "merge()", 6),
+            ),
+            ignore_position=True,
+        ):
+            self.checker.visit_call(merge_call)
+
+    def test_concat_once_after_loop(self):
+        node = astroid.extract_node(
+            """
+            import pandas as pd
+            chunks = []
+            for path in paths:
+                chunks.append(pd.read_csv(path))
+            df_acc = pd.concat(chunks)  #@
+            """
+        )
+        concat_call = node.value
+
+        with self.assertNoMessages():
+            self.checker.visit_call(concat_call)
+
+    def test_concat_into_other_name_in_loop(self):
+        node = astroid.extract_node(
+            """
+            import pandas as pd
+            for df_left, df_right in pairs:
+                df_pair = pd.concat([df_left, df_right])  #@
+            """
+        )
+        concat_call = node.value
+
+        with self.assertNoMessages():
+            self.checker.visit_call(concat_call)
+
+    def test_concat_in_function_defined_in_loop(self):
+        node = astroid.extract_node(
+            """
+            import pandas as pd
+            for name in names:
+                def grow(df_acc, df_chunk):
+                    df_acc = pd.concat([df_acc, df_chunk])  #@
+                    return df_acc
+            """
+        )
+        concat_call = node.value
+
+        with self.assertNoMessages():
+            self.checker.visit_call(concat_call)
+
+    def test_append_of_other_types_in_loop(self):
+        nodes = astroid.extract_node(
+            """
+            import numpy as np
+            import pandas as pd
+            arr = np.zeros(0)
+            items = []
+            for i in range(10):
+                arr = np.append(arr, i)  #@
+                items = items.append(i)  #@
+            """
+        )
+
+        with self.assertNoMessages():
+            for node in nodes:
+                self.checker.visit_call(node.value)
@@ -0,0 +1,179 @@
+import astroid
+import pylint.testutils
+from pylint.interfaces import HIGH
+
+from pylint_ml.checkers.pandas.pandas_copy_on_write import PandasCopyOnWriteChecker
+from pylint_ml.util import rule_database
+
+
+class TestPandasCopyOnWriteChecker(pylint.testutils.CheckerTestCase):
+    CHECKER_CLASS = PandasCopyOnWriteChecker
+
+    def test_chained_assignment(self):
+        nodes = astroid.extract_node(
+            """
+            import pandas as pd
+            orders = pd.read_csv("orders.csv")
+            orders[orders["price"] > 100]["discount"] = 0.1  #@
+            orders["discount"].loc[0] = 0.2  #@
+            """
+        )
+        targets = [node.targets[0] for node in nodes]
+
+        with self.assertAddsMessages(
+            pylint.testutils.MessageTest(
+                msg_id="pandas-chained-assignment",
+                confidence=HIGH,
+                node=targets[0],
+                args=("orders[orders['price'] > 100]['discount']", "orders"),
+            ),
+            pylint.testutils.MessageTest(
+                msg_id="pandas-chained-assignment",
+                confidence=HIGH,
+                node=targets[1],
+                args=("orders['discount'].loc[0]", "orders"),
+            ),
+            ignore_position=True,
+        ):
+            for target in targets:
+                self.checker.visit_subscript(target)
+
+    def test_single_loc_assignment(self):
+        node = astroid.extract_node(
+            """
+            import pandas as pd
+            orders = pd.read_csv("orders.csv")
+            orders.loc[orders["price"] > 100, "discount"] = 0.1  #@
+            """
+        )
+
+        with self.assertNoMessages():
+            self.checker.visit_subscript(node.targets[0])
+
+    def test_copy_that_is_only_read(self, monkeypatch):
+        monkeypatch.setattr(rule_database, "installed_version", lambda library: (3, 0, 0))
+        node = astroid.extract_node(
+            """
+            import pandas as pd
+            def report(sales: pd.DataFrame):
+                recent = sales[sales["year"] > 2020].copy()  #@
+                print(len(recent), recent["revenue"].sum())
+                return pd.concat([recent, sales]).describe()
+            """
+        )
+        copy_call = node.value
+
+        with self.assertAddsMessages(
+            pylint.testutils.MessageTest(
+                msg_id="pandas-redundant-copy",
+                confidence=HIGH,
+                node=copy_call,
+                args=("recent", "sales[sales['year'] > 2020]"),
+            ),
+            ignore_position=True,
+        ):
+            self.checker.visit_call(copy_call)
+
+    def test_copy_before_copy_on_write(self, monkeypatch):
+        monkeypatch.setattr(rule_database, "installed_version", lambda library: (2, 2, 3))
+        nodes = astroid.extract_node(
+            """
+            import pandas as pd
+            def report(sales: pd.DataFrame):
+                recent = sales[sales["year"] > 2020].copy()  #@
+                print(recent["revenue"].sum())
+            """
+        )
+
+        with self.assertNoMessages():
+            self.checker.visit_call(nodes.value)
+
+    def test_copy_with_copy_on_write_turned_on(self, monkeypatch):
+        monkeypatch.setattr(rule_database, "installed_version", lambda library: (2, 2, 3))
+        first, second = (
+            astroid.extract_node(
+                f"""
+                import pandas as pd
+                {option}
+                def report(sales: pd.DataFrame):
+                    recent = sales[sales["year"] > 2020].copy()  #@
+                    print(recent["revenue"].sum())
+                """
+            )
+            for option in ('pd.set_option("mode.copy_on_write", True)', "pd.options.mode.copy_on_write = True")
+        )
+
+        with self.assertAddsMessages(
+            pylint.testutils.MessageTest(
+                msg_id="pandas-redundant-copy",
+                confidence=HIGH,
+                node=first.value,
+                args=("recent", "sales[sales['year'] > 2020]"),
+            ),
+            pylint.testutils.MessageTest(
+                msg_id="pandas-redundant-copy",
+                confidence=HIGH,
+                node=second.value,
+                args=("recent", "sales[sales['year'] > 2020]"),
+            ),
+            ignore_position=True,
+        ):
+            self.checker.visit_call(first.value)
+            self.checker.visit_call(second.value)
+
+    def test_copy_that_is_modified_or_escapes(self):
+        nodes = astroid.extract_node(
+            """
+            import pandas as pd
+            sales = pd.read_parquet("sales.parquet")
+            cleaned = sales.copy()  #@
+            cleaned["revenue"] = cleaned["revenue"].fillna(0)
+            deduplicated = sales.copy()  #@
+            deduplicated.drop_duplicates(inplace=True)
+            shared = sales.copy()  #@
+            publish(shared)
+            shallow = sales.copy(deep=False)  #@
+            """
+        )
+
+        with self.assertNoMessages():
+            for node in nodes:
+                self.checker.visit_call(node.value)
+
+    def test_modified_slice_of_frame_still_in_use(self):
+        node = astroid.extract_node(
+            """
+            import pandas as pd
+            def prices(frame: pd.DataFrame):
+                euro = frame.loc[frame["currency"] == "EUR"]  #@
+                euro["price"] *= 1.1
+                return frame["price"].mean(), euro
+            """
+        )
+
+        with self.assertAddsMessages(
+            pylint.testutils.MessageTest(
+                msg_id="pandas-modified-slice",
+                confidence=HIGH,
+                node=node.value,
+                args=("euro", "frame", 5, "frame"),
+            ),
+            ignore_position=True,
+        ):
+            self.checker.visit_assign(node)
+
+    def test_slice_after_last_use_of_frame(self):
+        nodes = astroid.extract_node(
+            """
+            import pandas as pd
+            frame = pd.read_csv("prices.csv")
+            totals = frame[["price", "quantity"]]  #@
+            print(totals.sum())
+            euro = frame[frame["currency"] == "EUR"]  #@
+            euro["price"] = euro["price"] * 1.1
+            """
+        )
+
+        with self.assertNoMessages():
+            for node in nodes:
+                self.checker.visit_assign(node)
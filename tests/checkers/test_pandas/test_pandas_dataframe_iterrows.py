@@ -33,3 +33,67 @@ class TestPandasIterrowsChecker(pylint.testutils.CheckerTestCase):
             ignore_position=True,
         ):
             self.checker.visit_call(iterrows_call)
+
+    def test_iterrows_on_inferred_dataframe(self):
+        node = astroid.extract_node(
+            """
+            import pandas as pd
+            def report(path):
+                sales = pd.read_csv(path).dropna()
+                for index, row in sales.iterrows():  #@
+                    print(row["Product"])
+            """
+        )
+        iterrows_call = node.iter
+
+        with self.assertAddsMessages(
+            pylint.testutils.MessageTest(
+                msg_id="pandas-iterrows",
+                confidence=HIGH,
+                node=iterrows_call,
+            ),
+            ignore_position=True,
+        ):
+            self.checker.visit_call(iterrows_call)
+
+    def test_iterrows_on_other_object(self):
+        node = astroid.extract_node(
+            """
+            import pandas as pd
+            df_rows = RowReader("sales.csv")
+            for index, row in df_rows.iterrows():  #@
+                print(row)
+            """
+        )
+        iterrows_call = node.iter
+
+        with self.assertNoMessages():
+            self.checker.visit_call(iterrows_call)
+
+    def test_dataframe_from_project_function_without_pandas_import(self, tmp_path, monkeypatch):
+        # astroid caches where a module name was found, so every test imports a differently named module
+        helpers = f"helpers_{tmp_path.name}"
+        (tmp_path / f"{helpers}.py").write_text(
+            "import pandas as pd\n\ndef load_events():\n    return pd.read_csv('events.csv')\n", encoding="utf-8"
+        )
+        monkeypatch.syspath_prepend(str(tmp_path))
+        node = astroid.extract_node(
+            f"""
+            from {helpers} import load_events
+            for index, row in load_events().iterrows():  #@
+                print(row)
+            """
+        )
+        iterrows_call = node.iter
+
+        self.checker.visit_module(node.root())
+        with self.assertAddsMessages(
+            pylint.testutils.MessageTest(
+                msg_id="pandas-iterrows",
+                confidence=HIGH,
+                node=iterrows_call,
+            ),
+            ignore_position=True,
+        ):
+            self.checker.visit_call(iterrows_call)
+        self.checker.leave_module(node.root())
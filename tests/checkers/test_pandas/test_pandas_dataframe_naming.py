@@ -51,3 +51,20 @@ class TestPandasDataFrameNamingChecker(pylint.testutils.CheckerTestCase):
             ignore_position=True,
         ):
             self.checker.visit_assign(pandas_dataframe_node)
+
+    def test_incorrect_dataframe_naming_with_from_import(self):
+        pandas_dataframe_node = astroid.extract_node(
+            """
+            from pandas import DataFrame
+            customers = DataFrame(data) #@
+            """
+        )
+        with self.assertAddsMessages(
+            pylint.testutils.MessageTest(
+                msg_id="pandas-dataframe-naming",
+                confidence=HIGH,
+                node=pandas_dataframe_node,
+            ),
+            ignore_position=True,
+        ):
+            self.checker.visit_assign(pandas_dataframe_node)
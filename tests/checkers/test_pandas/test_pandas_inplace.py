@@ -102,3 +102,16 @@ class TestPandasInplaceChecker(pylint.testutils.CheckerTestCase):
 
         with self.assertNoMessages():
             self.checker.visit_call(node)
+
+    def test_inplace_without_pandas_import(self):
+        node = astroid.extract_node(
+            """
+            import polars as pl
+            df = pl.DataFrame({"A": [1, 2, 3]})
+            df.drop(columns=["A"], inplace=True)  #@
+            """
+        )
+
+        self.checker.visit_module(node.root())
+        with self.assertNoMessages():
+            self.checker.visit_call(node)
@@ -0,0 +1,112 @@
+import astroid
+import pylint.testutils
+from pylint.interfaces import HIGH
+
+from pylint_ml.checkers.pandas.pandas_read_efficiency import PandasReadEfficiencyChecker
+
+
+class TestPandasReadEfficiencyChecker(pylint.testutils.CheckerTestCase):
+    CHECKER_CLASS = PandasReadEfficiencyChecker
+
+    def test_only_some_columns_used(self):
+        node = astroid.extract_node(
+            """
+            import pandas as pd
+            def revenue_by_region(path):
+                sales = pd.read_csv(path, index_col="order_id")  #@
+                sales["revenue"] = sales["price"] * sales["quantity"]
+                recent = sales[sales["year"] >= 2023]
+                return recent.groupby("region")["revenue"].sum(), len(sales)
+            """
+        )
+        read_call = node.value
+
+        with self.assertAddsMessages(
+            pylint.testutils.MessageTest(
+                msg_id="pandas-read-unused-columns",
+                confidence=HIGH,
+                node=read_call,
+                args=("usecols", "['order_id', 'price', 'quantity', 'year', 'region']", "read_csv", "sales"),
+            ),
+            ignore_position=True,
+        ):
+            self.checker.visit_call(read_call)
+
+    def test_parquet_filtered_right_away(self):
+        node = astroid.extract_node(
+            """
+            import pandas as pd
+            events = pd.read_parquet("events.parquet")  #@
+            events = events.loc[events["kind"] == "click"]
+            print(events[["user", "time"]].head())
+            """
+        )
+        read_call = node.value
+
+        with self.assertAddsMessages(
+            pylint.testutils.MessageTest(
+                msg_id="pandas-read-unused-columns",
+                confidence=HIGH,
+                node=read_call,
+                args=("columns", "['kind', 'user', 'time']", "read_parquet", "events"),
+            ),
+            pylint.testutils.MessageTest(
+                msg_id="pandas-read-then-filter",
+                confidence=HIGH,
+                node=read_call,
+                args=("events", "read_parquet", "push the filter down into the reader with filters="),
+            ),
+            ignore_position=True,
+        ):
+            self.checker.visit_call(read_call)
+
+    def test_csv_filtered_with_query(self):
+        node = astroid.extract_node(
+            """
+            import pandas as pd
+            logs = pd.read_csv("logs.csv", usecols=["level", "message"])  #@
+            errors = logs.query("level == 'ERROR'")
+            """
+        )
+        read_call = node.value
+
+        with self.assertAddsMessages(
+            pylint.testutils.MessageTest(
+                msg_id="pandas-read-then-filter",
+                confidence=HIGH,
+                node=read_call,
+                args=("logs", "read_csv", "read it with chunksize= and filter every chunk, or use engine='pyarrow'"),
+            ),
+            ignore_position=True,
+        ):
+            self.checker.visit_call(read_call)
+
+    def test_whole_frame_used(self):
+        nodes = astroid.extract_node(
+            """
+            import pandas as pd
+            raw = pd.read_csv("raw.csv")  #@
+            print(raw["id"])
+            raw.to_parquet("raw.parquet")
+            chunks = pd.read_csv("big.csv", chunksize=100_000)  #@
+            stats = pd.read_excel("stats.xlsx")  #@
+            summary = stats.groupby("team").mean()
+            """
+        )
+
+        with self.assertNoMessages():
+            for node in nodes:
+                self.checker.visit_call(node.value)
+
+    def test_callee_without_name(self):
+        nodes = astroid.extract_node(
+            """
+            import pandas as pd
+            frame = handlers[0]("orders.csv")  #@
+            other = make_reader()("orders.csv")  #@
+            """
+        )
+
+        with self.assertNoMessages():
+            for node in nodes:
+                self.checker.visit_call(node.value)
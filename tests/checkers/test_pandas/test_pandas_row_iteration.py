@@ -0,0 +1,230 @@
+import astroid
+import pylint.testutils
+from pylint.interfaces import HIGH
+
+from pylint_ml.checkers.pandas.pandas_row_iteration import PandasRowIterationChecker
+
+
+class TestPandasRowIterationChecker(pylint.testutils.CheckerTestCase):
+    CHECKER_CLASS = PandasRowIterationChecker
+
+    def test_iterrows_with_arithmetic(self):
+        node = astroid.extract_node(
+            """
+            import pandas as pd
+            orders = pd.read_csv("orders.csv")
+            for idx, row in orders.iterrows():  #@
+                orders.loc[idx, "total"] = row["price"] * row["quantity"]
+            """
+        )
+
+        with self.assertAddsMessages(
+            pylint.testutils.MessageTest(
+                msg_id="pandas-row-iteration",
+                confidence=HIGH,
+                node=node,
+                args=("iterrows()", "orders", "arithmetic", "column arithmetic and reductions", "10-100x"),
+            ),
+            ignore_position=True,
+        ):
+            self.checker.visit_for(node)
+
+    def test_itertuples_with_string_operations(self):
+        node = astroid.extract_node(
+            """
+            import pandas as pd
+            def names(people: pd.DataFrame):
+                full_names = []
+                for person in people.itertuples():  #@
+                    full_names.append(person.first.strip() + " " + person.last.upper())
+                return full_names
+            """
+        )
+
+        with self.assertAddsMessages(
+            pylint.testutils.MessageTest(
+                msg_id="pandas-row-iteration",
+                confidence=HIGH,
+                node=node,
+                args=("itertuples()", "people", "string operations", "the .str accessor", "2-10x"),
+            ),
+            ignore_position=True,
+        ):
+            self.checker.visit_for(node)
+
+    def test_range_loop_with_conditional_assignment(self):
+        node = astroid.extract_node(
+            """
+            import pandas as pd
+            scores = pd.DataFrame({"score": [1, 5, 9]})
+            for i in range(len(scores)):  #@
+                if scores.loc[i, "score"] > 4:
+                    scores.loc[i, "passed"] = True
+                else:
+                    scores.loc[i, "passed"] = False
+            """
+        )
+
+        with self.assertAddsMessages(
+            pylint.testutils.MessageTest(
+                msg_id="pandas-row-iteration",
+                confidence=HIGH,
+                node=node,
+                args=(
+                    "loop over range(len())",
+                    "scores",
+                    "conditional assignment",
+                    "np.where or Series.mask",
+                    "10-100x",
+                ),
+            ),
+            ignore_position=True,
+        ):
+            self.checker.visit_for(node)
+
+    def test_apply_with_lambda(self):
+        node = astroid.extract_node(
+            """
+            import numpy as np
+            import pandas as pd
+            sales = pd.read_parquet("sales.parquet")
+            sales["margin"] = sales.apply(lambda row: np.log(row["revenue"] - row["cost"]), axis=1)  #@
+            """
+        )
+        apply_call = node.value
+
+        with self.assertAddsMessages(
+            pylint.testutils.MessageTest(
+                msg_id="pandas-row-iteration",
+                confidence=HIGH,
+                node=apply_call,
+                args=("apply(axis=1)", "sales", "arithmetic", "column arithmetic and reductions", "10-100x"),
+            ),
+            ignore_position=True,
+        ):
+            self.checker.visit_call(apply_call)
+
+    def test_apply_with_function(self):
+        node = astroid.extract_node(
+            """
+            import pandas as pd
+            def label(row):
+                return "high" if row.value > 10 else "low"
+            frame = pd.DataFrame({"value": [1, 20]})
+            frame["label"] = frame.apply(label, axis="columns")  #@
+            """
+        )
+        apply_call = node.value
+
+        with self.assertAddsMessages(
+            pylint.testutils.MessageTest(
+                msg_id="pandas-row-iteration",
+                confidence=HIGH,
+                node=apply_call,
+                args=("apply(axis=1)", "frame", "conditional assignment", "np.where or Series.mask", "10-100x"),
+            ),
+            ignore_position=True,
+        ):
+            self.checker.visit_call(apply_call)
+
+    def test_reads_of_the_previous_row(self):
+        nodes = astroid.extract_node(
+            """
+            import pandas as pd
+            prices = pd.read_csv("prices.csv")
+            previous = 0
+            changes = []
+            for _, row in prices.iterrows():  #@
+                changes.append(row["close"] - previous)
+                previous = row["close"]
+            for i in range(len(prices)):  #@
+                prices.loc[i, "change"] = prices.loc[i, "close"] - prices.loc[i - 1, "close"]
+            """
+        )
+
+        with self.assertAddsMessages(
+            *(
+                pylint.testutils.MessageTest(
+                    msg_id="pandas-row-iteration",
+                    confidence=HIGH,
+                    node=node,
+                    args=(method, "prices", "reads of the previous row", "Series.shift() or Series.diff()", "10-100x"),
+                )
+                for node, method in zip(nodes, ("iterrows()", "loop over range(len())"), strict=True)
+            ),
+            ignore_position=True,
+        ):
+            for node in nodes:
+                self.checker.visit_for(node)
+
+    def test_running_total(self):
+        node = astroid.extract_node(
+            """
+            import pandas as pd
+            payments = pd.read_csv("payments.csv")
+            balance = 0
+            balances = []
+            for payment in payments.itertuples():  #@
+                balance += payment.amount
+                balances.append(balance)
+            """
+        )
+
+        with self.assertAddsMessages(
+            pylint.testutils.MessageTest(
+                msg_id="pandas-row-iteration",
+                confidence=HIGH,
+                node=node,
+                args=("itertuples()", "payments", "running totals", "Series.cumsum()", "10-100x"),
+            ),
+            ignore_position=True,
+        ):
+            self.checker.visit_for(node)
+
+    def test_row_dependent_body(self):
+        nodes = astroid.extract_node(
+            """
+            import pandas as pd
+            prices = pd.read_csv("prices.csv")
+            level = 0
+            for _, row in prices.iterrows():  #@
+                level = 0.9 * level + 0.1 * row["close"]
+                prices.loc[_, "smoothed"] = level
+            balance = 100
+            for row in prices.itertuples():  #@
+                balance += balance * row.rate
+                balances.append(balance)
+            for i in range(len(prices)):  #@
+                prices.loc[i, "next"] = prices.loc[i + 1, "close"]
+            """
+        )
+
+        with self.assertNoMessages():
+            for node in nodes:
+                self.checker.visit_for(node)
+
+    def test_body_calling_other_code(self):
+        node = astroid.extract_node(
+            """
+            import pandas as pd
+            users = pd.read_sql(query, connection)
+            for _, row in users.iterrows():  #@
+                send_email(row["email"])
+            """
+        )
+
+        with self.assertNoMessages():
+            self.checker.visit_for(node)
+
+    def test_receiver_is_not_a_dataframe(self):
+        node = astroid.extract_node(
+            """
+            import pandas as pd
+            df_rows = load_rows()
+            for _, row in df_rows.iterrows():  #@
+                total += row["amount"]
+            """
+        )
+
+        with self.assertNoMessages():
+            self.checker.visit_for(node)
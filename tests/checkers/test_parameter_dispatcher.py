@@ -0,0 +1,135 @@
+import astroid
+import pylint.testutils
+from pylint.interfaces import HIGH
+
+from pylint_ml.checkers.parameter_dispatcher import ParameterDispatcher
+
+
+class TestParameterDispatcher(pylint.testutils.CheckerTestCase):
+    CHECKER_CLASS = ParameterDispatcher
+
+    def test_dispatch_to_numpy_rule_set(self):
+        node = astroid.extract_node(
+            """
+            import numpy as np
+            arr = np.random.rand()  #@
+            """
+        )
+
+        rand_call = node.value
+
+        with self.assertAddsMessages(
+            pylint.testutils.MessageTest(
+                msg_id="numpy-parameter",
+                confidence=HIGH,
+                node=rand_call,
+                args=("d0", "random.rand"),
+            ),
+            ignore_position=True,
+        ):
+            self.checker.visit_call(rand_call)
+
+    def test_method_of_several_imported_libraries_is_skipped(self):
+        node = astroid.extract_node(
+            """
+            from sklearn.svm import SVC
+            import tensorflow as tf
+            model.fit(epochs=10)  #@
+            """
+        )
+
+        # Both libraries have a rule for ``fit`` and the type of ``model`` is unknown
+        with self.assertNoMessages():
+            self.checker.visit_call(node)
+
+    def test_dispatch_by_qualified_name(self):
+        plt_hist, df_hist = astroid.extract_node(
+            """
+            import matplotlib.pyplot as plt
+            import pandas as pd
+            plt.hist(bins=10)  #@
+            df_sales.hist(bins=10)  #@
+            """
+        )
+
+        with self.assertAddsMessages(
+            pylint.testutils.MessageTest(
+                msg_id="matplotlib-parameter",
+                confidence=HIGH,
+                node=plt_hist,
+                args=("x", "hist"),
+            ),
+            ignore_position=True,
+        ):
+            self.checker.visit_call(plt_hist)
+        # Only pandas matches ``hist`` by method name, the method of matplotlib's Axes is too common
+        with self.assertAddsMessages(
+            pylint.testutils.MessageTest(
+                msg_id="pandas-parameter",
+                confidence=HIGH,
+                node=df_hist,
+                args=("column", "hist"),
+            ),
+            ignore_position=True,
+        ):
+            self.checker.visit_call(df_hist)
+
+    def test_call_without_rule(self):
+        node = astroid.extract_node(
+            """
+            import numpy as np
+            arr = np.random.seed(42)  #@
+            """
+        )
+
+        with self.assertNoMessages():
+            self.checker.visit_call(node.value)
+
+    def test_disabled_rule_set_is_not_indexed(self):
+        node = astroid.extract_node(
+            """
+            import torch.optim as optim
+            optimizer = optim.SGD(model.parameters())  #@
+            """
+        )
+
+        self.linter.is_message_enabled = lambda msg_descr, *args, **kwargs: msg_descr != "pytorch-parameter"
+        self.checker.open()
+
+        with self.assertNoMessages():
+            self.checker.visit_call(node.value)
+
+    def test_only_rule_sets_of_imported_libraries(self):
+        node = astroid.extract_node(
+            """
+            import numpy as np
+            from sklearn.svm import SVC
+            model.fit(epochs=10)  #@
+            """
+        )
+
+        self.checker.visit_module(node.root())
+        with self.assertAddsMessages(
+            pylint.testutils.MessageTest(
+                msg_id="sklearn-parameter",
+                confidence=HIGH,
+                node=node,
+                args=("X, y", "fit"),
+            ),
+            ignore_position=True,
+        ):
+            self.checker.visit_call(node)
+
+    def test_module_without_supported_library(self):
+        node = astroid.extract_node(
+            """
+            import json
+            model.fit(epochs=10)  #@
+            """
+        )
+
+        self.checker.visit_module(node.root())
+
+        assert not self.checker.library_active
+        with self.assertNoMessages():
+            self.checker.visit_call(node)
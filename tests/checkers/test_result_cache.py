@@ -0,0 +1,109 @@
+import pytest
+from astroid import MANAGER
+from pylint.lint import PyLinter
+from pylint.reporters import CollectingReporter
+
+from pylint_ml import plugin
+from pylint_ml.util.function_summaries import summary_index
+from pylint_ml.util.import_table import ImportTable
+
+MODULE = """
+import numpy as np
+from {compat} import pd
+
+
+class Model:
+    def run(self, matrix):
+        product = np.dot(matrix, matrix)
+        frame = pd.DataFrame(matrix)
+        frame.fillna(0, inplace=True)  # pylint: disable=pandas-parameter
+        return lambda: np.dot(product, product), frame
+"""
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    # astroid caches where a module name was found, so every test imports a differently named module
+    compat = f"compat_{tmp_path.name}"
+    (tmp_path / "model.py").write_text(MODULE.format(compat=compat), encoding="utf-8")
+    (tmp_path / f"{compat}.py").write_text("import pandas as pd\n", encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    return tmp_path
+
+
+def lint(project, *options):
+    linter = PyLinter(reporter=CollectingReporter())
+    plugin.register(linter)
+    linter.set_option("ml-cache-dir", str(project / "cache"))
+    for name, value in options:
+        linter.set_option(name, value)
+    linter.check([str(project / "model.py")])
+    return [
+        (message.obj, message.line, message.column, message.end_line, message.end_column, message.symbol, message.msg)
+        for message in linter.reporter.messages
+    ]
+
+
+def fail_to_build(module):
+    raise AssertionError(f"{module.name} was checked again")
+
+
+def test_unchanged_module_is_replayed(project, monkeypatch):
+    first_run = lint(project)
+    monkeypatch.setattr(ImportTable, "from_module", fail_to_build)
+
+    assert ("Model.run.<lambda>", 11, 23, 11, 47) in {message[:5] for message in first_run}
+    assert (10, "pandas-parameter") not in {(message[1], message[5]) for message in first_run}
+    assert lint(project) == first_run
+
+
+def test_cache_works_with_its_own_message_disabled(project, monkeypatch):
+    options = (("disable", "all"), ("enable", "numpy-dot-usage"))
+    first_run = lint(project, *options)
+    monkeypatch.setattr(ImportTable, "from_module", fail_to_build)
+
+    assert {message[5] for message in first_run} == {"numpy-dot-usage"}
+    assert lint(project, *options) == first_run
+
+
+def test_changed_dependency_is_checked_again(project):
+    lint(project)
+    (project / f"compat_{project.name}.py").write_text("import json as pd\n", encoding="utf-8")
+    lint(project)
+
+    assert len(list((project / "cache").iterdir())) == 2
+
+
+def test_changed_function_module_is_checked_again(project):
+    helpers = f"helpers_{project.name}"
+    (project / "model.py").write_text(
+        f"import pandas as pd\nimport {helpers}\n\nfor _, row in {helpers}.load_events().iterrows():\n    print(row)\n",
+        encoding="utf-8",
+    )
+    (project / f"{helpers}.py").write_text(
+        "import pandas as pd\n\ndef load_events():\n    return pd.read_csv('events.csv')\n", encoding="utf-8"
+    )
+    assert "pandas-iterrows" in {message[5] for message in lint(project)}
+
+    (project / f"{helpers}.py").write_text("def load_events():\n    return []\n", encoding="utf-8")
+    # A new run starts in a new process
+    MANAGER.astroid_cache.pop(helpers, None)
+    summary_index.cache_clear()
+
+    assert "pandas-iterrows" not in {message[5] for message in lint(project)}
+
+
+def test_changed_configuration_is_checked_again(project):
+    lint(project)
+    lint(project, ("disable", "numpy-parameter"))
+
+    assert len(list((project / "cache").iterdir())) == 2
+
+
+def test_cache_is_disabled_by_default(project):
+    linter = PyLinter(reporter=CollectingReporter())
+    plugin.register(linter)
+    linter.check([str(project / "model.py")])
+
+    assert linter.reporter.messages
+    assert not (project / "cache").exists()
@@ -0,0 +1,128 @@
+import astroid
+import pylint.testutils
+from pylint.interfaces import HIGH
+
+from pylint_ml.checkers.torch.torch_accumulation import TorchAccumulationChecker
+
+
+class TestTorchAccumulationChecker(pylint.testutils.CheckerTestCase):
+    CHECKER_CLASS = TorchAccumulationChecker
+
+    def test_cat_in_loop(self):
+        cat, stack = astroid.extract_node(
+            """
+            import torch
+            def collect(model, loader):
+                outputs = torch.empty(0, 10)
+                for batch in loader:
+                    outputs = torch.cat([outputs, model(batch)])  #@
+                history = torch.zeros(1)
+                while history.numel() < 100:
+                    history = torch.stack((history, history * 2))  #@
+                return outputs, history
+            """
+        )
+
+        with self.assertAddsMessages(
+            pylint.testutils.MessageTest(
+                msg_id="torch-cat-in-loop",
+                confidence=HIGH,
+                node=cat.value,
+                args=("outputs", "cat()", 5),
+            ),
+            pylint.testutils.MessageTest(
+                msg_id="torch-cat-in-loop",
+                confidence=HIGH,
+                node=stack.value,
+                args=("history", "stack()", 8),
+            ),
+            ignore_position=True,
+        ):
+            self.checker.visit_call(cat.value)
+            self.checker.visit_call(stack.value)
+
+    def test_cat_outside_loop_or_of_loop_variable(self):
+        nodes = astroid.extract_node(
+            """
+            import torch
+            chunks = []
+            for batch in loader:
+                chunks.append(model(batch))
+                batch = torch.cat([batch, batch])  #@
+            outputs = torch.cat(chunks)  #@
+            """
+        )
+
+        with self.assertNoMessages():
+            for node in nodes:
+                self.checker.visit_call(node.value)
+
+    def test_tensor_copies(self):
+        nodes = astroid.extract_node(
+            """
+            import numpy as np
+            import torch
+            weights = torch.randn(3, 3)
+            embeddings = np.loadtxt("embeddings.txt")
+            torch.tensor(weights)  #@
+            torch.tensor(embeddings)  #@
+            torch.tensor([torch.zeros(3), torch.ones(3)])  #@
+            parts = []
+            for row in rows:
+                parts.append(torch.randn(4))
+            torch.tensor(parts)  #@
+            """
+        )
+
+        with self.assertAddsMessages(
+            pylint.testutils.MessageTest(
+                msg_id="torch-tensor-copy",
+                confidence=HIGH,
+                node=nodes[0],
+                args=(
+                    "torch.tensor(weights)",
+                    "an existing tensor",
+                    "torch.as_tensor() to reuse it or .clone().detach() to copy it",
+                ),
+            ),
+            pylint.testutils.MessageTest(
+                msg_id="torch-tensor-copy",
+                confidence=HIGH,
+                node=nodes[1],
+                args=(
+                    "torch.tensor(embeddings)",
+                    "a numpy array",
+                    "torch.from_numpy() or torch.as_tensor() to share its memory",
+                ),
+            ),
+            pylint.testutils.MessageTest(
+                msg_id="torch-tensor-copy",
+                confidence=HIGH,
+                node=nodes[2],
+                args=("torch.tensor([torch.zeros(3), torch.ones(3)])", "a list of tensors", "torch.stack()"),
+            ),
+            pylint.testutils.MessageTest(
+                msg_id="torch-tensor-copy",
+                confidence=HIGH,
+                node=nodes[3],
+                args=("torch.tensor(parts)", "a list of tensors", "torch.stack()"),
+            ),
+            ignore_position=True,
+        ):
+            for node in nodes:
+                self.checker.visit_call(node)
+
+    def test_tensor_from_python_data(self):
+        nodes = astroid.extract_node(
+            """
+            import torch
+            labels = [0, 1, 1]
+            torch.tensor(labels)  #@
+            torch.tensor([[1.0, 2.0], [3.0, 4.0]])  #@
+            torch.tensor(3.0)  #@
+            """
+        )
+
+        with self.assertNoMessages():
+            for node in nodes:
+                self.checker.visit_call(node)
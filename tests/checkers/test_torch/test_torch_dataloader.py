@@ -0,0 +1,128 @@
+import astroid
+import pylint.testutils
+from pylint.interfaces import HIGH
+
+from pylint_ml.checkers.torch.torch_dataloader import TorchDataLoaderChecker
+
+
+class TestTorchDataLoaderChecker(pylint.testutils.CheckerTestCase):
+    CHECKER_CLASS = TorchDataLoaderChecker
+
+    def test_training_loader(self):
+        node = astroid.extract_node(
+            """
+            import torch
+            from torch.utils.data import DataLoader
+            device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+            loader = DataLoader(dataset, shuffle=True, num_workers=0)  #@
+            for epoch in range(10):
+                for inputs, targets in loader:
+                    inputs, targets = inputs.to(device), targets.to(device)
+                    loss = loss_fn(model(inputs), targets)
+                    loss.backward()
+                    optimizer.step()
+            """
+        )
+        loader_call = node.value
+
+        with self.assertAddsMessages(
+            pylint.testutils.MessageTest(
+                msg_id="torch-dataloader-throughput",
+                confidence=HIGH,
+                node=loader_call,
+                args=("loader", "loads every batch in the main process", "num_workers > 0", "dataloader-workers"),
+            ),
+            pylint.testutils.MessageTest(
+                msg_id="torch-dataloader-throughput",
+                confidence=HIGH,
+                node=loader_call,
+                args=(
+                    "loader",
+                    "copies batches to the GPU from pageable memory",
+                    "pin_memory=True",
+                    "dataloader-pin-memory",
+                ),
+            ),
+            pylint.testutils.MessageTest(
+                msg_id="torch-dataloader-throughput",
+                confidence=HIGH,
+                node=loader_call,
+                args=(
+                    "loader",
+                    "starts its worker processes again for every epoch",
+                    "persistent_workers=True",
+                    "dataloader-persistent-workers",
+                ),
+            ),
+            pylint.testutils.MessageTest(
+                msg_id="torch-dataloader-throughput",
+                confidence=HIGH,
+                node=loader_call,
+                args=(
+                    "loader",
+                    "runs a training step for every single sample",
+                    "a larger batch_size",
+                    "dataloader-batch-size",
+                ),
+            ),
+            ignore_position=True,
+        ):
+            self.checker.visit_call(loader_call)
+
+    def test_loader_passed_to_epoch_function(self):
+        node = astroid.extract_node(
+            """
+            import torch
+            def fit(model, dataset, epochs):
+                train_loader = torch.utils.data.DataLoader(dataset, 64, True, num_workers=4)  #@
+                for _ in range(epochs):
+                    train_one_epoch(model, train_loader)
+            """
+        )
+        loader_call = node.value
+
+        with self.assertAddsMessages(
+            pylint.testutils.MessageTest(
+                msg_id="torch-dataloader-throughput",
+                confidence=HIGH,
+                node=loader_call,
+                args=(
+                    "train_loader",
+                    "starts its worker processes again for every epoch",
+                    "persistent_workers=True",
+                    "dataloader-persistent-workers",
+                ),
+            ),
+            ignore_position=True,
+        ):
+            self.checker.visit_call(loader_call)
+
+    def test_tuned_loaders(self):
+        nodes = astroid.extract_node(
+            """
+            import torch
+            from torch.utils.data import DataLoader
+            workers = 8
+            loader = DataLoader(  #@
+                dataset, batch_size=32, num_workers=workers, pin_memory=True, persistent_workers=True
+            )
+            for epoch in range(10):
+                for step, batch in enumerate(loader):
+                    batch = batch.cuda(non_blocking=True)
+                    model(batch).sum().backward()
+                    optimizer.step()
+            for epoch in range(10):
+                loader = DataLoader(dataset, batch_size=32, num_workers=2)  #@
+                print(len(loader))
+                for batch in loader:
+                    batch = batch.to("cpu")
+            loader = DataLoader(dataset, batch_sampler=sampler, num_workers=2)  #@
+            for batch in loader:
+                model(batch).sum().backward()
+            loader = DataLoader(dataset, **settings)  #@
+            """
+        )
+
+        with self.assertNoMessages():
+            for node in nodes:
+                self.checker.visit_call(node.value)
@@ -0,0 +1,97 @@
+import astroid
+import pylint.testutils
+from pylint.interfaces import HIGH
+
+from pylint_ml.checkers.torch.torch_device_transfer import TorchDeviceTransferChecker
+
+
+class TestTorchDeviceTransferChecker(pylint.testutils.CheckerTestCase):
+    CHECKER_CLASS = TorchDeviceTransferChecker
+
+    def test_loop_invariant_transfers(self):
+        model_to, mask_to, weights_to = astroid.extract_node(
+            """
+            import torch
+            def train(model, loader, optimizer, causal_mask, device):
+                for epoch in range(10):
+                    for inputs in loader:
+                        model = model.to(device)  #@
+                        mask = causal_mask.to(device)  #@
+                        scale = torch.ones(inputs.shape[-1]).cuda()
+                        loss = (model(inputs, mask) * torch.tensor([0.5, 2.0]).to(device)).sum()  #@
+                        loss.backward()
+                        optimizer.step()
+            """
+        )
+        weights_transfer = weights_to.value.func.expr.right
+
+        with self.assertAddsMessages(
+            pylint.testutils.MessageTest(
+                msg_id="torch-loop-invariant-transfer",
+                confidence=HIGH,
+                node=model_to.value,
+                args=("model.to(device)", 4, "the statement at line 6"),
+            ),
+            pylint.testutils.MessageTest(
+                msg_id="torch-loop-invariant-transfer",
+                confidence=HIGH,
+                node=mask_to.value,
+                args=("causal_mask.to(device)", 4, "the statement at line 7"),
+            ),
+            pylint.testutils.MessageTest(
+                msg_id="torch-loop-invariant-transfer",
+                confidence=HIGH,
+                node=weights_transfer,
+                args=("torch.tensor([0.5, 2.0]).to(device)", 4, "it into a variable"),
+            ),
+            ignore_position=True,
+        ):
+            self.checker.visit_call(model_to.value)
+            self.checker.visit_call(mask_to.value)
+            self.checker.visit_call(weights_transfer)
+
+    def test_blocking_batch_transfer(self):
+        node = astroid.extract_node(
+            """
+            import torch
+            device = torch.device("cuda")
+            for step, (images, labels) in enumerate(loader):
+                images, labels = images.to(device), labels.to(device, non_blocking=True)  #@
+            """
+        )
+        images_to, labels_to = node.value.elts
+
+        with self.assertAddsMessages(
+            pylint.testutils.MessageTest(
+                msg_id="torch-blocking-transfer",
+                confidence=HIGH,
+                node=images_to,
+                args=("images.to(device)",),
+            ),
+            ignore_position=True,
+        ):
+            self.checker.visit_call(images_to)
+            self.checker.visit_call(labels_to)
+
+    def test_per_iteration_transfers(self):
+        nodes = astroid.extract_node(
+            """
+            import torch
+            hidden = torch.zeros(4)
+            for step in range(100):
+                noise = torch.randn(4).to("cuda")  #@
+                hidden = hidden.to("cuda") + noise  #@
+                state = step_tensor.to(torch.float16)  #@
+                if step == 0:
+                    weights = torch.ones(4).cuda()  #@
+                masks[step].fill_(1)
+                mask = masks[step].to("cuda")  #@
+                batch = next(iterator).cuda()  #@
+            for batch in loader:
+                batch = batch.to("cpu")  #@
+            """
+        )
+
+        with self.assertNoMessages():
+            for node in nodes:
+                self.checker.visit_call(node.value if isinstance(node.value, astroid.nodes.Call) else node.value.left)
@@ -0,0 +1,123 @@
+import astroid
+import pylint.testutils
+from pylint.interfaces import HIGH
+
+from pylint_ml.checkers.torch.torch_host_sync import TorchHostSyncChecker
+
+
+class TestTorchHostSyncChecker(pylint.testutils.CheckerTestCase):
+    CHECKER_CLASS = TorchHostSyncChecker
+
+    def test_syncs_in_training_loop(self):
+        item, printed, test = astroid.extract_node(
+            """
+            import torch
+            def train(model, loader, optimizer, loss_fn):
+                running = 0.0
+                for inputs, targets in loader:
+                    optimizer.zero_grad()
+                    loss = loss_fn(model(inputs), targets)
+                    loss.backward()
+                    optimizer.step()
+                    running += loss.item()  #@
+                    print(f"loss {loss}")  #@
+                    if torch.isnan(loss):  #@
+                        break
+                return running
+            """
+        )
+
+        with self.assertAddsMessages(
+            pylint.testutils.MessageTest(
+                msg_id="torch-host-sync-in-loop",
+                confidence=HIGH,
+                node=item.value,
+                args=("loss.item()", 5),
+            ),
+            pylint.testutils.MessageTest(
+                msg_id="torch-host-sync-in-loop",
+                confidence=HIGH,
+                node=printed,
+                args=("print(f'loss {loss}')", 5),
+            ),
+            pylint.testutils.MessageTest(
+                msg_id="torch-host-sync-in-loop",
+                confidence=HIGH,
+                node=test.test,
+                args=("if torch.isnan(loss)", 5),
+            ),
+            ignore_position=True,
+        ):
+            self.checker.visit_call(item.value)
+            self.checker.visit_call(printed)
+            self.checker.visit_if(test)
+
+    def test_stalls_outer_training_loop(self):
+        node = astroid.extract_node(
+            """
+            import torch
+            model = torch.nn.Linear(4, 1)
+            opt = torch.optim.SGD(model.parameters(), lr=0.1)
+            for batch in batches:
+                loss = model(batch).sum()
+                loss.backward()
+                opt.step()
+                for name, param in model.named_parameters():
+                    stats[name] = param.grad.norm().cpu()  #@
+            """
+        )
+        cpu_call = node.value
+
+        with self.assertAddsMessages(
+            pylint.testutils.MessageTest(
+                msg_id="torch-host-sync-in-loop",
+                confidence=HIGH,
+                node=cpu_call,
+                args=("param.grad.norm().cpu()", 5),
+            ),
+            ignore_position=True,
+        ):
+            self.checker.visit_call(cpu_call)
+
+    def test_sync_every_n_steps(self):
+        nodes = astroid.extract_node(
+            """
+            import torch
+            def train(model, loader, optimizer):
+                total = torch.zeros(())
+                for step, (inputs, targets) in enumerate(loader):
+                    loss = model(inputs, targets)
+                    loss.backward()
+                    optimizer.step()
+                    total += loss.detach()
+                    if (step + 1) % 100 == 0:
+                        print(step, total.item())  #@
+                        total.item()  #@
+                print("done", total.item())  #@
+            """
+        )
+
+        with self.assertNoMessages():
+            for node in nodes:
+                self.checker.visit_call(node)
+
+    def test_loop_without_training_step(self):
+        nodes = astroid.extract_node(
+            """
+            import numpy as np
+            import torch
+            def evaluate(model, loader):
+                scores = []
+                for inputs, targets in loader:
+                    scores.append(model(inputs).argmax(1).eq(targets).float().mean().item())  #@
+                return scores
+            def train(optimizer, batches):
+                for batch in batches:
+                    optimizer.step()
+                    weights = np.ones(3).tolist()  #@
+            """
+        )
+
+        with self.assertNoMessages():
+            self.checker.visit_call(nodes[0].args[0])
+            self.checker.visit_call(nodes[1].value)
@@ -0,0 +1,137 @@
+import astroid
+import pylint.testutils
+from pylint.interfaces import HIGH
+
+from pylint_ml.checkers.torch.torch_no_grad import TorchNoGradChecker
+
+
+class TestTorchNoGradChecker(pylint.testutils.CheckerTestCase):
+    CHECKER_CLASS = TorchNoGradChecker
+
+    def test_evaluation_without_no_grad(self):
+        eval_call, forward = astroid.extract_node(
+            """
+            import torch
+            def evaluate(model, loader):
+                model.eval()  #@
+                correct = 0
+                for inputs, targets in loader:
+                    outputs = model(inputs)  #@
+                    correct += (outputs.argmax(1) == targets).sum()
+                return correct
+            """
+        )
+
+        with self.assertAddsMessages(
+            pylint.testutils.MessageTest(
+                msg_id="torch-eval-without-no-grad",
+                confidence=HIGH,
+                node=eval_call,
+                args=("model.eval()",),
+            ),
+            pylint.testutils.MessageTest(
+                msg_id="torch-missing-no-grad",
+                confidence=HIGH,
+                node=forward.value,
+                args=("model(inputs)", "'evaluate'"),
+            ),
+            ignore_position=True,
+        ):
+            self.checker.visit_call(eval_call)
+            self.checker.visit_call(forward.value)
+
+    def test_inference_loop_at_module_level(self):
+        node = astroid.extract_node(
+            """
+            import torch
+            from torch import nn
+            net = nn.Sequential(nn.Linear(8, 2)).to("cuda").eval()
+            criterion = nn.CrossEntropyLoss()
+            for batch, labels in batches:
+                loss = criterion(net(batch), labels)  #@
+            """
+        )
+        forward = node.value.args[0]
+
+        with self.assertAddsMessages(
+            pylint.testutils.MessageTest(
+                msg_id="torch-missing-no-grad",
+                confidence=HIGH,
+                node=forward,
+                args=("net(batch)", "the loop at line 6"),
+            ),
+            ignore_position=True,
+        ):
+            self.checker.visit_call(node.value)
+            self.checker.visit_call(forward)
+
+    def test_no_grad_contexts(self):
+        nodes = astroid.extract_node(
+            """
+            import torch
+            from torch import inference_mode, no_grad
+            def validate(model, loader):
+                model.eval()  #@
+                with torch.no_grad():
+                    return [model(inputs) for inputs in loader]  #@
+            @inference_mode()
+            def predict(model, inputs):
+                model.eval()  #@
+                preds = model(inputs)  #@
+                print(preds)
+            @no_grad
+            def embed(encoder: torch.nn.Module, batch):
+                features = encoder(batch)  #@
+                print(features)
+            def score(model, batch):
+                with torch.set_grad_enabled(False):
+                    logits = model(batch)  #@
+                print(logits)
+            """
+        )
+
+        with self.assertNoMessages():
+            self.checker.visit_call(nodes[0])
+            self.checker.visit_call(nodes[1].value.elt)
+            self.checker.visit_call(nodes[2])
+            self.checker.visit_call(nodes[3].value)
+            self.checker.visit_call(nodes[4].value)
+            self.checker.visit_call(nodes[5].value)
+
+    def test_training_and_returned_outputs(self):
+        nodes = astroid.extract_node(
+            """
+            import torch
+            def train(model, loader, optimizer, loss_fn):
+                for inputs, targets in loader:
+                    loss = loss_fn(model(inputs), targets)  #@
+                    loss.backward()
+                    optimizer.step()
+            def run(model, inputs):
+                outputs = model(inputs)  #@
+                return outputs
+            class Net(torch.nn.Module):
+                def forward(self, x):
+                    return self.model(x)  #@
+            def describe(stats, batch):
+                summary = stats(batch)  #@
+                print(summary)
+            def compute_loss(model, criterion, x, y):
+                out = model(x)  #@
+                loss = criterion(out, y)
+                return loss
+            def collect(model, loader):
+                outputs = []
+                for batch in loader:
+                    outputs.append(model(batch))  #@
+                return torch.cat(outputs)
+            """
+        )
+
+        with self.assertNoMessages():
+            self.checker.visit_call(nodes[0].value.args[0])
+            self.checker.visit_call(nodes[1].value)
+            self.checker.visit_call(nodes[2].value)
+            self.checker.visit_call(nodes[3].value)
+            self.checker.visit_call(nodes[4].value)
+            self.checker.visit_call(nodes[5].args[0])
@@ -0,0 +1,11 @@
+import numpy as np
+import pandas as pd
+
+
+def summarise(matrix, frame):
+    product = np.dot(matrix, matrix)
+    if frame == np.nan:
+        return None
+    for _, row in frame.iterrows():
+        product += row.values
+    return product
@@ -0,0 +1,6 @@
+import json
+from collections import OrderedDict
+
+
+def tidy(record):
+    return OrderedDict(sorted(json.loads(record).items()))
@@ -0,0 +1,6 @@
+from .helpers import tidy
+
+
+def clean(records):
+    series_names = [tidy(record) for record in records]
+    return series_names.values
@@ -0,0 +1,7 @@
+from .compat import np, pd
+
+
+def summarise(matrix):
+    df = pd.DataFrame(matrix)
+    df.fillna(0, inplace=True)
+    return np.dot(matrix, matrix), df
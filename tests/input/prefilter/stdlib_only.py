@@ -0,0 +1,10 @@
+import json
+from os import path
+
+
+def load(name):
+    with open(path.join("data", name), encoding="utf-8") as stream:
+        data = json.load(stream)
+    df_records = data["records"]
+    model.fit(epochs=10)
+    return df_records.values, np.nan == data
@@ -0,0 +1,6 @@
+from missing_package import make_frame
+
+
+def load():
+    df = make_frame()
+    return df.values
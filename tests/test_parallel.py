@@ -0,0 +1,58 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from benchmarks.corpus import write_corpus
+from pylint_ml.util.manifest import load_manifest
+
+ROOT = Path(__file__).parent.parent
+
+# Re-exports a library from a project module, so the import table of other modules depends on it
+COMPAT = "import numpy as np\nimport pandas as pd\n"
+USES_COMPAT = """
+from compat import np, pd
+
+df_sales = pd.read_csv("sales.csv")
+for _, row in df_sales.iterrows():
+    print(np.dot(row, row))
+"""
+
+
+def lint(directory, jobs):
+    symbols = [msg[1] for entry in load_manifest() for msg in entry.msgs.values()]
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "pylint",
+            "--load-plugins=pylint_ml",
+            "--persistent=n",
+            "--disable=all",
+            f"--enable={','.join(symbols)}",
+            "--score=n",
+            f"--jobs={jobs}",
+            *sorted(str(path) for path in directory.glob("*.py")),
+        ],
+        capture_output=True,
+        check=False,
+        cwd=directory,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join((str(ROOT), str(directory)))},
+        text=True,
+    )
+    assert not result.stderr
+    return result.stdout.splitlines()
+
+
+@pytest.mark.parametrize("jobs", [2, 8])
+def test_parallel_output_matches_serial_output(tmp_path, jobs):
+    write_corpus(tmp_path, files=12, functions=6, seed=3)
+    (tmp_path / "compat.py").write_text(COMPAT, encoding="utf-8")
+    (tmp_path / "uses_compat.py").write_text(USES_COMPAT, encoding="utf-8")
+
+    serial = lint(tmp_path, 1)
+
+    assert any("pandas-iterrows" in line for line in serial)
+    assert lint(tmp_path, jobs) == serial
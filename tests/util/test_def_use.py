@@ -0,0 +1,81 @@
+import astroid
+
+from pylint_ml.util.def_use import ESCAPED, MUTATED, READ, assigned_names, use_kind, uses
+from pylint_ml.util.import_table import ImportTable
+
+
+def test_uses_reached_by_a_binding():
+    module = astroid.parse(
+        """
+        import pandas as pd
+        frame = pd.read_csv("orders.csv")
+        print(frame)
+        def total():
+            return frame["price"].sum()
+        frame = frame.dropna()
+        frame.head()
+        """
+    )
+    first, second = module.locals["frame"]
+
+    # Functions defined in the scope see its last binding
+    assert [use.lineno for use in uses(first)] == [4, 7]
+    assert [use.lineno for use in uses(second)] == [6, 8]
+
+
+def test_use_kinds():
+    module = astroid.parse(
+        """
+        import numpy as np
+        import pandas as pd
+        frame = pd.read_csv("orders.csv")
+        frame["total"] = frame["price"] * 2
+        frame.loc[0, "total"] += 1
+        del frame["price"]
+        frame.fillna(0, inplace=True)
+        frame.index = range(3)
+        frame.describe()
+        np.log(frame)
+        pd.concat([frame, frame])
+        print(len(frame))
+        store(frame)
+        cached = frame
+        """
+    )
+    imports = ImportTable.from_module(module)
+    kinds = [(use.lineno, use_kind(use, imports)) for use in uses(module.locals["frame"][0])]
+
+    assert kinds == [
+        (5, MUTATED),
+        (5, READ),
+        (6, MUTATED),
+        (7, MUTATED),
+        (8, MUTATED),
+        (9, MUTATED),
+        (10, READ),
+        (11, READ),
+        (12, READ),
+        (12, READ),
+        (13, READ),
+        (14, ESCAPED),
+        (15, ESCAPED),
+    ]
+
+
+def test_assigned_names():
+    loop = astroid.extract_node(
+        """
+        import torch
+        for step, batch in enumerate(loader):  #@
+            inputs = batch.to(device)
+            self.total += 1
+            mask.fill_(0)
+            weights[step] = 1.0
+            scale.mean()
+            def callback(value):
+                seen = value
+        """
+    )
+    imports = ImportTable.from_module(loop.root())
+
+    assert assigned_names(loop, imports) == {"step", "batch", "inputs", "self.total", "mask", "weights"}
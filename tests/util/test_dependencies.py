@@ -0,0 +1,40 @@
+from pylint_ml.util.dependencies import ModuleDigests, project_imports
+
+SOURCE = b"""
+import os
+import helpers, shop.io as io
+import pandas as pd
+from . import models
+from .features import build, scale
+from numpy import linalg
+
+def load():
+    from shop.cache import lookup
+    return lookup()
+"""
+
+
+def test_project_imports():
+    assert project_imports(SOURCE, "shop.train", False) == (
+        "helpers",
+        "shop.io",
+        "shop",
+        "shop.models",
+        "shop.features",
+        "shop.features.build",
+        "shop.features.scale",
+        "shop.cache",
+        "shop.cache.lookup",
+    )
+
+
+def test_digest_follows_plain_imports(tmp_path, monkeypatch):
+    (tmp_path / "entry_mod.py").write_text("import middle_mod\n")
+    (tmp_path / "middle_mod.py").write_text("def load():\n    import leaf_mod\n    return leaf_mod.read()\n")
+    (tmp_path / "leaf_mod.py").write_text("def read():\n    return 1\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    before = ModuleDigests().digest(["entry_mod"])
+
+    (tmp_path / "leaf_mod.py").write_text("def read():\n    return 2\n")
+
+    assert ModuleDigests().digest(["entry_mod"]) != before
@@ -0,0 +1,143 @@
+from argparse import Namespace
+
+import astroid
+import pytest
+from astroid import MANAGER
+
+from pylint_ml.util.function_summaries import SummaryIndex, summary_directory
+from pylint_ml.util.import_table import ImportTable
+from pylint_ml.util.type_inference import DATAFRAME, NDARRAY, FunctionSummary, TypeInference
+
+HELPERS = """
+import pandas as pd
+
+def load_events(path):
+    if path.endswith(".csv"):
+        return pd.read_csv(path)
+    return pd.read_parquet(path)
+
+def clean(frame, columns=None):
+    frame = frame.dropna()
+    return frame.copy()
+
+def describe(frame):
+    return str(frame)
+"""
+
+
+@pytest.fixture(name="project")
+def fixture_project(tmp_path, monkeypatch):
+    (tmp_path / "shop").mkdir()
+    (tmp_path / "shop" / "__init__.py").write_text("")
+    (tmp_path / "shop" / "helpers.py").write_text(HELPERS)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield tmp_path / "shop" / "helpers.py"
+    # Also forgets where ``shop`` was found
+    MANAGER.clear_cache()
+
+
+def test_functions_of_the_module():
+    nodes = astroid.extract_node(
+        """
+        import numpy as np
+        import pandas as pd
+        def load():
+            return pd.read_csv("orders.csv")
+        def normalized(values):
+            values = values.clip(0, None) * 2
+            return 1 - values
+        def total(values):
+            return values.sum()
+        load()  #@
+        normalized(np.ones(3))  #@
+        normalized(values=load())  #@
+        total(load())  #@
+        """
+    )
+    types = TypeInference(nodes[0].root(), ImportTable.from_module(nodes[0].root()))
+
+    assert [types.type_of(node) for node in nodes] == [DATAFRAME, NDARRAY, DATAFRAME, None]
+
+
+def test_summaries_of_an_imported_module(project):
+    index = SummaryIndex(None)
+
+    assert index.module("shop.helpers") == {
+        "load_events": FunctionSummary(DATAFRAME, (), ("path",)),
+        "clean": FunctionSummary(None, ("frame",), ("frame", "columns")),
+        "describe": FunctionSummary(None, (), ("frame",)),
+    }
+
+    nodes = astroid.extract_node(
+        """
+        from shop import helpers
+        from shop.helpers import clean
+        events = helpers.load_events("events.csv")
+        events  #@
+        clean(events)  #@
+        helpers.describe(events)  #@
+        """
+    )
+    module = nodes[0].root()
+    types = TypeInference(module, ImportTable.from_module(module), index.function)
+
+    assert [types.type_of(node) for node in nodes] == [DATAFRAME, DATAFRAME, None]
+
+
+def test_index_is_reused_across_processes(project, tmp_path, monkeypatch):
+    summaries = SummaryIndex(tmp_path / "summaries").module("shop.helpers")
+    assert len(list((tmp_path / "summaries").iterdir())) == 1
+
+    def parse(modname):
+        raise AssertionError(f"{modname} was parsed again")
+
+    monkeypatch.setattr(MANAGER, "ast_from_module_name", parse)
+    assert SummaryIndex(tmp_path / "summaries").module("shop.helpers") == summaries
+
+
+def test_changed_module_is_summarized_again(project, tmp_path):
+    SummaryIndex(tmp_path / "summaries").module("shop.helpers")
+    project.write_text(HELPERS.replace("pd.read_parquet(path)", "path"))
+    MANAGER.astroid_cache.pop("shop.helpers", None)
+
+    summaries = SummaryIndex(tmp_path / "summaries").module("shop.helpers")
+
+    assert summaries["load_events"] == FunctionSummary(None, (), ("path",))
+    assert len(list((tmp_path / "summaries").iterdir())) == 2
+
+
+def test_change_down_the_import_chain(project, tmp_path):
+    package = project.parent
+    (package / "a_mod.py").write_text("from shop.b_mod import load\ndef fetch():\n    return load()\n")
+    (package / "b_mod.py").write_text("from shop.c_mod import read\ndef load():\n    return read()\n")
+    (package / "c_mod.py").write_text("import pandas as pd\ndef read():\n    return pd.read_csv('x.csv')\n")
+    assert SummaryIndex(tmp_path / "summaries").module("shop.a_mod")["fetch"].returns == DATAFRAME
+
+    (package / "c_mod.py").write_text("def read():\n    return []\n")
+    for modname in ("shop.a_mod", "shop.b_mod", "shop.c_mod"):
+        MANAGER.astroid_cache.pop(modname, None)
+
+    assert SummaryIndex(tmp_path / "summaries").module("shop.a_mod")["fetch"].returns is None
+
+
+def test_change_down_a_chain_of_plain_imports(project, tmp_path):
+    package = project.parent
+    (package / "d_mod.py").write_text("from shop import e_mod\ndef fetch():\n    return e_mod.load()\n")
+    (package / "e_mod.py").write_text("import shop.f_mod\ndef load():\n    return shop.f_mod.read()\n")
+    (package / "f_mod.py").write_text("import pandas as pd\ndef read():\n    return pd.read_csv('x.csv')\n")
+    assert SummaryIndex(tmp_path / "summaries").module("shop.d_mod")["fetch"].returns == DATAFRAME
+
+    (package / "f_mod.py").write_text("def read():\n    return []\n")
+    for modname in ("shop.d_mod", "shop.e_mod", "shop.f_mod"):
+        MANAGER.astroid_cache.pop(modname, None)
+
+    assert SummaryIndex(tmp_path / "summaries").module("shop.d_mod")["fetch"].returns is None
+
+
+def test_summary_directory(tmp_path):
+    cache_dir = str(tmp_path / "cache")
+
+    assert summary_directory(Namespace(ml_cache_dir=cache_dir, persistent=True)) == tmp_path / "cache" / "summaries"
+    assert summary_directory(Namespace(ml_cache_dir=cache_dir, persistent=False)) is None
+    assert summary_directory(Namespace(ml_cache_dir="", persistent=True)) is None
+    assert summary_directory(Namespace()) is None
@@ -0,0 +1,111 @@
+import astroid
+
+from pylint_ml.util.call_name import get_call_name
+from pylint_ml.util.import_table import ImportTable
+
+
+def test_bindings_of_module_imports():
+    module = astroid.parse(
+        """
+        import numpy as npy
+        import torch.nn
+        import scipy.spatial.distance as dist
+        from sklearn.ensemble import RandomForestClassifier as RFC
+        from . import helpers
+        """
+    )
+    table = ImportTable.from_module(module)
+
+    assert table.qualified_name("npy") == "numpy"
+    assert table.qualified_name("torch") == "torch"
+    assert table.qualified_name("dist") == "scipy.spatial.distance"
+    assert table.library_of("RFC") == "sklearn"
+    assert table.qualified_name("helpers") is None
+    assert table.is_library_imported("sklearn")
+    assert not table.is_library_imported("pandas")
+
+
+def test_imports_in_nested_scopes():
+    module = astroid.parse(
+        """
+        def train():
+            import torch
+
+        class Report:
+            def plot(self):
+                from matplotlib import pyplot as plt
+        """
+    )
+    table = ImportTable.from_module(module)
+
+    assert table.is_library_imported("torch")
+    assert table.qualified_name("plt") == "matplotlib.pyplot"
+
+
+def test_reexported_library(tmp_path, monkeypatch):
+    package = tmp_path / "reexport_pkg"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "compat.py").write_text("import pandas as pd\nfrom .frames import DataFrame\n")
+    (package / "frames.py").write_text("from pandas import DataFrame\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    module = astroid.parse("from reexport_pkg.compat import pd, DataFrame", module_name="app")
+    table = ImportTable.from_module(module)
+
+    assert table.is_library_imported("pandas")
+    assert table.qualified_name("pd") == "pandas"
+    assert table.qualified_name("DataFrame") == "pandas.DataFrame"
+
+
+def test_unresolvable_import_is_not_a_library():
+    table = ImportTable.from_module(astroid.parse("from not_a_real_package import pd"))
+
+    assert not table.is_library_imported("pandas")
+    assert table.qualified_name("pd") == "not_a_real_package.pd"
+
+
+def test_conventional_alias_only_for_unbound_names():
+    table = ImportTable.from_module(astroid.parse("import mylib as np"))
+
+    assert table.qualified_name("np") == "mylib"
+    assert table.qualified_name("pd") == "pandas"
+
+
+def test_conventional_alias_not_for_assigned_names():
+    call = astroid.extract_node(
+        """
+        np = NumberParser()
+        def convert(pd):
+            return pd.parse("1")
+        np.dot(a, b)  #@
+        """
+    )
+    table = ImportTable.from_module(call.root())
+
+    assert table.qualify(get_call_name(call)) is None
+    assert table.qualified_name("pd") is None
+    assert table.qualified_name("tf") == "tensorflow"
+
+
+def test_qualify_call():
+    call = astroid.extract_node(
+        """
+        import numpy as xp
+        xp.random.rand(3)  #@
+        """
+    )
+    table = ImportTable.from_module(call.root())
+
+    assert table.qualify(get_call_name(call)) == "numpy.random.rand"
+
+
+def test_shared_table_is_released():
+    module = astroid.parse("import pandas as pd")
+    table = ImportTable.for_module(module)
+
+    assert ImportTable.for_module(module) is table
+
+    ImportTable.release(module)
+
+    assert ImportTable.for_module(module) is not table
+    ImportTable.release(module)
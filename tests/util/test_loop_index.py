@@ -0,0 +1,111 @@
+import astroid
+from astroid import nodes
+
+from pylint_ml.util.loop_index import LoopIndex
+
+
+def test_nested_loops():
+    module = astroid.parse(
+        """
+        setup()
+        for path in paths:
+            load(path)
+            while pending:
+                step()
+        else:
+            done()
+        """
+    )
+    index = LoopIndex(module)
+    setup, load, step, done = module.nodes_of_class(nodes.Call)
+
+    assert index.depth(setup) == 0
+    assert index.context(setup) is None
+    assert index.depth(load) == 1
+    assert index.loop_variables(load) == {"path"}
+    assert index.depth(step) == 2
+    assert index.loop_variables(step) == frozenset()
+    assert [context.variables for context in index.context(step).enclosing_loops()] == [frozenset(), {"path"}]
+    assert index.depth(done) == 0
+
+
+def test_iterable_runs_once():
+    module = astroid.parse(
+        """
+        for i, (key, value) in enumerate(items()):
+            pass
+        while more():
+            pass
+        """
+    )
+    index = LoopIndex(module)
+    enumerate_call, items_call, more_call = module.nodes_of_class(nodes.Call)
+
+    assert index.depth(enumerate_call) == 0
+    assert index.depth(items_call) == 0
+    assert index.depth(more_call) == 1
+    assert index.context(more_call).loop is module.body[1]
+    assert index.loop_variables(module.body[0].target) == {"i", "key", "value"}
+
+
+def test_comprehensions():
+    module = astroid.parse(
+        """
+        [scale(x) for row in rows() for x in row if keep(x)]
+        """
+    )
+    index = LoopIndex(module)
+    scale, rows, keep = module.nodes_of_class(nodes.Call)
+
+    assert index.depth(rows) == 0
+    assert index.depth(scale) == 2
+    assert index.loop_variables(scale) == {"x"}
+    assert index.depth(keep) == 2
+
+
+def test_function_bodies_start_at_depth_zero():
+    module = astroid.parse(
+        """
+        for size in sizes:
+            @register(size)
+            def build(value=default()):
+                return make(value)
+            callbacks.append(lambda: make(size))
+        """
+    )
+    index = LoopIndex(module)
+    register, default, make, append, lambda_make = module.nodes_of_class(nodes.Call)
+
+    assert index.depth(register) == 1
+    assert index.depth(default) == 1
+    assert index.depth(make) == 0
+    assert index.depth(append) == 1
+    assert index.depth(lambda_make) == 0
+
+
+def test_shared_index_is_released():
+    module = astroid.parse("for x in y:\n    pass\n")
+
+    index = LoopIndex.for_module(module)
+    assert LoopIndex.for_module(module) is index
+    LoopIndex.release(module)
+    assert LoopIndex.for_module(module) is not index
+
+
+def test_accumulation():
+    module = astroid.parse(
+        """
+        rows = combine(rows, first)
+        for part in parts:
+            rows = combine(rows, part)
+            part = combine(part, rows)
+            other = combine(rows, part)
+        """
+    )
+    index = LoopIndex(module)
+    outside, grown, loop_variable, other = module.nodes_of_class(nodes.Call)
+
+    assert index.accumulation(outside, {"rows", "first"}) is None
+    assert index.accumulation(grown, {"rows", "part"}) == ("rows", index.context(grown))
+    assert index.accumulation(loop_variable, {"part", "rows"}) is None
+    assert index.accumulation(other, {"rows", "part"}) is None
@@ -0,0 +1,73 @@
+import subprocess
+import sys
+
+from pylint.lint import PyLinter
+from pylint.reporters import CollectingReporter
+
+from pylint_ml import plugin
+from pylint_ml.util.lazy_checker import LazyChecker
+from pylint_ml.util.manifest import CHECKERS, build_manifest, load_manifest
+
+LINT_WITH_ENABLED = """
+import sys
+from pylint.lint import PyLinter
+from pylint_ml import register
+
+linter = PyLinter()
+register(linter)
+linter.disable("all")
+linter.enable(sys.argv[1])
+linter.check([sys.argv[2]])
+print(sorted(
+    name for name, module in sys.modules.items()
+    if name.startswith("pylint_ml.checkers.") and not hasattr(module, "__path__")
+))
+"""
+
+
+def test_manifest_is_up_to_date():
+    # Run ``python -m pylint_ml.util.manifest`` when this fails
+    assert load_manifest() == build_manifest()
+
+
+def test_every_library_checker_is_registered():
+    linter = PyLinter(reporter=CollectingReporter())
+    plugin.register(linter)
+
+    lazy_checkers = [checker for checker in linter.get_checkers() if isinstance(checker, LazyChecker)]
+    assert sorted(checker.checker_path for checker in lazy_checkers) == sorted(CHECKERS)
+    assert linter.msgs_store.get_message_definitions("pandas-iterrows")[0].msgid == "W8106"
+
+
+def test_only_checkers_with_enabled_messages_are_imported(tmp_path):
+    path = tmp_path / "module.py"
+    path.write_text("import pandas as pd\ndf_rows = pd.DataFrame({'a': [1]}).iterrows()\n", encoding="utf-8")
+
+    output = subprocess.run(
+        [sys.executable, "-c", LINT_WITH_ENABLED, "pandas-iterrows", str(path)],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+
+    assert eval(output.splitlines()[-1]) == [  # pylint: disable=eval-used
+        "pylint_ml.checkers.pandas.pandas_dataframe_iterrows",
+        "pylint_ml.checkers.profiler",
+        "pylint_ml.checkers.result_cache",
+    ]
+
+
+def test_lazy_checker_reports_messages(tmp_path):
+    path = tmp_path / "module.py"
+    path.write_text(
+        "import pandas as pd\ndf_sales = pd.read_csv('x')\nfor row in df_sales.iterrows():\n    pass\n",
+        encoding="utf-8",
+    )
+    linter = PyLinter(reporter=CollectingReporter())
+    plugin.register(linter)
+    linter.disable("all")
+    linter.enable("pandas-iterrows")
+
+    linter.check([str(path)])
+
+    assert [message.symbol for message in linter.reporter.messages] == ["pandas-iterrows"]
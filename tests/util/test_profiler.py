@@ -0,0 +1,99 @@
+import io
+import json
+
+import pytest
+from pylint.lint import PyLinter
+from pylint.reporters import CollectingReporter
+
+from pylint_ml import plugin
+from pylint_ml.util.profiler import MethodStats, Profiler, merge, write_report
+
+SOURCE = """
+import numpy as np
+import pandas as pd
+
+a = np.dot(b=[1])
+frame = pd.DataFrame()
+total = sum([1, 2])
+"""
+
+
+@pytest.fixture(name="module_path")
+def module_path_fixture(tmp_path):
+    path = tmp_path / "profiled.py"
+    path.write_text(SOURCE, encoding="utf-8")
+    return path
+
+
+def lint(path, enable="ml-parameter", **options):
+    linter = PyLinter(reporter=CollectingReporter())
+    plugin.register(linter)
+    linter.disable("all")
+    linter.enable(enable)
+    for name, value in options.items():
+        setattr(linter.config, name, value)
+    linter.check([str(path)])
+    return linter
+
+
+def test_profile_counts_calls_matches_and_messages(module_path, tmp_path):
+    output = tmp_path / "profile.json"
+
+    linter = lint(module_path, ml_profile=True, ml_profile_output=str(output))
+
+    rows = {(row["checker"], row["method"]): row for row in json.loads(output.read_text(encoding="utf-8"))}
+    visit_call = rows["ml-parameter", "visit_call"]
+    # ``sum`` is not matched by any rule, ``np.dot`` and ``pd.DataFrame`` are
+    assert (visit_call["calls"], visit_call["matched"], visit_call["messages"]) == (3, 2, 2)
+    assert visit_call["seconds"] >= 0
+    assert rows["ml-parameter", "visit_module"]["calls"] == 1
+    assert len(linter.reporter.messages) == 2
+    assert Profiler.active is None
+
+
+def test_match_without_message_is_counted(tmp_path):
+    path = tmp_path / "loader.py"
+    path.write_text(
+        "from torch.utils.data import DataLoader\n\n"
+        "loader = DataLoader(dataset, batch_size=64, num_workers=4)\n"
+        "print(len(dataset))\n",
+        encoding="utf-8",
+    )
+    output = tmp_path / "profile.json"
+
+    linter = lint(path, enable="torch-dataloader-throughput", ml_profile=True, ml_profile_output=str(output))
+
+    rows = {(row["checker"], row["method"]): row for row in json.loads(output.read_text(encoding="utf-8"))}
+    visit_call = rows["torch-dataloader", "visit_call"]
+    # The ``DataLoader`` call is matched and passes every rule, ``print`` and ``len`` are not matched
+    assert (visit_call["calls"], visit_call["matched"], visit_call["messages"]) == (3, 1, 0)
+    assert not linter.reporter.messages
+
+
+def test_profile_is_printed_without_output_file(module_path, capsys):
+    lint(module_path, ml_profile=True)
+
+    table = capsys.readouterr().err.splitlines()
+    assert table[0].startswith("pylint-ml checker")
+    assert any(line.startswith("ml-parameter.visit_call ") for line in table[1:])
+
+
+def test_checkers_are_not_instrumented_by_default(module_path, capsys):
+    linter = lint(module_path)
+
+    for checker in linter.get_checkers():
+        assert "visit_module" not in vars(checker)
+    assert Profiler.active is None
+    assert not capsys.readouterr().err
+
+
+def test_merge_and_sort():
+    first = {("numpy-import", "visit_import"): (2, 0.5, 1, 1), ("ml-parameter", "visit_call"): (4, 1.0, 2, 0)}
+    second = {("ml-parameter", "visit_call"): (6, 2.0, 3, 3)}
+    stream = io.StringIO()
+
+    merged = merge([first, second])
+    write_report(merged, stream, as_json=True)
+
+    assert merged["ml-parameter", "visit_call"].as_tuple() == MethodStats(10, 3.0, 5, 3).as_tuple()
+    assert [row["method"] for row in json.loads(stream.getvalue())] == ["visit_call", "visit_import"]
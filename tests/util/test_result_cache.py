@@ -0,0 +1,68 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from pylint_ml.util.result_cache import CachedMessage, ResultCache
+
+MESSAGE = CachedMessage("numpy-parameter", 3, 4, 3, 20, ("a, b", "dot"), "HIGH", ("Model", "run"))
+
+
+def test_roundtrip(tmp_path):
+    cache = ResultCache(tmp_path / "cache", max_entries=10)
+    cache.put("key", [MESSAGE, MESSAGE._replace(args=None, confidence=None, frame=None)])
+
+    assert cache.get("key") == [MESSAGE, MESSAGE._replace(args=None, confidence=None, frame=None)]
+    assert cache.get("other") is None
+
+
+def test_unreadable_entry_is_a_miss(tmp_path):
+    cache = ResultCache(tmp_path, max_entries=10)
+    (tmp_path / "key.json").write_text('[["numpy-parameter", 3', encoding="utf-8")
+
+    assert cache.get("key") is None
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = ResultCache(tmp_path, max_entries=2)
+    for index, key in enumerate(("first", "second", "third")):
+        cache.put(key, [])
+        os.utime(tmp_path / f"{key}.json", ns=(index * 10**9, index * 10**9))
+    # Reading an entry makes it the most recently used one
+    assert cache.get("first") == []
+
+    cache.evict()
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["first.json", "third.json"]
+
+
+def test_stale_temporary_files_are_removed(tmp_path):
+    cache = ResultCache(tmp_path, max_entries=2)
+    stale = tmp_path / ".tmp-crashed.json"
+    stale.write_text("[", encoding="utf-8")
+    os.utime(stale, ns=(0, 0))
+    fresh = tmp_path / ".tmp-writing.json"
+    fresh.write_text("[", encoding="utf-8")
+
+    cache.evict()
+
+    assert not stale.exists()
+    assert fresh.exists()
+
+
+def fill_cache(directory, worker):
+    cache = ResultCache(directory, max_entries=20)
+    for index in range(60):
+        # Workers write the same keys as well as their own
+        cache.put(f"shared-{index % 10}", [MESSAGE])
+        cache.put(f"worker-{worker}-{index}", [MESSAGE])
+        assert cache.get(f"shared-{index % 10}") in (None, [MESSAGE])
+    cache.evict()
+
+
+def test_concurrent_workers(tmp_path):
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        list(executor.map(fill_cache, [tmp_path] * 4, range(4)))
+
+    entries = list(tmp_path.iterdir())
+    assert 0 < len(entries) <= 20
+    cache = ResultCache(tmp_path, max_entries=20)
+    assert all(cache.get(entry.stem) == [MESSAGE] for entry in entries)
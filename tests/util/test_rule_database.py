@@ -0,0 +1,109 @@
+import json
+
+import astroid
+import pytest
+
+from pylint_ml.util import rule_database
+from pylint_ml.util.call_name import get_call_name
+from pylint_ml.util.import_table import ImportTable
+from pylint_ml.util.rule_database import RuleDatabase, load, parse_specifiers, parse_version
+
+RULES = {
+    "version": 1,
+    "rules": [
+        {"name": "numpy.reshape", "params": ["newshape"], "versions": "<2.1"},
+        {"name": "numpy.reshape", "params": ["shape"], "versions": ">=2.1"},
+        {
+            "name": "tensorflow.keras.Sequential",
+            "aliases": ["tensorflow.keras.models.Sequential"],
+            "params": ["layers"],
+        },
+        {"name": "tensorflow.keras.Model.fit", "method": True, "params": ["x", "y"]},
+        {"name": "sklearn.base.BaseEstimator.fit", "method": True, "params": ["X", "y"]},
+        {"name": "pandas.DataFrame.fillna", "method": True, "params": ["value"]},
+        {"name": "pandas.Series.fillna", "method": True, "params": ["value", "axis"]},
+        {"name": "scipy.spatial.KDTree.query", "method": True, "by_method_name": False, "params": ["x"]},
+    ],
+}
+
+
+def call_and_imports(code):
+    node = astroid.extract_node(code)
+    return get_call_name(node), ImportTable.for_module(node.root())
+
+
+def match(database, code):
+    return [rule.name for rule in database.match(*call_and_imports(code))]
+
+
+def test_functions_are_matched_by_qualified_name():
+    database = RuleDatabase.compile(RULES)
+
+    assert match(database, "import tensorflow as tf\ntf.keras.models.Sequential()") == ["tensorflow.keras.Sequential"]
+    assert match(database, "from tensorflow.keras import Sequential\nSequential()") == ["tensorflow.keras.Sequential"]
+    # A function of the library without a rule does not fall back to the method rules
+    assert match(database, "import tensorflow as tf\ntf.fit()") == []
+
+
+def test_methods_are_matched_by_name_for_one_imported_library():
+    database = RuleDatabase.compile(RULES)
+
+    assert match(database, "import tensorflow as tf\nmodel.fit()") == ["tensorflow.keras.Model.fit"]
+    assert match(database, "import tensorflow as tf\nimport sklearn\nmodel.fit()") == []
+    assert match(database, "import json\nmodel.fit()") == []
+    # The first method rule of a library with that name is the one matched
+    assert match(database, "import pandas as pd\nframe.fillna()") == ["pandas.DataFrame.fillna"]
+    assert match(database, "import scipy\ntree.query()") == []
+
+
+def test_version_ranges(monkeypatch):
+    database = RuleDatabase.compile(RULES)
+    call, imports = call_and_imports("import numpy as np\nnp.reshape()")
+
+    monkeypatch.setattr(rule_database, "installed_version", lambda library: (2, 0, 2))
+    assert [rule.params for rule in database.match(call, imports)] == [("newshape",)]
+    monkeypatch.setattr(rule_database, "installed_version", lambda library: (2, 1))
+    assert [rule.params for rule in database.match(call, imports)] == [("shape",)]
+    # Rules with a range do not apply when the version of the library is unknown
+    monkeypatch.setattr(rule_database, "installed_version", lambda library: None)
+    assert not database.match(call, imports)
+
+
+def test_parse_versions():
+    assert parse_version("2.1.0rc1") == parse_version("2.1") == (2, 1)
+    assert parse_specifiers(">=1.0, <2.1") == ((">=", (1,)), ("<", (2, 1)))
+    with pytest.raises(ValueError):
+        parse_specifiers("~=1.0")
+
+
+def test_unsupported_library_is_rejected():
+    with pytest.raises(ValueError):
+        RuleDatabase.compile({"version": 1, "rules": [{"name": "json.dumps", "params": ["obj"]}]})
+
+
+def test_compiled_database_is_cached(tmp_path, monkeypatch):
+    path = tmp_path / "rules.json"
+    path.write_text(json.dumps(RULES), encoding="utf-8")
+    cache_dir = tmp_path / "cache"
+    compiled = load(path, cache_dir)
+
+    monkeypatch.setattr(RuleDatabase, "compile", pytest.fail)
+    cached = load(path, cache_dir)
+
+    assert cached.by_name == compiled.by_name
+    assert cached.by_method_name == compiled.by_method_name
+    assert len(list(cache_dir.iterdir())) == 1
+
+
+def test_plugin_rules_compile(tmp_path):
+    database = load(rule_database.RULES_PATH, tmp_path)
+
+    assert database.tails["numpy"] >= {"dot", "rand"}
+
+
+def test_plugin_rules_skip_str_methods(tmp_path):
+    database = load(rule_database.RULES_PATH, tmp_path)
+
+    assert match(database, 'import pandas as pd\n", ".join(names)') == []
+    assert match(database, 'import pandas as pd\nname.replace("_", " ")') == []
+    assert match(database, 'import pandas as pd\nframe.fillna()') == ["pandas.DataFrame.fillna"]
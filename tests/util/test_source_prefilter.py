@@ -0,0 +1,83 @@
+import importlib
+import inspect
+import pkgutil
+from pathlib import Path
+
+import astroid
+import pytest
+from astroid import MANAGER
+from pylint.checkers import BaseChecker
+from pylint.lint import PyLinter
+from pylint.reporters import CollectingReporter
+
+import pylint_ml.checkers
+from pylint_ml.util import import_table
+from pylint_ml.util.parameter_checker import ParameterChecker
+from pylint_ml.util.source_prefilter import may_bind_supported_library
+
+CORPUS = Path(__file__).parent.parent / "input" / "prefilter"
+
+
+def corpus_module(name):
+    return MANAGER.ast_from_file(str(CORPUS / f"{name}.py"), f"tests.input.prefilter.{name}", source=True)
+
+
+def plugin_checkers():
+    """Every checker of the plugin; the ``*_parameter`` rule sets run through their dispatcher."""
+    checkers = set()
+    for module_info in pkgutil.walk_packages(pylint_ml.checkers.__path__, "pylint_ml.checkers."):
+        module = importlib.import_module(module_info.name)
+        for _, checker in inspect.getmembers(module, inspect.isclass):
+            if (
+                issubclass(checker, BaseChecker)
+                and checker.__module__ == module.__name__
+                and not issubclass(checker, ParameterChecker)
+            ):
+                checkers.add(checker)
+    return sorted(checkers, key=lambda checker: checker.name)
+
+
+def lint_corpus():
+    linter = PyLinter(reporter=CollectingReporter())
+    for checker in plugin_checkers():
+        linter.register_checker(checker(linter))
+    linter.check([str(CORPUS)])
+    messages = linter.reporter.messages
+    return sorted((message.module, message.line, message.column, message.symbol) for message in messages)
+
+
+@pytest.mark.parametrize(
+    "name, may_bind",
+    [
+        ("stdlib_only", False),
+        ("project_import", False),
+        ("helpers", False),
+        ("direct", True),
+        ("compat", True),
+        ("reexport", True),
+        ("mention", True),
+        ("unresolved", True),
+    ],
+)
+def test_corpus_prefilter_decision(name, may_bind):
+    assert may_bind_supported_library(corpus_module(name), import_table.MAX_REEXPORT_DEPTH) is may_bind
+
+
+def test_source_without_file():
+    assert not may_bind_supported_library(astroid.parse("import os\nfrom typing import Any"), 3)
+    assert may_bind_supported_library(astroid.parse("from torch import nn"), 3)
+    # A relative import of a module that has no package cannot be resolved, so it is not skipped
+    assert may_bind_supported_library(astroid.parse("from .compat import pd"), 3)
+
+
+def test_line_continuation_import():
+    assert may_bind_supported_library(astroid.parse("import os; from \\\n  missing_package import pd"), 3)
+
+
+def test_corpus_results_match_full_run(monkeypatch):
+    prefiltered = lint_corpus()
+    monkeypatch.setattr(import_table, "may_bind_supported_library", lambda module, depth: True)
+    full_run = lint_corpus()
+
+    assert {symbol for *_, symbol in full_run} >= {"numpy-dot-usage", "numpy-nan-compare", "pandas-inplace"}
+    assert prefiltered == full_run
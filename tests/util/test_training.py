@@ -0,0 +1,30 @@
+import astroid
+
+from pylint_ml.util.import_table import ImportTable
+from pylint_ml.util.training import TrainingLoops
+
+
+def test_training_steps():
+    module = astroid.parse(
+        """
+        import torch
+        sgd = torch.optim.SGD(params, lr=0.1)
+        for batch in batches:
+            sgd.step()
+        for batch in batches:
+            scaler.scale(loss).backward()
+        for batch in batches:
+            scaler.step(self.optimizer)
+        for state in states:
+            env.step(action)
+        def train():
+            for batch in batches:
+                def closure():
+                    loss.backward()
+        """
+    )
+    loops = [*module.nodes_of_class(astroid.nodes.For)]
+    training = TrainingLoops(ImportTable.from_module(module))
+
+    assert [training.trains(loop) for loop in loops] == [True, True, True, False, False]
+    assert training.losses(loops[1]) == set()
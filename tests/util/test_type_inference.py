@@ -0,0 +1,139 @@
+import astroid
+
+from pylint_ml.util.import_table import ImportTable
+from pylint_ml.util.type_inference import DATAFRAME, NDARRAY, SERIES, TF_TENSOR, TORCH_TENSOR, TypeInference
+
+
+def inference(node):
+    module = node.root()
+    return TypeInference(module, ImportTable.from_module(module))
+
+
+def test_seeded_by_constructors_and_io():
+    nodes = astroid.extract_node(
+        """
+        import numpy as np
+        import pandas as pd
+        import tensorflow as tf
+        from torch import tensor
+        sales = pd.read_csv("sales.csv")
+        sales  #@
+        np.zeros((3, 3))  #@
+        tensor([1, 2])  #@
+        tf.constant([1, 2])  #@
+        load_sales()  #@
+        """
+    )
+    types = inference(nodes[0])
+
+    assert [types.type_of(node) for node in nodes] == [DATAFRAME, NDARRAY, TORCH_TENSOR, TF_TENSOR, None]
+
+
+def test_methods_attributes_and_subscripts():
+    nodes = astroid.extract_node(
+        """
+        import pandas as pd
+        frame = pd.DataFrame({"price": [1.0]})
+        frame.dropna().head()  #@
+        frame["price"]  #@
+        frame[["price"]]  #@
+        frame["price"].to_numpy()  #@
+        frame.values.T  #@
+        frame.groupby("price")  #@
+        (frame * 2 + frame)  #@
+        """
+    )
+    types = inference(nodes[0])
+
+    assert [types.type_of(node) for node in nodes] == [DATAFRAME, SERIES, DATAFRAME, NDARRAY, NDARRAY, None, DATAFRAME]
+
+
+def test_assignments_must_agree():
+    nodes = astroid.extract_node(
+        """
+        import numpy as np
+        import pandas as pd
+        clean = pd.read_parquet("raw.parquet")
+        clean = clean.dropna()
+        clean  #@
+        data = pd.read_parquet("raw.parquet")
+        data = data.to_numpy()
+        data  #@
+        rows = np.ones(3)
+        rows += 1
+        rows  #@
+        """
+    )
+    types = inference(nodes[0])
+
+    assert [types.type_of(node) for node in nodes] == [DATAFRAME, None, NDARRAY]
+
+
+def test_annotations():
+    node = astroid.extract_node(
+        """
+        import numpy as np
+        from pandas import DataFrame
+        def train(features: DataFrame, *, weights: np.ndarray, labels):
+            features  #@
+            weights  #@
+            labels  #@
+        """
+    )
+    types = inference(node[0])
+
+    assert [types.type_of(name) for name in node] == [DATAFRAME, NDARRAY, None]
+
+
+def test_names_are_memoized_per_scope():
+    nodes = astroid.extract_node(
+        """
+        import pandas as pd
+        events = pd.read_json("events.json")
+        def count():
+            events = load()
+            events  #@
+        events  #@
+        """
+    )
+    types = inference(nodes[0])
+
+    assert [types.type_of(node) for node in nodes] == [None, DATAFRAME]
+    assert [key for key in types._names if key[1] == "events"] == [  # pylint: disable=protected-access
+        (nodes[0].scope(), "events"),
+        (nodes[0].root(), "events"),
+    ]
+
+
+def test_row_selections_keep_the_type():
+    nodes = astroid.extract_node(
+        """
+        import pandas as pd
+        frame = pd.read_csv("orders.csv")
+        frame = frame[frame["price"] > 0]
+        frame  #@
+        frame.loc[(frame["price"] > 10) & ~(frame["paid"] == 1)]  #@
+        frame["price"].iloc[:10]  #@
+        frame.loc[0]  #@
+        """
+    )
+    types = inference(nodes[0])
+
+    assert [types.type_of(node) for node in nodes] == [DATAFRAME, DATAFRAME, SERIES, None]
+
+
+def test_builtin_calls_have_no_summary():
+    nodes = astroid.extract_node(
+        """
+        import numpy as np
+        values = sorted([3, 1, 2])
+        for value in values:
+            print(value + 1)  #@
+        values  #@
+        """
+    )
+    types = inference(nodes[0])
+    builtin = nodes[1].lookup("sorted")[1][0]
+
+    assert [types.type_of(node) for node in nodes] == [None, None]
+    assert types.summarize(builtin) is None